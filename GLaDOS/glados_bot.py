@@ -2,6 +2,9 @@ import os
 import asyncio
 import re
 import logging
+import threading
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Optional, Dict, List
 
@@ -9,6 +12,7 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import psycopg2
+from psycopg2 import pool
 from psycopg2.extras import RealDictCursor
 from dotenv import load_dotenv
 
@@ -67,6 +71,8 @@ FLEX_GENERATOR_CHANNEL_ID = env_int("FLEX_GENERATOR_CHANNEL_ID")
 CUSTOM_GENERATOR_CHANNEL_ID = env_int("CUSTOM_GENERATOR_CHANNEL_ID")
 
 DATABASE_URL = os.getenv("DATABASE_URL", "").strip()
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "4"))
+DB_POOL_PING_AFTER = 30  # seconds idle before a pooled connection is pinged
 LFM_CHANNEL_ID = env_int("LFM_CHANNEL_ID")
 DASHBOARD_URL = os.getenv("DASHBOARD_URL", "https://glados.local/dashboard").strip()
 
@@ -417,12 +423,78 @@ def build_owner_panel_embed(owner: discord.Member) -> discord.Embed:
 class SharedDatabase:
     def __init__(self, database_url: str):
         self.database_url = database_url
+        self._pool: Optional[pool.ThreadedConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        self._returned_at: Dict[int, float] = {}
 
     def enabled(self) -> bool:
         return bool(self.database_url)
 
+    def _get_pool(self) -> pool.ThreadedConnectionPool:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = pool.ThreadedConnectionPool(1, DB_POOL_MAX, dsn=self.database_url, connect_timeout=10)
+                self._returned_at.clear()
+            return self._pool
+
+    def _reset_pool(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                try:
+                    self._pool.closeall()
+                except Exception:
+                    pass
+                self._pool = None
+
+    def _alive(self, conn) -> bool:
+        if conn.closed:
+            return False
+        idle_since = self._returned_at.pop(id(conn), None)
+        if idle_since is None or time.monotonic() - idle_since < DB_POOL_PING_AFTER:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            return False
+
+    @contextmanager
     def _connect(self):
-        return psycopg2.connect(self.database_url)
+        """Borrow a pooled connection; commits on success, rolls back on error, always returns it"""
+        db_pool = self._get_pool()
+        try:
+            conn = db_pool.getconn()
+            for _ in range(DB_POOL_MAX):
+                if self._alive(conn):
+                    break
+                db_pool.putconn(conn, close=True)
+                conn = db_pool.getconn()
+        except psycopg2.OperationalError:
+            # Server restarted or network dropped - start over with fresh connections
+            self._reset_pool()
+            db_pool = self._get_pool()
+            conn = db_pool.getconn()
+
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                try:
+                    conn.rollback()
+                except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                    pass
+            raise
+        finally:
+            if self._pool is not db_pool:
+                conn.close()
+            elif conn.closed:
+                db_pool.putconn(conn, close=True)
+            else:
+                db_pool.putconn(conn)
+                self._returned_at[id(conn)] = time.monotonic()
 
     def healthcheck(self) -> bool:
         if not self.enabled():
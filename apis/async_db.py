@@ -0,0 +1,93 @@
+"""
+Async access to the bots' psycopg2 databases
+AsyncDatabase wraps a sync database object (or module) and exposes the same methods as
+coroutines: every query runs on a small dedicated thread pool instead of the event loop,
+so a slow query no longer stalls the Discord gateway heartbeat or other guilds' events
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger('async_db')
+
+# Threads per database - keep at or below the psycopg2 pool's maxconn so a worker never waits on the pool
+DB_THREADS = int(os.getenv('DB_THREADS', '8'))
+
+# Calls slower than this are logged
+DB_SLOW_CALL_SECONDS = float(os.getenv('DB_SLOW_CALL_SECONDS', '1.0'))
+
+
+class AsyncDatabase:
+    """`await adb.get_user_by_discord_id(123)` runs db.get_user_by_discord_id(123) off the loop.
+
+    Methods keep their names, arguments and return values; non-callable
+    attributes are passed through unchanged. Sync callers can keep using the
+    wrapped object directly (adb.db).
+    """
+
+    def __init__(self, db: Any, max_workers: int = DB_THREADS, name: str = 'db'):
+        self.db = db
+        self.name = name
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix=f'{name}-db')
+        self._methods: Dict[str, Callable] = {}
+        self.stats = {
+            'calls': 0,
+            'errors': 0,
+            'in_flight': 0,
+            'max_in_flight': 0,
+            'total_seconds': 0.0,
+            'slow_calls': 0,
+        }
+
+    def __getattr__(self, name: str):
+        method = self._methods.get(name)
+        if method is not None:
+            return method
+        attr = getattr(self.db, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return await self.run(attr, *args, **kwargs)
+
+        self._methods[name] = call
+        return call
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """Run any blocking callable (e.g. a multi-query helper) on the database threads"""
+        stats = self.stats
+        stats['calls'] += 1
+        stats['in_flight'] += 1
+        stats['max_in_flight'] = max(stats['max_in_flight'], stats['in_flight'])
+        started = time.monotonic()
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        except Exception:
+            stats['errors'] += 1
+            raise
+        finally:
+            elapsed = time.monotonic() - started
+            stats['in_flight'] -= 1
+            stats['total_seconds'] += elapsed
+            if elapsed >= DB_SLOW_CALL_SECONDS:
+                stats['slow_calls'] += 1
+                logger.warning(f"🐢 Slow {self.name} query {getattr(func, '__name__', func)}: {elapsed:.2f}s")
+
+    def get_stats(self) -> Dict:
+        calls = self.stats['calls']
+        return {
+            **self.stats,
+            'total_seconds': round(self.stats['total_seconds'], 3),
+            'avg_ms': round(self.stats['total_seconds'] / calls * 1000, 2) if calls else 0.0,
+        }
+
+    def close(self):
+        """Stop the worker threads (queued calls still finish)"""
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,191 @@
+"""
+Shared psycopg2 connection pools
+Modules that used to open a fresh psycopg2.connect() per query (LFG, HEXBET guild config) borrow
+from one bounded ThreadedConnectionPool per DSN instead. Connections idle for a while are pinged
+before use, broken ones are dropped, and the pool is rebuilt when the server went away
+(same generation tracking as main/database.py)
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import psycopg2
+from psycopg2 import pool
+
+logger = logging.getLogger('db_pool')
+
+DB_POOL_MIN = int(os.getenv('DB_POOL_MIN', '1'))
+DB_POOL_MAX = int(os.getenv('DB_POOL_MAX', '8'))
+
+# Connections idle longer than this get a SELECT 1 before being handed out
+DB_POOL_PING_AFTER = float(os.getenv('DB_POOL_PING_AFTER', '30'))
+
+_CONNECTION_ERRORS = (psycopg2.OperationalError, psycopg2.InterfaceError)
+
+
+class SharedConnectionPool:
+    """Bounded pool for one DSN.
+
+    conn = p.getconn() ... p.putconn(conn), or `with p.connection() as conn:`
+    which commits on success, rolls back on error and always returns the
+    connection.
+    """
+
+    def __init__(self, dsn: str, name: str = 'db', minconn: int = DB_POOL_MIN, maxconn: int = DB_POOL_MAX):
+        self.dsn = dsn
+        self.name = name
+        self.minconn = minconn
+        self.maxconn = max(minconn, maxconn)
+        self._pool: Optional[pool.ThreadedConnectionPool] = None
+        self._lock = threading.RLock()
+        self._generation = 0
+        self._checked_out: Dict[int, int] = {}
+        self._returned_at: Dict[int, float] = {}
+        self.stats = {'checkouts': 0, 'pings': 0, 'dropped': 0, 'rebuilds': 0, 'exhausted': 0}
+
+    def _create_pool(self):
+        with self._lock:
+            self._pool = pool.ThreadedConnectionPool(
+                minconn=self.minconn,
+                maxconn=self.maxconn,
+                dsn=self.dsn,
+                connect_timeout=10
+            )
+            self._generation += 1
+            self._returned_at.clear()
+            logger.info(f"✅ {self.name} connection pool ready (max {self.maxconn})")
+
+    def _rebuild(self):
+        with self._lock:
+            if self._pool is not None:
+                try:
+                    self._pool.closeall()
+                except Exception:
+                    pass
+                self._pool = None
+            self.stats['rebuilds'] += 1
+            self._create_pool()
+
+    def _healthy(self, conn) -> bool:
+        if conn.closed:
+            return False
+        idle_since = self._returned_at.get(id(conn))
+        if idle_since is None or time.monotonic() - idle_since < DB_POOL_PING_AFTER:
+            return True
+        self.stats['pings'] += 1
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except _CONNECTION_ERRORS:
+            return False
+
+    def getconn(self):
+        """Borrow a live connection, waiting briefly when every connection is in use"""
+        last_error = None
+        for attempt in range(1, 4):
+            try:
+                with self._lock:
+                    if self._pool is None:
+                        self._create_pool()
+                    pool_ref = self._pool
+                    generation = self._generation
+                    conn = pool_ref.getconn()
+                    # Drop dead connections until a healthy one (or a brand new one) comes out
+                    for _ in range(self.maxconn):
+                        if self._healthy(conn):
+                            break
+                        self.stats['dropped'] += 1
+                        self._returned_at.pop(id(conn), None)
+                        pool_ref.putconn(conn, close=True)
+                        conn = pool_ref.getconn()
+                    self._returned_at.pop(id(conn), None)
+                    self._checked_out[id(conn)] = generation
+                    self.stats['checkouts'] += 1
+                    return conn
+            except pool.PoolError as error:
+                last_error = error
+                self.stats['exhausted'] += 1
+                logger.warning(f"⚠️ {self.name} pool exhausted (attempt {attempt}/3)")
+                time.sleep(0.4 * attempt)
+            except _CONNECTION_ERRORS as error:
+                last_error = error
+                logger.warning(f"⚠️ {self.name} connection attempt {attempt}/3 failed: {error}")
+                time.sleep(1.5 * attempt)
+                try:
+                    self._rebuild()
+                except Exception as rebuild_error:
+                    last_error = rebuild_error
+                    logger.warning(f"⚠️ Failed to recreate {self.name} pool: {rebuild_error}")
+        raise last_error
+
+    def putconn(self, conn):
+        """Give a connection back; connections from an older pool or broken ones are closed"""
+        if conn is None:
+            return
+        try:
+            with self._lock:
+                generation = self._checked_out.pop(id(conn), None)
+                pool_ref = self._pool
+                if pool_ref is None or generation != self._generation:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+                    return
+                if conn.closed:
+                    pool_ref.putconn(conn, close=True)
+                    return
+                # The pool rolls back anything left open
+                pool_ref.putconn(conn)
+                self._returned_at[id(conn)] = time.monotonic()
+        except Exception as error:
+            logger.warning(f"⚠️ Failed to return {self.name} connection to pool: {error}")
+
+    @contextmanager
+    def connection(self):
+        conn = self.getconn()
+        try:
+            yield conn
+            if not conn.closed:
+                conn.commit()
+        except Exception:
+            if not conn.closed:
+                try:
+                    conn.rollback()
+                except _CONNECTION_ERRORS:
+                    pass
+            raise
+        finally:
+            self.putconn(conn)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {**self.stats, 'in_use': len(self._checked_out), 'max': self.maxconn}
+
+    def closeall(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.closeall()
+                self._pool = None
+            self._checked_out.clear()
+            self._returned_at.clear()
+
+
+_shared_pools: Dict[str, SharedConnectionPool] = {}
+_shared_pools_lock = threading.Lock()
+
+
+def get_shared_pool(dsn: str, name: str = 'db') -> SharedConnectionPool:
+    """One pool per DSN per process, so modules on the same database share connections"""
+    with _shared_pools_lock:
+        shared = _shared_pools.get(dsn)
+        if shared is None:
+            shared = SharedConnectionPool(dsn, name=name)
+            _shared_pools[dsn] = shared
+        return shared
@@ -0,0 +1,72 @@
+"""
+Shared Riot API client used by the main bot and the tracker bot
+"""
+
+from .account_index import AccountIndex, PostgresAccountIndexStore, get_shared_account_index
+from .circuit_breaker import CircuitBreakers, CircuitOpenError, get_shared_circuit_breakers
+from .client import RiotAPI
+from .ddragon import (CHAMPION_ID_TO_NAME, DDRAGON_BASE, DDRAGON_VERSION, DDragonData, get_champion_icon_url,
+                      get_ddragon, get_rank_icon_url, load_champion_data)
+from .match_cache import MatchCache, get_shared_match_cache
+from .match_projection import MatchSummary, PlayerMatch, normalize_game_duration, project_match, project_player
+from .metrics_server import start_metrics_server
+from .priority import (BACKGROUND, INTERACTIVE, LANES, NORMAL, get_request_lane, request_lane,
+                       set_request_lane)
+from .rank_cache import RankCache, fetch_ranked_many, get_shared_rank_cache
+from .routing import (MATCH_ROUTING, PLATFORM_ROUTES, RIOT_REGIONS, SEA_PLATFORM_FALLBACKS,
+                      expand_platform_candidates, platform_to_region)
+from .rate_limiter import RiotRateLimiter, get_shared_rate_limiter, parse_rate_limit_header
+from .telemetry import RiotTelemetry, get_request_caller, get_shared_telemetry, request_caller, set_request_caller
+from .transport import RiotResponse, RiotTransport
+
+__all__ = [
+    'BACKGROUND',
+    'CHAMPION_ID_TO_NAME',
+    'DDRAGON_BASE',
+    'DDRAGON_VERSION',
+    'INTERACTIVE',
+    'LANES',
+    'MATCH_ROUTING',
+    'NORMAL',
+    'PLATFORM_ROUTES',
+    'RIOT_REGIONS',
+    'SEA_PLATFORM_FALLBACKS',
+    'AccountIndex',
+    'CircuitBreakers',
+    'CircuitOpenError',
+    'DDragonData',
+    'MatchCache',
+    'MatchSummary',
+    'PlayerMatch',
+    'PostgresAccountIndexStore',
+    'RankCache',
+    'RiotAPI',
+    'RiotRateLimiter',
+    'RiotResponse',
+    'RiotTelemetry',
+    'RiotTransport',
+    'expand_platform_candidates',
+    'fetch_ranked_many',
+    'get_champion_icon_url',
+    'get_ddragon',
+    'get_rank_icon_url',
+    'get_request_caller',
+    'get_request_lane',
+    'get_shared_account_index',
+    'get_shared_circuit_breakers',
+    'get_shared_match_cache',
+    'get_shared_rank_cache',
+    'get_shared_rate_limiter',
+    'get_shared_telemetry',
+    'load_champion_data',
+    'normalize_game_duration',
+    'parse_rate_limit_header',
+    'platform_to_region',
+    'project_match',
+    'project_player',
+    'request_caller',
+    'request_lane',
+    'set_request_caller',
+    'set_request_lane',
+    'start_metrics_server',
+]
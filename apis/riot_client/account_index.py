@@ -0,0 +1,235 @@
+"""
+Persistent puuid -> platform and Riot ID -> puuid index
+Every successful account/summoner lookup is recorded, later lookups for known players are answered
+from memory (LRU) or Postgres instead of probing platforms/routings one request at a time
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger('riot_api.account_index')
+
+ACCOUNT_INDEX_MAX_ENTRIES = int(os.getenv('RIOT_ACCOUNT_INDEX_MAX_ENTRIES', '50000'))
+
+# Riot IDs can be renamed and then taken by someone else, so a riotId -> puuid entry is only trusted
+# without a request for this long; older entries still decide which routing is tried first
+RIOT_ID_INDEX_TTL = float(os.getenv('RIOT_ID_INDEX_TTL', str(24 * 3600)))  # seconds
+
+ACCOUNT_INDEX_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS riot_account_index (
+        puuid VARCHAR(100) PRIMARY KEY,
+        platform VARCHAR(10),
+        routing VARCHAR(20),
+        game_name VARCHAR(100),
+        tag_line VARCHAR(20),
+        riot_id_key VARCHAR(130),
+        updated_at TIMESTAMP DEFAULT NOW()
+    );
+    CREATE INDEX IF NOT EXISTS idx_riot_account_index_riot_id
+        ON riot_account_index (riot_id_key, updated_at DESC);
+"""
+
+
+def riot_id_key(game_name: str, tag_line: str) -> str:
+    """Case-insensitive key for Name#TAG (Riot IDs are case-insensitive)"""
+    return f"{(game_name or '').strip().lower()}#{(tag_line or '').strip().lower()}"
+
+
+class PostgresAccountIndexStore:
+    """riot_account_index table accessed through a bot's psycopg2 pool.
+
+    `db` is any object with get_connection()/return_connection() (Database,
+    TrackerDatabase). Calls are blocking, AccountIndex runs them in a thread.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._table_ready = False
+
+    def _run(self, sql: str, params: tuple = (), fetch: bool = False):
+        conn = self.db.get_connection()
+        try:
+            with conn.cursor() as cur:
+                if not self._table_ready:
+                    cur.execute(ACCOUNT_INDEX_TABLE_SQL)
+                    self._table_ready = True
+                cur.execute(sql, params)
+                row = cur.fetchone() if fetch else None
+            conn.commit()
+            return row
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.db.return_connection(conn)
+
+    def load_platform(self, puuid: str) -> Optional[str]:
+        row = self._run("SELECT platform FROM riot_account_index WHERE puuid = %s", (puuid,), fetch=True)
+        return row[0] if row else None
+
+    def load_riot_id(self, key: str) -> Optional[Tuple[str, str, str, str, float]]:
+        row = self._run("""
+            SELECT puuid, routing, game_name, tag_line, EXTRACT(EPOCH FROM updated_at)
+            FROM riot_account_index
+            WHERE riot_id_key = %s
+            ORDER BY updated_at DESC
+            LIMIT 1
+        """, (key,), fetch=True)
+        return (row[0], row[1], row[2], row[3], float(row[4])) if row else None
+
+    def save_platform(self, puuid: str, platform: str):
+        self._run("""
+            INSERT INTO riot_account_index (puuid, platform, updated_at)
+            VALUES (%s, %s, NOW())
+            ON CONFLICT (puuid) DO UPDATE SET platform = EXCLUDED.platform, updated_at = NOW()
+        """, (puuid, platform))
+
+    def save_riot_id(self, puuid: str, routing: str, game_name: str, tag_line: str):
+        self._run("""
+            INSERT INTO riot_account_index (puuid, routing, game_name, tag_line, riot_id_key, updated_at)
+            VALUES (%s, %s, %s, %s, %s, NOW())
+            ON CONFLICT (puuid) DO UPDATE SET
+                routing = EXCLUDED.routing,
+                game_name = EXCLUDED.game_name,
+                tag_line = EXCLUDED.tag_line,
+                riot_id_key = EXCLUDED.riot_id_key,
+                updated_at = NOW()
+        """, (puuid, routing, game_name, tag_line, riot_id_key(game_name, tag_line)))
+
+    def forget_platform(self, puuid: str):
+        self._run("UPDATE riot_account_index SET platform = NULL WHERE puuid = %s", (puuid,))
+
+    def forget_riot_id(self, key: str):
+        self._run("UPDATE riot_account_index SET riot_id_key = NULL WHERE riot_id_key = %s", (key,))
+
+
+class AccountIndex:
+    """In-memory LRU in front of an optional persistent store.
+
+    Lookups check memory first, then the store; writes go to both but skip
+    the store when nothing changed. Store errors are logged and treated as
+    misses, the index is an optimisation and never fails a lookup.
+    """
+
+    def __init__(self, store=None, max_entries: int = ACCOUNT_INDEX_MAX_ENTRIES):
+        self.store = store
+        self.max_entries = max_entries
+        self._platforms: "OrderedDict[str, str]" = OrderedDict()
+        # riot id key -> (puuid, routing, game_name, tag_line, stored at)
+        self._riot_ids: "OrderedDict[str, Tuple[str, str, str, str, float]]" = OrderedDict()
+        self.stats = {
+            'platform_hits': 0,
+            'platform_misses': 0,
+            'riot_id_hits': 0,
+            'riot_id_misses': 0,
+            'store_errors': 0,
+            'invalidations': 0,
+        }
+
+    def _remember(self, cache: OrderedDict, key, value):
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.max_entries:
+            cache.popitem(last=False)
+
+    async def _store_call(self, name: str, *args):
+        if self.store is None:
+            return None
+        try:
+            return await asyncio.to_thread(getattr(self.store, name), *args)
+        except Exception as e:
+            self.stats['store_errors'] += 1
+            logger.warning(f"⚠️ Account index store {name} failed: {e}")
+            return None
+
+    # ----- puuid -> platform -----
+
+    async def get_platform(self, puuid: str) -> Optional[str]:
+        platform = self._platforms.get(puuid)
+        if platform is None:
+            platform = await self._store_call('load_platform', puuid)
+            if platform:
+                self._remember(self._platforms, puuid, platform)
+        else:
+            self._platforms.move_to_end(puuid)
+        self.stats['platform_hits' if platform else 'platform_misses'] += 1
+        return platform
+
+    async def set_platform(self, puuid: str, platform: str):
+        if not puuid or not platform or self._platforms.get(puuid) == platform:
+            return
+        self._remember(self._platforms, puuid, platform)
+        await self._store_call('save_platform', puuid, platform)
+
+    async def forget_platform(self, puuid: str, platform: Optional[str] = None):
+        """Drop puuid -> platform (only if it still points at `platform`, when given)"""
+        if platform is not None and self._platforms.get(puuid) not in (None, platform):
+            return
+        self._platforms.pop(puuid, None)
+        self.stats['invalidations'] += 1
+        await self._store_call('forget_platform', puuid)
+
+    # ----- riot id -> puuid -----
+
+    async def get_riot_id(self, game_name: str, tag_line: str) -> Optional[Dict]:
+        """{'puuid', 'gameName', 'tagLine', 'routing', 'fresh'} or None"""
+        key = riot_id_key(game_name, tag_line)
+        entry = self._riot_ids.get(key)
+        if entry is None:
+            entry = await self._store_call('load_riot_id', key)
+            if entry:
+                self._remember(self._riot_ids, key, entry)
+        else:
+            self._riot_ids.move_to_end(key)
+        self.stats['riot_id_hits' if entry else 'riot_id_misses'] += 1
+        if not entry:
+            return None
+        puuid, routing, stored_name, stored_tag, stored_at = entry
+        return {
+            'puuid': puuid,
+            'gameName': stored_name,
+            'tagLine': stored_tag,
+            'routing': routing,
+            'fresh': time.time() - stored_at < RIOT_ID_INDEX_TTL,
+        }
+
+    async def set_riot_id(self, puuid: str, routing: str, game_name: str, tag_line: str):
+        if not puuid or not game_name or not tag_line:
+            return
+        key = riot_id_key(game_name, tag_line)
+        current = self._riot_ids.get(key)
+        self._remember(self._riot_ids, key, (puuid, routing, game_name, tag_line, time.time()))
+        # Re-write when the mapping changed or the stored copy is getting stale
+        if current and current[:4] == (puuid, routing, game_name, tag_line) \
+                and time.time() - current[4] < RIOT_ID_INDEX_TTL / 2:
+            return
+        await self._store_call('save_riot_id', puuid, routing, game_name, tag_line)
+
+    async def forget_riot_id(self, game_name: str, tag_line: str):
+        key = riot_id_key(game_name, tag_line)
+        self._riot_ids.pop(key, None)
+        self.stats['invalidations'] += 1
+        await self._store_call('forget_riot_id', key)
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            'platform_entries': len(self._platforms),
+            'riot_id_entries': len(self._riot_ids),
+            'persistent': self.store is not None,
+        }
+
+
+_shared_account_index: Optional[AccountIndex] = None
+
+
+def get_shared_account_index() -> AccountIndex:
+    """Process-wide account index shared by every RiotAPI instance"""
+    global _shared_account_index
+    if _shared_account_index is None:
+        _shared_account_index = AccountIndex()
+    return _shared_account_index
@@ -0,0 +1,147 @@
+"""
+Circuit breakers per (platform/routing host, endpoint family)
+After a run of 5xx/timeouts/network errors the breaker opens and requests fail fast instead of
+sleeping through retries; once the cooldown passes a single probe request decides whether it closes
+"""
+
+import logging
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger('riot_api.circuit_breaker')
+
+BREAKER_FAILURE_THRESHOLD = int(os.getenv('RIOT_BREAKER_FAILURES', '5'))  # consecutive failures
+BREAKER_OPEN_SECONDS = float(os.getenv('RIOT_BREAKER_OPEN_SECONDS', '30'))
+BREAKER_MAX_OPEN_SECONDS = float(os.getenv('RIOT_BREAKER_MAX_OPEN_SECONDS', '300'))
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while its breaker is open"""
+
+    def __init__(self, key: Tuple[str, str], retry_in: float):
+        super().__init__(f"Riot {key[1]} on {key[0]} is failing, circuit open for {retry_in:.0f}s")
+        self.key = key
+        self.retry_in = retry_in
+
+
+def breaker_key(host: str, endpoint: str) -> Tuple[str, str]:
+    """('euw1', 'spectator-v5') from 'euw1.api.riotgames.com' + 'spectator-v5.active-game'"""
+    return host.split('.')[0], endpoint.split('.')[0]
+
+
+class _Breaker:
+    __slots__ = ('state', 'failures', 'opened_at', 'open_for', 'probe_in_flight')
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.open_for = BREAKER_OPEN_SECONDS
+        self.probe_in_flight = False
+
+
+class CircuitBreakers:
+    """closed -> open after `failure_threshold` consecutive failures,
+    open -> half-open after the cooldown (one probe allowed through),
+    half-open -> closed on a probe success, or open again with a doubled cooldown.
+
+    5xx, timeouts and connection errors count as failures. Any other answer
+    (200, 404, 403, 429) means the platform is up.
+    """
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 open_seconds: float = BREAKER_OPEN_SECONDS,
+                 max_open_seconds: float = BREAKER_MAX_OPEN_SECONDS):
+        self.failure_threshold = max(1, failure_threshold)
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self._breakers: Dict[Tuple[str, str], _Breaker] = {}
+        self.stats = {
+            'trips': 0,
+            'fast_fails': 0,
+            'probes': 0,
+            'recoveries': 0,
+        }
+
+    def before_request(self, key: Tuple[str, str]):
+        """Raise CircuitOpenError if the request must not be sent now"""
+        breaker = self._breakers.get(key)
+        if breaker is None or breaker.state == CLOSED:
+            return
+        now = time.monotonic()
+        if breaker.state == OPEN:
+            retry_in = breaker.opened_at + breaker.open_for - now
+            if retry_in > 0:
+                self.stats['fast_fails'] += 1
+                raise CircuitOpenError(key, retry_in)
+            breaker.state = HALF_OPEN
+        # Half-open: exactly one probe at a time
+        if breaker.probe_in_flight:
+            self.stats['fast_fails'] += 1
+            raise CircuitOpenError(key, 0)
+        breaker.probe_in_flight = True
+        self.stats['probes'] += 1
+
+    def record_success(self, key: Tuple[str, str]):
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            return
+        if breaker.state != CLOSED:
+            logger.info(f"✅ Riot {key[1]} on {key[0]} recovered, circuit closed")
+            self.stats['recoveries'] += 1
+        del self._breakers[key]
+
+    def record_failure(self, key: Tuple[str, str]):
+        breaker = self._breakers.setdefault(key, _Breaker())
+        breaker.failures += 1
+        if breaker.state == HALF_OPEN:
+            # Failed probe - back off harder
+            breaker.probe_in_flight = False
+            breaker.open_for = min(breaker.open_for * 2, self.max_open_seconds)
+            self._open(key, breaker)
+        elif breaker.state == CLOSED and breaker.failures >= self.failure_threshold:
+            breaker.open_for = self.open_seconds
+            self._open(key, breaker)
+
+    def release_probe(self, key: Tuple[str, str]):
+        """Probe abandoned without an answer (cancelled) - let the next request probe"""
+        breaker = self._breakers.get(key)
+        if breaker is not None:
+            breaker.probe_in_flight = False
+
+    def _open(self, key: Tuple[str, str], breaker: _Breaker):
+        breaker.state = OPEN
+        breaker.opened_at = time.monotonic()
+        self.stats['trips'] += 1
+        logger.warning(f"🔌 Riot {key[1]} on {key[0]} failing ({breaker.failures} in a row), "
+                       f"circuit open for {breaker.open_for:.0f}s")
+
+    def state(self, host: str, endpoint: str) -> str:
+        breaker = self._breakers.get(breaker_key(host, endpoint))
+        return breaker.state if breaker else CLOSED
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            'not_closed': {
+                f"{host}/{family}": {'state': breaker.state, 'failures': breaker.failures}
+                for (host, family), breaker in self._breakers.items()
+                if breaker.state != CLOSED
+            },
+        }
+
+
+_shared_breakers: Optional[CircuitBreakers] = None
+
+
+def get_shared_circuit_breakers() -> CircuitBreakers:
+    """Process-wide breakers - an outage on a platform affects every client the same way"""
+    global _shared_breakers
+    if _shared_breakers is None:
+        _shared_breakers = CircuitBreakers()
+    return _shared_breakers
@@ -0,0 +1,324 @@
+"""
+Data Dragon static data (champion ids/names, icon urls)
+One service per process keeps a versioned on-disk copy of the DDragon files it has seen
+(<cache dir>/<version>/data/..., img/...), so bots start from disk without touching the network
+and versions.json is only checked in the background
+"""
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import time
+from typing import Dict, Optional
+
+import aiohttp
+
+logger = logging.getLogger('riot_api')
+
+# DDragon for champion data - pinned version used until a cached/latest version is known
+DDRAGON_VERSION = "15.24.1"
+DDRAGON_CDN = "https://ddragon.leagueoflegends.com"
+DDRAGON_BASE = f"{DDRAGON_CDN}/cdn/{DDRAGON_VERSION}"
+
+DDRAGON_CACHE_DIR = os.getenv('RIOT_DDRAGON_CACHE_DIR', os.path.join(os.getcwd(), '.cache', 'ddragon'))
+DDRAGON_REFRESH_INTERVAL = float(os.getenv('RIOT_DDRAGON_REFRESH_HOURS', '6')) * 3600  # seconds
+# First retry after a load found neither a disk cache nor the network, doubled per failure up to the refresh interval
+DDRAGON_RETRY_SECONDS = 60
+
+# Champion ID to name mapping (loaded at startup, shared by both bots - mutated in place, never rebound)
+CHAMPION_ID_TO_NAME = {}
+
+# Newest champions that DDragon may not list yet (only used when missing)
+MANUAL_CHAMPION_OVERRIDES = {
+    950: "Mel",
+    804: "Yunara",
+    805: "Locke",
+    904: "Zaahen",
+}
+
+CHAMPION_JSON = 'data/en_US/champion.json'
+
+
+def _apply_manual_overrides():
+    for champ_id, champ_name in MANUAL_CHAMPION_OVERRIDES.items():
+        if champ_id not in CHAMPION_ID_TO_NAME:
+            CHAMPION_ID_TO_NAME[champ_id] = champ_name
+            logger.info(f"Added {champ_name} ({champ_id}) manually")
+
+
+class DDragonData:
+    """Versioned DDragon files on disk plus preloaded champion indexes.
+
+    Files are immutable per version, so anything fetched once is served from
+    disk afterwards. A version switch swaps the indexes in one step and drops
+    the old version directories.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = DDRAGON_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.version: Optional[str] = None
+        # champion key (266) -> {'id': 'Aatrox', 'name': 'Aatrox', 'title': ..., 'tags': [...]}
+        self.champions: Dict[int, Dict] = {}
+        # lowercase display name / ddragon id -> ddragon id ("twisted fate" -> "TwistedFate")
+        self.champion_ids_by_name: Dict[str, str] = {}
+        self._load_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.last_checked: Optional[float] = None
+        # Failed first loads in a row and when (monotonic) ensure_loaded may try again
+        self._load_failures = 0
+        self._retry_at = 0.0
+        self.stats = {
+            'disk_hits': 0,
+            'downloads': 0,
+            'download_errors': 0,
+            'version_checks': 0,
+        }
+
+    # ----- disk (blocking helpers run in a worker thread) -----
+
+    def _path(self, version: str, relative: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, version, *relative.split('/'))
+
+    def _read_file(self, path: Optional[str]) -> Optional[bytes]:
+        if not path or not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def _write_file(self, path: Optional[str], body: bytes):
+        if not path:
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(body)
+        os.replace(tmp, path)
+
+    def _read_current_version(self) -> Optional[str]:
+        body = self._read_file(os.path.join(self.cache_dir, 'current')) if self.cache_dir else None
+        return body.decode().strip() if body else None
+
+    def _write_current_version(self, version: str):
+        if self.cache_dir:
+            self._write_file(os.path.join(self.cache_dir, 'current'), version.encode())
+
+    def _prune_versions(self, keep: str):
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_dir() and entry.name != keep:
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+    # ----- network -----
+
+    async def _download(self, url: str) -> Optional[bytes]:
+        try:
+            timeout = aiohttp.ClientTimeout(total=10)  # 10 second timeout
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.get(url) as response:
+                    if response.status == 200:
+                        self.stats['downloads'] += 1
+                        return await response.read()
+                    logger.warning(f"⚠️ DDragon returned status {response.status} for {url}")
+        except asyncio.TimeoutError:
+            logger.error(f"❌ Timeout loading {url} from DDragon")
+        except Exception as e:
+            logger.error(f"❌ Error loading {url} from DDragon: {e}")
+        self.stats['download_errors'] += 1
+        return None
+
+    async def fetch_latest_version(self) -> Optional[str]:
+        self.stats['version_checks'] += 1
+        self.last_checked = time.time()
+        body = await self._download(f"{DDRAGON_CDN}/api/versions.json")
+        try:
+            return json.loads(body)[0] if body else None
+        except (ValueError, IndexError):
+            return None
+
+    # ----- files -----
+
+    async def get_file(self, relative: str, version: Optional[str] = None) -> Optional[bytes]:
+        """Raw DDragon file (e.g. 'img/champion/Aatrox.png') for a version, disk first"""
+        await self.ensure_loaded()
+        version = version or self.version or DDRAGON_VERSION
+        path = self._path(version, relative)
+        body = await asyncio.to_thread(self._read_file, path)
+        if body is not None:
+            self.stats['disk_hits'] += 1
+            return body
+        body = await self._download(f"{DDRAGON_CDN}/cdn/{version}/{relative}")
+        if body is not None:
+            try:
+                await asyncio.to_thread(self._write_file, path, body)
+            except OSError as e:
+                logger.warning(f"⚠️ Could not cache DDragon file {relative}: {e}")
+        return body
+
+    async def get_json(self, relative: str, version: Optional[str] = None) -> Optional[Dict]:
+        """Parsed DDragon data file (e.g. 'data/en_US/champion/Aatrox.json')"""
+        body = await self.get_file(relative, version)
+        try:
+            return json.loads(body) if body else None
+        except ValueError:
+            return None
+
+    # ----- champion index -----
+
+    def _apply_champions(self, version: str, data: Dict):
+        champions = {}
+        by_name = {}
+        for dd_id, champ in data.get('data', {}).items():
+            try:
+                champ_key = int(champ['key'])
+            except (KeyError, ValueError):
+                continue
+            champions[champ_key] = {
+                'id': dd_id,
+                'name': champ.get('name', dd_id),
+                'title': champ.get('title', ''),
+                'tags': champ.get('tags', []),
+            }
+            by_name[champ.get('name', dd_id).lower()] = dd_id
+            by_name[dd_id.lower()] = dd_id
+        if not champions:
+            return False
+        self.version = version
+        self.champions = champions
+        self.champion_ids_by_name = by_name
+        for champ_key, champ in champions.items():
+            CHAMPION_ID_TO_NAME[champ_key] = champ['id']
+        _apply_manual_overrides()
+        return True
+
+    async def _load_version(self, version: str, allow_download: bool) -> bool:
+        path = self._path(version, CHAMPION_JSON)
+        body = await asyncio.to_thread(self._read_file, path)
+        from_disk = body is not None
+        if body is None and allow_download:
+            body = await self._download(f"{DDRAGON_CDN}/cdn/{version}/{CHAMPION_JSON}")
+        if body is None:
+            return False
+        try:
+            loaded = self._apply_champions(version, json.loads(body))
+        except ValueError:
+            loaded = False
+        if loaded and not from_disk:
+            try:
+                await asyncio.to_thread(self._write_file, path, body)
+                await asyncio.to_thread(self._write_current_version, version)
+            except OSError as e:
+                logger.warning(f"⚠️ Could not cache DDragon {version}: {e}")
+        if loaded:
+            logger.info(f"✅ Loaded {len(self.champions)} champions from DDragon {version}"
+                        f" ({'disk' if from_disk else 'network'})")
+        return loaded
+
+    async def ensure_loaded(self):
+        """Load the champion index once: cached version from disk, else the network.
+
+        When both fail the index stays empty and the next call after a backoff tries again.
+        """
+        if self.version or time.monotonic() < self._retry_at:
+            return
+        async with self._load_lock:
+            if self.version or time.monotonic() < self._retry_at:
+                return
+            cached = await asyncio.to_thread(self._read_current_version) if self.cache_dir else None
+            if cached and await self._load_version(cached, allow_download=False):
+                return
+            logger.info("🔄 Loading champion data from DDragon...")
+            latest = await self.fetch_latest_version()
+            for version in dict.fromkeys(v for v in (latest, DDRAGON_VERSION) if v):
+                if await self._load_version(version, allow_download=True):
+                    return
+            # Offline and nothing cached - urls use the pinned version until a load succeeds
+            self._load_failures += 1
+            retry_in = min(DDRAGON_RETRY_SECONDS * 2 ** (self._load_failures - 1), DDRAGON_REFRESH_INTERVAL)
+            self._retry_at = time.monotonic() + retry_in
+            logger.warning(f"⚠️ No DDragon champion data available, retrying in {retry_in:.0f}s")
+            _apply_manual_overrides()
+
+    async def refresh(self) -> bool:
+        """Switch to a newer DDragon version if one was released. True when switched."""
+        await self.ensure_loaded()
+        if not self.version:
+            # Still nothing loaded - ensure_loaded retries on its own backoff
+            return False
+        latest = await self.fetch_latest_version()
+        if not latest or latest == self.version:
+            return False
+        previous = self.version
+        if not await self._load_version(latest, allow_download=True):
+            return False
+        logger.info(f"🆕 DDragon updated {previous} -> {latest}")
+        await asyncio.to_thread(self._prune_versions, latest)
+        return True
+
+    def start_background_refresh(self):
+        """Check versions.json now and every DDRAGON_REFRESH_INTERVAL in the background"""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        async def _loop():
+            while True:
+                try:
+                    await self.refresh()
+                except Exception as e:
+                    logger.warning(f"⚠️ DDragon refresh failed: {e}")
+                # Not loaded yet: come back when the load retry is due instead of in hours
+                delay = DDRAGON_REFRESH_INTERVAL if self.version else max(1.0, self._retry_at - time.monotonic())
+                await asyncio.sleep(delay)
+
+        self._refresh_task = asyncio.ensure_future(_loop())
+
+    def base_url(self) -> str:
+        return f"{DDRAGON_CDN}/cdn/{self.version or DDRAGON_VERSION}"
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            'version': self.version,
+            'champions': len(self.champions),
+            'last_checked': self.last_checked,
+        }
+
+
+_shared_ddragon: Optional[DDragonData] = None
+
+
+def get_ddragon() -> DDragonData:
+    """Process-wide DDragon service shared by every cog"""
+    global _shared_ddragon
+    if _shared_ddragon is None:
+        _shared_ddragon = DDragonData()
+    return _shared_ddragon
+
+
+async def load_champion_data():
+    """Load champion data (disk cache first) and keep it current in the background"""
+    ddragon = get_ddragon()
+    try:
+        await ddragon.ensure_loaded()
+    except Exception as e:
+        logger.error(f"❌ Error loading champion data: {e}")
+        _apply_manual_overrides()
+    ddragon.start_background_refresh()
+
+
+def get_champion_icon_url(champion_id: int) -> str:
+    """Get champion splash art URL"""
+    champ_name = CHAMPION_ID_TO_NAME.get(champion_id, "")
+    if champ_name:
+        return f"{get_ddragon().base_url()}/img/champion/{champ_name}.png"
+    return ""
+
+
+def get_rank_icon_url(tier: str) -> str:
+    """Get rank emblem URL from Community Dragon"""
+    tier_lower = tier.lower()
+    return f"https://raw.communitydragon.org/latest/plugins/rcp-fe-lol-static-assets/global/default/ranked-emblems/emblem-{tier_lower}.png"
@@ -0,0 +1,211 @@
+"""
+Two-tier cache for match-v5 payloads
+Match details and timelines never change once a game has ended, so they are cached forever:
+a bounded in-memory LRU in front of a gzip-compressed on-disk store keyed by match id
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger('riot_api.match_cache')
+
+MATCH_CACHE_DIR = os.getenv('RIOT_MATCH_CACHE_DIR', os.path.join(os.getcwd(), '.cache', 'riot_matches'))
+MATCH_CACHE_MEMORY_BYTES = int(os.getenv('RIOT_MATCH_CACHE_MEMORY_MB', '64')) * 1024 * 1024
+MATCH_CACHE_DISK_BYTES = int(os.getenv('RIOT_MATCH_CACHE_DISK_MB', '512')) * 1024 * 1024
+
+_SAFE_KEY = re.compile(r'[^A-Za-z0-9_-]')
+
+
+class MatchCache:
+    """LRU memory tier (raw JSON bytes) over a size-capped gzip disk tier.
+
+    Raw bytes are stored rather than parsed dicts, so every hit parses a fresh
+    object and callers can mutate what they get back. Set disk_dir to None to
+    keep the cache in memory only.
+    """
+
+    def __init__(self, disk_dir: Optional[str] = MATCH_CACHE_DIR,
+                 memory_bytes: int = MATCH_CACHE_MEMORY_BYTES,
+                 disk_bytes: int = MATCH_CACHE_DISK_BYTES):
+        self.disk_dir = disk_dir
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self._memory: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._memory_size = 0
+        # path -> (size, last access), built from the directory on first disk access
+        self._disk_index: Optional[Dict[str, list]] = None
+        self._disk_size = 0
+        self._disk_lock = asyncio.Lock()
+        self.stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'memory_evictions': 0,
+            'disk_evictions': 0,
+        }
+
+    # ----- memory tier -----
+
+    def _memory_get(self, key: Tuple[str, str]) -> Optional[bytes]:
+        body = self._memory.get(key)
+        if body is not None:
+            self._memory.move_to_end(key)
+        return body
+
+    def _memory_put(self, key: Tuple[str, str], body: bytes):
+        if len(body) > self.memory_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_size -= len(old)
+        self._memory[key] = body
+        self._memory_size += len(body)
+        while self._memory_size > self.memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+            self.stats['memory_evictions'] += 1
+
+    # ----- disk tier (blocking helpers run in a worker thread) -----
+
+    def _path(self, key: Tuple[str, str]) -> str:
+        kind, match_id = key
+        return os.path.join(self.disk_dir, f"{kind}_{_SAFE_KEY.sub('_', match_id)}.json.gz")
+
+    def _load_index(self):
+        index = {}
+        total = 0
+        os.makedirs(self.disk_dir, exist_ok=True)
+        with os.scandir(self.disk_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith('.json.gz'):
+                    st = entry.stat()
+                    index[entry.path] = [st.st_size, st.st_mtime]
+                    total += st.st_size
+        self._disk_index = index
+        self._disk_size = total
+        logger.info(f"📦 Match cache on disk: {len(index)} payloads, {total / 1024 / 1024:.1f} MB")
+
+    def _disk_read(self, path: str) -> Optional[bytes]:
+        try:
+            with gzip.open(path, 'rb') as f:
+                body = f.read()
+            os.utime(path)
+            return body
+        except FileNotFoundError:
+            return None
+
+    def _disk_write(self, path: str, body: bytes) -> int:
+        tmp = f"{path}.tmp"
+        with gzip.open(tmp, 'wb', compresslevel=6) as f:
+            f.write(body)
+        os.replace(tmp, path)
+        return os.path.getsize(path)
+
+    def _disk_evict(self) -> int:
+        evicted = 0
+        # Oldest access first
+        for path, _ in sorted(self._disk_index.items(), key=lambda item: item[1][1]):
+            if self._disk_size <= self.disk_bytes:
+                break
+            size, _ = self._disk_index.pop(path)
+            self._disk_size -= size
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            evicted += 1
+        return evicted
+
+    async def _disk_get(self, key: Tuple[str, str]) -> Optional[bytes]:
+        path = self._path(key)
+        async with self._disk_lock:
+            if self._disk_index is None:
+                await asyncio.to_thread(self._load_index)
+            entry = self._disk_index.get(path)
+            if entry is None:
+                return None
+            body = await asyncio.to_thread(self._disk_read, path)
+            if body is None:
+                self._disk_size -= entry[0]
+                self._disk_index.pop(path, None)
+                return None
+            entry[1] = time.time()
+            return body
+
+    async def _disk_put(self, key: Tuple[str, str], body: bytes):
+        path = self._path(key)
+        async with self._disk_lock:
+            if self._disk_index is None:
+                await asyncio.to_thread(self._load_index)
+            size = await asyncio.to_thread(self._disk_write, path, body)
+            old = self._disk_index.get(path)
+            if old is not None:
+                self._disk_size -= old[0]
+            self._disk_index[path] = [size, time.time()]
+            self._disk_size += size
+            if self._disk_size > self.disk_bytes:
+                self.stats['disk_evictions'] += await asyncio.to_thread(self._disk_evict)
+
+    # ----- public API -----
+
+    async def get(self, kind: str, match_id: str) -> Optional[dict]:
+        """Return a cached payload ('match' or 'timeline') or None on a miss."""
+        key = (kind, match_id)
+        body = self._memory_get(key)
+        if body is not None:
+            self.stats['memory_hits'] += 1
+            return json.loads(body)
+        if self.disk_dir:
+            try:
+                body = await self._disk_get(key)
+            except Exception as e:
+                logger.warning(f"⚠️ Match cache disk read failed for {match_id}: {e}")
+                body = None
+            if body is not None:
+                self.stats['disk_hits'] += 1
+                self._memory_put(key, body)
+                return json.loads(body)
+        self.stats['misses'] += 1
+        return None
+
+    async def put(self, kind: str, match_id: str, body: bytes):
+        """Store a raw match-v5 response body."""
+        key = (kind, match_id)
+        self.stats['stores'] += 1
+        self._memory_put(key, body)
+        if self.disk_dir:
+            try:
+                await self._disk_put(key, body)
+            except Exception as e:
+                logger.warning(f"⚠️ Match cache disk write failed for {match_id}: {e}")
+
+    def get_stats(self) -> Dict:
+        hits = self.stats['memory_hits'] + self.stats['disk_hits']
+        lookups = hits + self.stats['misses']
+        return {
+            **self.stats,
+            'hit_rate': round(hits / lookups, 3) if lookups else 0.0,
+            'memory_entries': len(self._memory),
+            'memory_bytes': self._memory_size,
+            'disk_entries': len(self._disk_index) if self._disk_index is not None else None,
+            'disk_bytes': self._disk_size if self._disk_index is not None else None,
+        }
+
+
+_shared_match_cache: Optional[MatchCache] = None
+
+
+def get_shared_match_cache() -> MatchCache:
+    """Process-wide match cache shared by every RiotAPI instance"""
+    global _shared_match_cache
+    if _shared_match_cache is None:
+        _shared_match_cache = MatchCache()
+    return _shared_match_cache
@@ -0,0 +1,136 @@
+"""
+Slim match-v5 records
+A full match payload is ~100 KB of parsed JSON, while profile/stats/settlement only read a handful
+of fields. These slotted records are built right after the payload is fetched (or read from the
+match cache) and the raw JSON is dropped unless a caller explicitly asks to keep it
+"""
+
+from array import array
+from typing import Dict, Optional
+
+
+def normalize_game_duration(info: Dict) -> int:
+    """gameDuration in seconds - matches before patch 11.20 (no gameEndTimestamp) report milliseconds"""
+    duration = info.get('gameDuration', 0) or 0
+    if 'gameEndTimestamp' not in info and duration > 10000:
+        duration = duration / 1000
+    return int(duration)
+
+
+class MatchSummary:
+    """Match-level fields: queue, timing, the winning team and participantId -> teamId."""
+
+    __slots__ = ('match_id', 'queue_id', 'game_mode', 'game_creation', 'game_duration', 'game_end',
+                 'winning_team', 'participant_teams', 'raw')
+
+    def __init__(self, payload: Dict, keep_raw: bool = False):
+        info = payload.get('info', {})
+        self.match_id = payload.get('metadata', {}).get('matchId', '')
+        self.queue_id = info.get('queueId', 0)
+        self.game_mode = info.get('gameMode', 'UNKNOWN')
+        self.game_creation = info.get('gameCreation', 0)
+        self.game_duration = normalize_game_duration(info)
+        # Epoch ms; older payloads without gameEndTimestamp are estimated from start + duration
+        self.game_end = info.get('gameEndTimestamp') or (
+            (info.get('gameStartTimestamp') or self.game_creation or 0) + self.game_duration * 1000
+        )
+        self.winning_team = next((t.get('teamId') for t in info.get('teams', []) if t.get('win')), None)
+        # Index participantId - 1, 0 when unknown
+        teams = array('H', bytes(2 * len(info.get('participants', []))))
+        for i, p in enumerate(info.get('participants', [])):
+            pid = p.get('participantId', i + 1)
+            if isinstance(pid, int) and 0 < pid <= len(teams):
+                teams[pid - 1] = p.get('teamId', 0) or 0
+        self.participant_teams = teams
+        self.raw = payload if keep_raw else None
+
+    def team_of(self, participant_id: int) -> Optional[int]:
+        if isinstance(participant_id, int) and 0 < participant_id <= len(self.participant_teams):
+            return self.participant_teams[participant_id - 1] or None
+        return None
+
+    def __repr__(self):
+        return f"<MatchSummary {self.match_id} queue={self.queue_id} {self.game_duration}s>"
+
+
+class PlayerMatch:
+    """One player's line in a match, with the match fields and the team totals it is compared to.
+
+    game_duration is always in seconds, cs is lane minions + jungle monsters.
+    """
+
+    __slots__ = ('match_id', 'queue_id', 'game_mode', 'game_creation', 'game_duration',
+                 'puuid', 'champion_id', 'champion_name', 'team_id', 'team_position', 'win',
+                 'kills', 'deaths', 'assists', 'cs', 'vision_score', 'gold_earned',
+                 'damage_to_champions', 'physical_damage', 'magic_damage', 'true_damage',
+                 'damage_to_objectives', 'damage_mitigated', 'turret_kills', 'inhibitor_kills',
+                 'team_kills', 'team_max_damage', 'team_dragons', 'team_barons', 'team_heralds',
+                 'raw')
+
+    def __init__(self, payload: Dict, participant: Dict, keep_raw: bool = False):
+        info = payload.get('info', {})
+        self.match_id = payload.get('metadata', {}).get('matchId', '')
+        self.queue_id = info.get('queueId', 0)
+        self.game_mode = info.get('gameMode', 'UNKNOWN')
+        self.game_creation = info.get('gameCreation', 0)
+        self.game_duration = normalize_game_duration(info)
+
+        p = participant
+        self.puuid = p.get('puuid', '')
+        self.champion_id = p.get('championId', 0)
+        self.champion_name = p.get('championName', '')
+        self.team_id = p.get('teamId', 0)
+        self.team_position = p.get('teamPosition', '') or ''
+        self.win = bool(p.get('win', False))
+        self.kills = p.get('kills', 0)
+        self.deaths = p.get('deaths', 0)
+        self.assists = p.get('assists', 0)
+        self.cs = p.get('totalMinionsKilled', 0) + p.get('neutralMinionsKilled', 0)
+        self.vision_score = p.get('visionScore', 0)
+        self.gold_earned = p.get('goldEarned', 0)
+        self.damage_to_champions = p.get('totalDamageDealtToChampions', 0)
+        self.physical_damage = p.get('physicalDamageDealtToChampions', 0)
+        self.magic_damage = p.get('magicDamageDealtToChampions', 0)
+        self.true_damage = p.get('trueDamageDealtToChampions', 0)
+        self.damage_to_objectives = p.get('damageDealtToObjectives', 0)
+        self.damage_mitigated = p.get('damageSelfMitigated', 0)
+        self.turret_kills = p.get('turretKills', 0)
+        self.inhibitor_kills = p.get('inhibitorKills', 0)
+
+        teammates = [pp for pp in info.get('participants', []) if pp.get('teamId') == self.team_id]
+        self.team_kills = sum(pp.get('kills', 0) for pp in teammates)
+        self.team_max_damage = max((pp.get('totalDamageDealtToChampions', 0) for pp in teammates), default=0)
+        objectives = next((t.get('objectives', {}) for t in info.get('teams', [])
+                           if t.get('teamId') == self.team_id), {})
+        self.team_dragons = objectives.get('dragon', {}).get('kills', 0)
+        self.team_barons = objectives.get('baron', {}).get('kills', 0)
+        self.team_heralds = objectives.get('riftHerald', {}).get('kills', 0)
+        self.raw = payload if keep_raw else None
+
+    @property
+    def kda(self) -> float:
+        return (self.kills + self.assists) / max(self.deaths, 1)
+
+    @property
+    def kill_participation(self) -> float:
+        return (self.kills + self.assists) / self.team_kills if self.team_kills > 0 else 0
+
+    def __repr__(self):
+        return (f"<PlayerMatch {self.match_id} {self.champion_name} "
+                f"{self.kills}/{self.deaths}/{self.assists} {'W' if self.win else 'L'}>")
+
+
+def project_player(payload: Optional[Dict], puuid: str, keep_raw: bool = False) -> Optional[PlayerMatch]:
+    """PlayerMatch for puuid, or None when the payload is empty or the player is not in it"""
+    if not payload or 'info' not in payload:
+        return None
+    for participant in payload['info'].get('participants', []):
+        if participant.get('puuid') == puuid:
+            return PlayerMatch(payload, participant, keep_raw)
+    return None
+
+
+def project_match(payload: Optional[Dict], keep_raw: bool = False) -> Optional[MatchSummary]:
+    if not payload or 'info' not in payload:
+        return None
+    return MatchSummary(payload, keep_raw)
@@ -0,0 +1,40 @@
+"""
+Plain-text metrics endpoint for the Riot API telemetry
+GET /metrics returns RiotAPI.render_metrics() (Prometheus text format), so quota use per feature
+can be watched live or scraped. Started only when RIOT_METRICS_PORT is set
+"""
+
+import logging
+import os
+from typing import Optional
+
+from aiohttp import web
+
+logger = logging.getLogger('riot_api.metrics')
+
+RIOT_METRICS_PORT = os.getenv('RIOT_METRICS_PORT', '')
+RIOT_METRICS_HOST = os.getenv('RIOT_METRICS_HOST', '0.0.0.0')
+
+
+async def start_metrics_server(riot_api, port: Optional[int] = None,
+                               host: str = RIOT_METRICS_HOST) -> Optional[web.AppRunner]:
+    """Serve /metrics for riot_api in the running event loop. Returns the runner (None when disabled)."""
+    port = port or (int(RIOT_METRICS_PORT) if RIOT_METRICS_PORT else None)
+    if not port:
+        return None
+
+    async def handle_metrics(request: web.Request) -> web.Response:
+        return web.Response(text=riot_api.render_metrics(), content_type='text/plain', charset='utf-8')
+
+    app = web.Application()
+    app.router.add_get('/metrics', handle_metrics)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host, port).start()
+    except OSError as e:
+        logger.error(f"❌ Could not start Riot metrics endpoint on {host}:{port}: {e}")
+        await runner.cleanup()
+        return None
+    logger.info(f"📈 Riot API metrics on http://{host}:{port}/metrics")
+    return runner
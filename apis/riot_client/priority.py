@@ -0,0 +1,78 @@
+"""
+Request priority lanes for the Riot API scheduler
+Slash commands run as 'interactive', bulk refresh jobs as 'background', everything else 'normal'.
+The lane is carried in a context variable, so a job sets it once and every Riot call it awaits
+(including tasks it spawns) inherits it
+"""
+
+import asyncio
+import contextvars
+import os
+from contextlib import contextmanager
+from typing import Optional
+
+INTERACTIVE = 'interactive'
+NORMAL = 'normal'
+BACKGROUND = 'background'
+
+# Highest priority first
+LANES = (INTERACTIVE, NORMAL, BACKGROUND)
+LANE_RANK = {lane: rank for rank, lane in enumerate(LANES)}
+
+# Share of each rate limit window background work may fill, the rest stays free for commands
+BACKGROUND_LIMIT_SHARE = float(os.getenv('RIOT_BACKGROUND_LIMIT_SHARE', '0.7'))
+
+_current_lane: contextvars.ContextVar[str] = contextvars.ContextVar('riot_request_lane', default=NORMAL)
+
+
+def get_request_lane() -> str:
+    """Lane of the Riot calls made from the current task"""
+    return _current_lane.get()
+
+
+def set_request_lane(lane: str) -> contextvars.Token:
+    """Set the lane for the rest of the current task (and tasks created from it)"""
+    if lane not in LANE_RANK:
+        raise ValueError(f"Unknown Riot request lane: {lane}")
+    return _current_lane.set(lane)
+
+
+@contextmanager
+def request_lane(lane: str):
+    """with request_lane(BACKGROUND): ... runs the block's Riot calls in that lane"""
+    token = set_request_lane(lane)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+class LaneTicket:
+    """Lane of one queued request that can still be raised while it waits.
+
+    A coalesced request runs once for every caller sharing it, so it has to
+    wait in the best lane among them - not just the lane of whoever sent it.
+    """
+    __slots__ = ('lane', '_wake')
+
+    def __init__(self, lane: str):
+        self.lane = lane
+        self._wake: Optional[asyncio.Future] = None
+
+    def raise_to(self, lane: str):
+        """Move to `lane` if it is higher and wake the waiting request to re-check"""
+        if LANE_RANK[lane] >= LANE_RANK[self.lane]:
+            return
+        self.lane = lane
+        if self._wake is not None and not self._wake.done():
+            self._wake.set_result(None)
+
+    async def sleep(self, seconds: float):
+        """Sleep up to `seconds`, returning early when the lane is raised"""
+        self._wake = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.wait_for(self._wake, seconds)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._wake = None
@@ -0,0 +1,130 @@
+"""
+Short-lived cache + batched fetch for league-v4 ranked entries
+Rank/LP only moves after a game, so a few minutes of staleness is fine for role sync,
+leaderboards and team balancing, and lets those paths share one lookup per player
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger('riot_api.rank_cache')
+
+RANK_CACHE_TTL = float(os.getenv('RIOT_RANK_CACHE_TTL', '300'))  # seconds
+RANK_CACHE_MAX_ENTRIES = int(os.getenv('RIOT_RANK_CACHE_MAX_ENTRIES', '20000'))
+
+# Concurrent league-v4 lookups per platform inside one batch (the rate limiter still paces them)
+RANKED_BATCH_CONCURRENCY = int(os.getenv('RIOT_RANKED_CONCURRENCY', '5'))
+
+
+class RankCache:
+    """TTL cache of ranked entries keyed by (puuid, platform).
+
+    Only definitive answers are stored (entries or [] for unranked), never
+    failures, so a transient error doesn't make a player look unranked.
+    """
+
+    def __init__(self, ttl: float = RANK_CACHE_TTL, max_entries: int = RANK_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, List[Dict]]]" = OrderedDict()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'stores': 0,
+        }
+
+    def get(self, puuid: str, platform: str) -> Optional[List[Dict]]:
+        key = (puuid, platform)
+        item = self._entries.get(key)
+        if item is None or time.monotonic() - item[0] > self.ttl:
+            if item is not None:
+                del self._entries[key]
+            self.stats['misses'] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats['hits'] += 1
+        # Copies, callers are free to mutate what they get back
+        return [dict(entry) for entry in item[1]]
+
+    def put(self, puuid: str, platform: str, entries: List[Dict]):
+        key = (puuid, platform)
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic(), [dict(entry) for entry in entries])
+        self.stats['stores'] += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get_stats(self) -> Dict:
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'hit_rate': round(self.stats['hits'] / lookups, 3) if lookups else 0.0,
+            'entries': len(self._entries),
+            'ttl': self.ttl,
+        }
+
+
+async def fetch_ranked_many(pairs: Iterable[Tuple[str, str]],
+                            fetch_one: Callable[[str, str], Awaitable[Optional[List[Dict]]]],
+                            platform_of: Callable[[str], str],
+                            cache: Optional[RankCache] = None,
+                            concurrency: int = RANKED_BATCH_CONCURRENCY) -> Dict[Tuple[str, str], Optional[List[Dict]]]:
+    """Resolve ranked entries for many (puuid, region) pairs.
+
+    Duplicate pairs are fetched once, fresh cache entries are served without a
+    request and the rest fan out with at most `concurrency` lookups in flight
+    per platform. Returns {(puuid, region): entries or None on failure} keyed
+    by the pairs exactly as given.
+    """
+    # (puuid, platform) -> every caller pair that maps to it
+    wanted: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+    for puuid, region in pairs:
+        if not puuid or not region:
+            continue
+        wanted.setdefault((puuid, platform_of(region)), []).append((puuid, region))
+
+    results: Dict[Tuple[str, str], Optional[List[Dict]]] = {}
+    to_fetch: List[Tuple[str, str, str]] = []
+    for (puuid, platform), originals in wanted.items():
+        cached = cache.get(puuid, platform) if cache is not None else None
+        if cached is not None:
+            for pair in originals:
+                results[pair] = cached
+        else:
+            to_fetch.append((puuid, platform, originals[0][1]))
+
+    if to_fetch:
+        semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        async def _one(puuid: str, platform: str, region: str):
+            semaphore = semaphores.setdefault(platform, asyncio.Semaphore(max(1, concurrency)))
+            async with semaphore:
+                try:
+                    return await fetch_one(puuid, region)
+                except Exception as e:
+                    logger.warning(f"⚠️ Ranked lookup failed for {puuid[:8]}... on {platform}: {e}")
+                    return None
+
+        fetched = await asyncio.gather(*(_one(*item) for item in to_fetch))
+        for (puuid, platform, _), entries in zip(to_fetch, fetched):
+            for pair in wanted[(puuid, platform)]:
+                results[pair] = entries
+
+        logger.info(f"📊 Ranked batch: {len(wanted)} players, {len(wanted) - len(to_fetch)} from cache, {len(to_fetch)} fetched")
+
+    return results
+
+
+_shared_rank_cache: Optional[RankCache] = None
+
+
+def get_shared_rank_cache() -> RankCache:
+    """Process-wide rank cache shared by every RiotAPI instance"""
+    global _shared_rank_cache
+    if _shared_rank_cache is None:
+        _shared_rank_cache = RankCache()
+    return _shared_rank_cache
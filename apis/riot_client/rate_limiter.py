@@ -0,0 +1,319 @@
+"""
+Header-driven Riot API rate limiter
+Keeps every request just under the app and method limits Riot reports back
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from .priority import BACKGROUND, BACKGROUND_LIMIT_SHARE, LANE_RANK, LANES, LaneTicket, get_request_lane
+
+logger = logging.getLogger('riot_api.rate_limiter')
+
+# Limits assumed for a host before Riot has told us the real ones (development key defaults)
+DEFAULT_APP_RATE_LIMIT = os.getenv('RIOT_APP_RATE_LIMIT', '20:1,100:120')
+
+# Fraction of each limit we actually use, leaves headroom for other processes sharing the key
+RATE_LIMIT_MARGIN = float(os.getenv('RIOT_RATE_LIMIT_MARGIN', '0.9'))
+
+# Wait applied when Riot returns 429 without a Retry-After header
+DEFAULT_RETRY_AFTER = 1.0
+
+# How long a lower lane backs off while a higher lane can take the next slot
+PRIORITY_YIELD = 0.02  # seconds
+
+
+def parse_rate_limit_header(value: Optional[str]) -> List[Tuple[int, int]]:
+    """Parse 'count:seconds,count:seconds' (X-*-Rate-Limit / X-*-Rate-Limit-Count)."""
+    limits = []
+    if not value:
+        return limits
+    for part in value.split(','):
+        try:
+            count, seconds = part.strip().split(':')
+            limits.append((int(count), int(seconds)))
+        except ValueError:
+            continue
+    return limits
+
+
+class _Window:
+    """Sliding window of request timestamps for one count:seconds limit.
+
+    A sliding log never lets more than `allowed` requests into any interval of
+    `seconds`, so it is always safe against Riot's fixed windows, including
+    the long 120s window where a refilling bucket would overshoot.
+    """
+    __slots__ = ('limit', 'seconds', 'allowed', 'stamps')
+
+    def __init__(self, limit: int, seconds: int, margin: float):
+        self.limit = limit
+        self.seconds = seconds
+        self.allowed = max(1, int(limit * margin))
+        self.stamps = deque()
+
+    def prune(self, now: float):
+        cutoff = now - self.seconds
+        while self.stamps and self.stamps[0] <= cutoff:
+            self.stamps.popleft()
+
+    def delay(self, now: float, share: float = 1.0) -> float:
+        self.prune(now)
+        allowed = max(1, int(self.allowed * share))
+        if len(self.stamps) < allowed:
+            return 0.0
+        # Wait until enough old requests fall out of the window
+        return self.stamps[len(self.stamps) - allowed] + self.seconds - now
+
+
+class _Bucket:
+    """All rate limit windows for one app (host) or method (host + endpoint)."""
+
+    def __init__(self, limits: List[Tuple[int, int]], margin: float):
+        self.margin = margin
+        self.windows: Dict[int, _Window] = {}
+        self.blocked_until = 0.0
+        self.set_limits(limits)
+
+    def set_limits(self, limits: List[Tuple[int, int]]):
+        windows = {}
+        for limit, seconds in limits:
+            window = _Window(limit, seconds, self.margin)
+            old = self.windows.get(seconds)
+            if old is not None:
+                window.stamps = old.stamps
+            windows[seconds] = window
+        self.windows = windows
+
+    def limits(self) -> List[Tuple[int, int]]:
+        return [(w.limit, w.seconds) for w in self.windows.values()]
+
+    def delay(self, now: float, share: float = 1.0) -> float:
+        wait = self.blocked_until - now
+        for window in self.windows.values():
+            wait = max(wait, window.delay(now, share))
+        return max(wait, 0.0)
+
+    def record(self, now: float):
+        for window in self.windows.values():
+            window.stamps.append(now)
+
+    def sync_counts(self, counts: List[Tuple[int, int]], now: float):
+        """Pad our log when Riot counted more requests than we did (key shared with another process)."""
+        for count, seconds in counts:
+            window = self.windows.get(seconds)
+            if window is None:
+                continue
+            window.prune(now)
+            missing = count - len(window.stamps)
+            for _ in range(max(0, missing)):
+                window.stamps.append(now)
+
+
+class RiotRateLimiter:
+    """Schedules Riot API requests per app (host) and per method (host + endpoint).
+
+    acquire() waits until a request fits under every known limit, and
+    update() feeds back X-App-Rate-Limit, X-Method-Rate-Limit, their -Count
+    headers and Retry-After, so the limiter follows whatever Riot enforces.
+
+    Waiting requests are served by lane (see priority.py): a lower lane never
+    takes a slot on a host while a higher lane waiting there could use it,
+    and background requests only fill BACKGROUND_LIMIT_SHARE of each window.
+    """
+
+    def __init__(self, default_app_limits: str = DEFAULT_APP_RATE_LIMIT,
+                 margin: float = RATE_LIMIT_MARGIN):
+        self.default_app_limits = parse_rate_limit_header(default_app_limits)
+        self.margin = margin
+        self._app_buckets: Dict[str, _Bucket] = {}
+        self._method_buckets: Dict[Tuple[str, str], _Bucket] = {}
+        self.stats = {
+            'requests': 0,
+            'throttled': 0,
+            'throttled_seconds': 0.0,
+            'rate_limited': 0,
+        }
+        # host -> [lane, method] entries of requests waiting in acquire(), oldest first
+        self._waiters: Dict[str, List[list]] = {}
+        self.lane_stats = {
+            lane: {'requests': 0, 'queued': 0, 'max_queued': 0, 'wait_seconds': 0.0, 'max_wait': 0.0}
+            for lane in LANES
+        }
+
+    def _app_bucket(self, host: str) -> _Bucket:
+        bucket = self._app_buckets.get(host)
+        if bucket is None:
+            bucket = _Bucket(self.default_app_limits, self.margin)
+            self._app_buckets[host] = bucket
+        return bucket
+
+    def _method_bucket(self, host: str, method: str) -> _Bucket:
+        key = (host, method)
+        bucket = self._method_buckets.get(key)
+        if bucket is None:
+            # No method limits are known until the first response arrives
+            bucket = _Bucket([], self.margin)
+            self._method_buckets[key] = bucket
+        return bucket
+
+    def _delay(self, host: str, method: str, lane: str, now: float) -> float:
+        share = BACKGROUND_LIMIT_SHARE if lane == BACKGROUND else 1.0
+        return max(self._app_bucket(host).delay(now, share), self._method_bucket(host, method).delay(now, share))
+
+    def _queued_ahead_ready(self, host: str, lane: str, now: float, waiter: Optional[list]) -> bool:
+        """True when a request queued ahead of us on host could take a slot right now.
+
+        Ahead means a higher lane, or the same lane and queued earlier (FIFO
+        within a lane). New arrivals (waiter=None) are behind everyone queued.
+        """
+        rank = LANE_RANK[lane]
+        behind = False
+        for entry in self._waiters.get(host, ()):
+            if entry is waiter:
+                behind = True
+                continue
+            entry_rank = LANE_RANK[entry[0]]
+            if entry_rank < rank or (entry_rank == rank and not behind):
+                if self._delay(host, entry[1], entry[0], now) <= 0:
+                    return True
+        return False
+
+    def reserve(self, host: str, method: str, lane: Optional[str] = None,
+                _waiter: Optional[list] = None) -> float:
+        """Take a slot if one is free right now, otherwise return the seconds to wait."""
+        lane = lane or get_request_lane()
+        now = time.monotonic()
+        wait = self._delay(host, method, lane, now)
+        if wait <= 0 and self._queued_ahead_ready(host, lane, now, _waiter):
+            wait = PRIORITY_YIELD
+        if wait > 0:
+            return wait
+        self._app_bucket(host).record(now)
+        self._method_bucket(host, method).record(now)
+        self.stats['requests'] += 1
+        self.lane_stats[lane]['requests'] += 1
+        return 0.0
+
+    async def acquire(self, host: str, method: str, lane: Optional[str] = None,
+                      ticket: Optional[LaneTicket] = None):
+        """Wait until a request to host/method fits under every known limit.
+
+        The lane defaults to the caller's context (get_request_lane()). With a
+        ticket the lane is read from it and follows ticket.raise_to() while the
+        request is queued.
+        """
+        lane = ticket.lane if ticket is not None else (lane or get_request_lane())
+        wait = self.reserve(host, method, lane)
+        if wait <= 0:
+            return
+
+        waiter = [lane, method]
+        waiters = self._waiters.setdefault(host, [])
+        waiters.append(waiter)
+        self._count_queued(lane, 1)
+        started = time.monotonic()
+        try:
+            while wait > 0:
+                if ticket is None:
+                    await asyncio.sleep(wait)
+                else:
+                    await ticket.sleep(wait)
+                    if ticket.lane != waiter[0]:
+                        self._count_queued(waiter[0], -1)
+                        self._count_queued(ticket.lane, 1)
+                        waiter[0] = ticket.lane
+                wait = self.reserve(host, method, waiter[0], _waiter=waiter)
+        finally:
+            # Served or cancelled, either way we leave the queue
+            waiters.remove(waiter)
+            lane_stats = self.lane_stats[waiter[0]]
+            lane_stats['queued'] -= 1
+            waited = time.monotonic() - started
+            lane_stats['wait_seconds'] += waited
+            lane_stats['max_wait'] = max(lane_stats['max_wait'], waited)
+            self.stats['throttled'] += 1
+            self.stats['throttled_seconds'] += waited
+
+    def _count_queued(self, lane: str, delta: int):
+        lane_stats = self.lane_stats[lane]
+        lane_stats['queued'] += delta
+        lane_stats['max_queued'] = max(lane_stats['max_queued'], lane_stats['queued'])
+
+    def get_quota_usage(self) -> Dict[str, Dict[str, List[Dict]]]:
+        """{host: {'app' | 'method:<endpoint>': [{'used', 'limit', 'seconds'}]}} as seen by this process"""
+        now = time.monotonic()
+        usage: Dict[str, Dict[str, List[Dict]]] = {}
+
+        def _windows(bucket: _Bucket) -> List[Dict]:
+            rows = []
+            for window in bucket.windows.values():
+                window.prune(now)
+                rows.append({'used': len(window.stamps), 'limit': window.limit, 'seconds': window.seconds})
+            return rows
+
+        for host, bucket in self._app_buckets.items():
+            usage.setdefault(host, {})['app'] = _windows(bucket)
+        for (host, method), bucket in self._method_buckets.items():
+            if bucket.windows:
+                usage.setdefault(host, {})[f"method:{method}"] = _windows(bucket)
+        return usage
+
+    def get_lane_stats(self) -> Dict[str, Dict]:
+        """Per-lane requests, current/max queue depth and wait times"""
+        result = {}
+        for lane, stats in self.lane_stats.items():
+            result[lane] = {
+                **stats,
+                'wait_seconds': round(stats['wait_seconds'], 3),
+                'max_wait': round(stats['max_wait'], 3),
+                'avg_wait': round(stats['wait_seconds'] / stats['requests'], 4) if stats['requests'] else 0.0,
+            }
+        return result
+
+    def update(self, host: str, method: str, status: int, headers):
+        """Adjust limits from response headers and honour Retry-After on 429."""
+        now = time.monotonic()
+        app_bucket = self._app_bucket(host)
+        method_bucket = self._method_bucket(host, method)
+
+        app_limits = parse_rate_limit_header(headers.get('X-App-Rate-Limit'))
+        if app_limits and app_limits != app_bucket.limits():
+            logger.info(f"📏 App rate limit for {host}: {headers.get('X-App-Rate-Limit')}")
+            app_bucket.set_limits(app_limits)
+        method_limits = parse_rate_limit_header(headers.get('X-Method-Rate-Limit'))
+        if method_limits and method_limits != method_bucket.limits():
+            method_bucket.set_limits(method_limits)
+
+        app_bucket.sync_counts(parse_rate_limit_header(headers.get('X-App-Rate-Limit-Count')), now)
+        method_bucket.sync_counts(parse_rate_limit_header(headers.get('X-Method-Rate-Limit-Count')), now)
+
+        if status != 429:
+            return
+
+        self.stats['rate_limited'] += 1
+        try:
+            retry_after = float(headers.get('Retry-After', DEFAULT_RETRY_AFTER))
+        except (TypeError, ValueError):
+            retry_after = DEFAULT_RETRY_AFTER
+        limit_type = (headers.get('X-Rate-Limit-Type') or '').lower()
+        # Application limits block the whole host, method/service limits only that endpoint
+        bucket = app_bucket if limit_type == 'application' else method_bucket
+        bucket.blocked_until = max(bucket.blocked_until, now + retry_after)
+        logger.warning(f"⏳ 429 from {host} ({method}, {limit_type or 'unknown'} limit), pausing {retry_after:.1f}s")
+
+
+# One limiter per API key per process, limits belong to the key rather than a client instance
+_shared_limiters: Dict[str, RiotRateLimiter] = {}
+
+
+def get_shared_rate_limiter(api_key: str) -> RiotRateLimiter:
+    limiter = _shared_limiters.get(api_key)
+    if limiter is None:
+        limiter = RiotRateLimiter()
+        _shared_limiters[api_key] = limiter
+    return limiter
@@ -0,0 +1,77 @@
+"""
+Riot API routing tables
+Short region codes (euw, na, ...) to regional routes (account/match) and platform routes
+(summoner/league/mastery/spectator)
+"""
+
+from typing import List
+
+# Regional routing values (for account-v1)
+RIOT_REGIONS = {
+    'br': 'americas',
+    'eune': 'europe',
+    'euw': 'europe',
+    'jp': 'asia',
+    'kr': 'asia',
+    'lan': 'americas',
+    'las': 'americas',
+    'na': 'americas',
+    'oce': 'sea',
+    'tr': 'europe',
+    'ru': 'europe'
+}
+
+# Platform routing values (for summoner/league/mastery endpoints)
+PLATFORM_ROUTES = {
+    'br': 'br1',
+    'eune': 'eun1',
+    'euw': 'euw1',
+    'jp': 'jp1',
+    'kr': 'kr',
+    'lan': 'la1',
+    'las': 'la2',
+    'na': 'na1',
+    'oce': 'oc1',
+    'tr': 'tr1',
+    'ru': 'ru',
+    'ph': 'ph2',
+    'sg': 'sg2',
+    'th': 'th2',
+    'tw': 'tw2',
+    'vn': 'vn2'
+}
+
+# Match routing for match-v5
+MATCH_ROUTING = {
+    'br1': 'americas', 'la1': 'americas', 'la2': 'americas', 'na1': 'americas', 'oc1': 'americas',
+    'euw1': 'europe', 'eun1': 'europe', 'tr1': 'europe', 'ru': 'europe',
+    'kr': 'asia', 'jp1': 'asia',
+    'sg2': 'sea', 'ph2': 'sea', 'th2': 'sea', 'tw2': 'sea', 'vn2': 'sea'
+}
+
+# Some SEA platform hosts are intermittently unreachable in certain environments.
+# If a primary SEA platform route fails DNS/connectivity, try these alternatives.
+SEA_PLATFORM_FALLBACKS = {
+    'ph2': ['sg2', 'tw2', 'vn2'],
+    'th2': ['sg2', 'tw2', 'vn2'],
+    'sg2': ['tw2', 'vn2'],
+    'tw2': ['sg2', 'vn2'],
+    'vn2': ['sg2', 'tw2'],
+}
+
+
+def platform_to_region(platform: str) -> str:
+    """Map platform route (euw1) to short region code (euw). Fallback to euw."""
+    for k, v in PLATFORM_ROUTES.items():
+        if v == platform:
+            return k
+    return 'euw'
+
+
+def expand_platform_candidates(primary_platform: str) -> List[str]:
+    """Return ordered platform candidates with SEA failover routes when applicable."""
+    candidates = [primary_platform]
+    for fallback in SEA_PLATFORM_FALLBACKS.get(primary_platform, []):
+        if fallback not in candidates:
+            candidates.append(fallback)
+    return candidates
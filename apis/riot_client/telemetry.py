@@ -0,0 +1,254 @@
+"""
+Riot API telemetry - who spends the quota and how fast Riot answers
+Every request sent is recorded per endpoint and per caller (the feature that triggered it):
+latency histograms, status codes, 429s and retries. render_metrics() turns it, together with
+cache, rate limiter and breaker stats, into plain-text (Prometheus) metrics
+"""
+
+import asyncio
+import contextvars
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+# Histogram bucket upper bounds in milliseconds
+LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# A request for a url that failed (429/5xx/timeout) this recently counts as a retry
+RETRY_WINDOW = 60.0  # seconds
+_RECENT_FAILURES_MAX = 5000
+
+_current_caller: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar('riot_request_caller', default=None)
+
+_TASK_LOOP_PREFIX = 'discord-ext-tasks: '
+
+
+def get_request_caller() -> str:
+    """Feature the current Riot calls are attributed to.
+
+    Set explicitly with set_request_caller()/request_caller(); otherwise
+    discord.ext.tasks loops are named after their coroutine and anything
+    else is 'other'.
+    """
+    caller = _current_caller.get()
+    if caller:
+        return caller
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    name = task.get_name() if task is not None else ''
+    if name.startswith(_TASK_LOOP_PREFIX):
+        return name[len(_TASK_LOOP_PREFIX):]
+    return 'other'
+
+
+def set_request_caller(caller: str) -> contextvars.Token:
+    """Attribute the rest of the current task's Riot calls to `caller` (e.g. '/profile')"""
+    return _current_caller.set(caller)
+
+
+@contextmanager
+def request_caller(caller: str):
+    """with request_caller('worker'): ... attributes the block's Riot calls"""
+    token = _current_caller.set(caller)
+    try:
+        yield
+    finally:
+        _current_caller.reset(token)
+
+
+class _Histogram:
+    __slots__ = ('buckets', 'count', 'total_ms')
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)  # last one is +Inf
+        self.count = 0
+        self.total_ms = 0.0
+
+    def observe(self, ms: float):
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+        self.count += 1
+        self.total_ms += ms
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th request (None = above the last bucket)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else None
+        return None
+
+    def cumulative(self) -> List[int]:
+        result = []
+        running = 0
+        for bucket_count in self.buckets:
+            running += bucket_count
+            result.append(running)
+        return result
+
+
+class RiotTelemetry:
+    """Counters and histograms for requests the transport actually sent."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.by_endpoint: Dict[str, _Histogram] = {}
+        self.by_caller: Dict[str, _Histogram] = {}
+        self.statuses: Dict[Tuple[str, str], int] = {}
+        self.caller_endpoints: Dict[Tuple[str, str], int] = {}
+        self.rate_limited: Dict[Tuple[str, str], int] = {}
+        self.retries: Dict[Tuple[str, str], int] = {}
+        self.coalesced: Dict[str, int] = {}
+        self.fast_fails: Dict[Tuple[str, str], int] = {}
+        self._recent_failures: "OrderedDict[str, float]" = OrderedDict()
+
+    @staticmethod
+    def _bump(counter: Dict, key, amount: int = 1):
+        counter[key] = counter.get(key, 0) + amount
+
+    def record(self, endpoint: str, caller: str, url: str, status: str, seconds: float):
+        """One request sent; status is the HTTP status or 'timeout'/'error'"""
+        ms = seconds * 1000
+        self.by_endpoint.setdefault(endpoint, _Histogram()).observe(ms)
+        self.by_caller.setdefault(caller, _Histogram()).observe(ms)
+        self._bump(self.statuses, (endpoint, status))
+        self._bump(self.caller_endpoints, (caller, endpoint))
+
+        now = time.monotonic()
+        failed_at = self._recent_failures.pop(url, None)
+        if failed_at is not None and now - failed_at < RETRY_WINDOW:
+            self._bump(self.retries, (caller, endpoint))
+        if status == '429':
+            self._bump(self.rate_limited, (caller, endpoint))
+        if status in ('429', 'timeout', 'error') or status.startswith('5'):
+            self._recent_failures[url] = now
+            while len(self._recent_failures) > _RECENT_FAILURES_MAX:
+                self._recent_failures.popitem(last=False)
+
+    def record_coalesced(self, caller: str):
+        self._bump(self.coalesced, caller)
+
+    def record_fast_fail(self, endpoint: str, caller: str):
+        self._bump(self.fast_fails, (caller, endpoint))
+
+    def summary(self, top: int = 8) -> Dict:
+        """Compact view for chat commands: busiest endpoints and callers"""
+        def _rows(histograms: Dict[str, _Histogram]):
+            rows = []
+            for name, hist in sorted(histograms.items(), key=lambda item: item[1].count, reverse=True)[:top]:
+                rows.append({
+                    'name': name,
+                    'requests': hist.count,
+                    'avg_ms': round(hist.total_ms / hist.count, 1) if hist.count else 0.0,
+                    'p50_ms': hist.quantile(0.5),
+                    'p95_ms': hist.quantile(0.95),
+                })
+            return rows
+
+        uptime = max(1.0, time.time() - self.started)
+        total = sum(hist.count for hist in self.by_endpoint.values())
+        return {
+            'uptime_seconds': round(uptime),
+            'requests': total,
+            'requests_per_minute': round(total / uptime * 60, 1),
+            'rate_limited': sum(self.rate_limited.values()),
+            'retries': sum(self.retries.values()),
+            'fast_fails': sum(self.fast_fails.values()),
+            'coalesced': sum(self.coalesced.values()),
+            'errors': sum(count for (_, status), count in self.statuses.items()
+                          if status in ('timeout', 'error') or status.startswith('5')),
+            'endpoints': _rows(self.by_endpoint),
+            'callers': _rows(self.by_caller),
+        }
+
+
+def _labels(**labels) -> str:
+    parts = []
+    for key, value in labels.items():
+        escaped = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', ' ')
+        parts.append(f'{key}="{escaped}"')
+    return '{' + ','.join(parts) + '}'
+
+
+def _histogram_lines(name: str, label: str, histograms: Dict[str, _Histogram]) -> List[str]:
+    lines = [f"# TYPE {name} histogram"]
+    bounds = [str(bound) for bound in LATENCY_BUCKETS_MS] + ['+Inf']
+    for key, hist in sorted(histograms.items()):
+        for bound, cumulative in zip(bounds, hist.cumulative()):
+            lines.append(f"{name}_bucket{_labels(**{label: key, 'le': bound})} {cumulative}")
+        lines.append(f"{name}_sum{_labels(**{label: key})} {round(hist.total_ms, 3)}")
+        lines.append(f"{name}_count{_labels(**{label: key})} {hist.count}")
+    return lines
+
+
+def render_metrics(telemetry: RiotTelemetry, stats: Dict, quota: Dict) -> str:
+    """Plain-text metrics (Prometheus exposition format).
+
+    `stats` is RiotAPI.get_request_stats(), `quota` RiotRateLimiter.get_quota_usage().
+    """
+    lines: List[str] = []
+    lines += _histogram_lines('riot_request_latency_ms', 'endpoint', telemetry.by_endpoint)
+    lines += _histogram_lines('riot_caller_latency_ms', 'caller', telemetry.by_caller)
+
+    def _counter(name: str, rows):
+        lines.append(f"# TYPE {name} counter")
+        for labels, value in rows:
+            lines.append(f"{name}{_labels(**labels)} {value}")
+
+    _counter('riot_responses_total', [({'endpoint': e, 'status': s}, v) for (e, s), v in sorted(telemetry.statuses.items())])
+    _counter('riot_caller_requests_total', [({'caller': c, 'endpoint': e}, v) for (c, e), v in sorted(telemetry.caller_endpoints.items())])
+    _counter('riot_rate_limited_total', [({'caller': c, 'endpoint': e}, v) for (c, e), v in sorted(telemetry.rate_limited.items())])
+    _counter('riot_retries_total', [({'caller': c, 'endpoint': e}, v) for (c, e), v in sorted(telemetry.retries.items())])
+    _counter('riot_circuit_fast_fails_total', [({'caller': c, 'endpoint': e}, v) for (c, e), v in sorted(telemetry.fast_fails.items())])
+    _counter('riot_coalesced_total', [({'caller': c}, v) for c, v in sorted(telemetry.coalesced.items())])
+
+    cache_rows = []
+    for cache_name in ('match_cache', 'rank_cache', 'account_index'):
+        for key, value in (stats.get(cache_name) or {}).items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and key.endswith(('hits', 'misses', 'stores')):
+                cache_rows.append(({'cache': cache_name, 'kind': key}, value))
+    _counter('riot_cache_events_total', cache_rows)
+
+    lines.append("# TYPE riot_quota_used gauge")
+    limit_lines = ["# TYPE riot_quota_limit gauge"]
+    for host, scopes in sorted(quota.items()):
+        for scope, windows in sorted(scopes.items()):
+            for window in windows:
+                labels = _labels(host=host, scope=scope, window=f"{window['seconds']}s")
+                lines.append(f"riot_quota_used{labels} {window['used']}")
+                limit_lines.append(f"riot_quota_limit{labels} {window['limit']}")
+    lines += limit_lines
+
+    lines.append("# TYPE riot_lane_queued gauge")
+    for lane, lane_stats in sorted((stats.get('lanes') or {}).items()):
+        lines.append(f"riot_lane_queued{_labels(lane=lane)} {lane_stats.get('queued', 0)}")
+
+    breakers = stats.get('circuit_breakers') or {}
+    lines.append("# TYPE riot_circuit_open gauge")
+    for name, breaker in sorted((breakers.get('not_closed') or {}).items()):
+        host, _, family = name.partition('/')
+        lines.append(f"riot_circuit_open{_labels(host=host, family=family, state=breaker['state'])} 1")
+
+    return '\n'.join(lines) + '\n'
+
+
+_shared_telemetry: Optional[RiotTelemetry] = None
+
+
+def get_shared_telemetry() -> RiotTelemetry:
+    """Process-wide telemetry shared by every RiotAPI instance"""
+    global _shared_telemetry
+    if _shared_telemetry is None:
+        _shared_telemetry = RiotTelemetry()
+    return _shared_telemetry
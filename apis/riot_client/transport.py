@@ -0,0 +1,208 @@
+"""
+Pooled HTTP transport for the Riot API
+One keep-alive session per routing/platform host, every request goes through the rate limiter,
+concurrent identical GETs share a single in-flight request, failing hosts are cut off by circuit breakers
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from .circuit_breaker import CircuitBreakers, CircuitOpenError, breaker_key, get_shared_circuit_breakers
+from .priority import LaneTicket, get_request_lane
+from .rate_limiter import RiotRateLimiter, get_shared_rate_limiter
+from .telemetry import RiotTelemetry, get_request_caller, get_shared_telemetry
+
+logger = logging.getLogger('riot_api.transport')
+
+# Connection pooling for *.api.riotgames.com hosts (one keep-alive pool per host)
+RIOT_CONNECTIONS_PER_HOST = int(os.getenv('RIOT_CONNECTIONS_PER_HOST', '10'))
+RIOT_DNS_CACHE_TTL = 300  # seconds
+RIOT_KEEPALIVE_TIMEOUT = 60  # seconds an idle connection is kept open
+
+# Send every request to a stand-in server instead of *.api.riotgames.com (e.g. http://127.0.0.1:8089,
+# see apis/riot_stub). The Riot host is kept as the first path segment: <base>/<host>/<path>
+RIOT_API_BASE_URL = os.getenv('RIOT_API_BASE_URL', '').rstrip('/')
+
+
+class RiotResponse:
+    """Fully-read Riot API response.
+
+    The body is buffered before the connection is released, so the
+    connection goes straight back to the keep-alive pool.
+    """
+    __slots__ = ('status', 'headers', 'body')
+
+    def __init__(self, status: int, headers, body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body)
+
+    def text(self) -> str:
+        return self.body.decode('utf-8', errors='replace')
+
+
+class RiotTransport:
+    def __init__(self, api_key: str, connections_per_host: Optional[int] = None,
+                 rate_limiter: Optional[RiotRateLimiter] = None, base_url: Optional[str] = None,
+                 breakers: Optional[CircuitBreakers] = None, telemetry: Optional[RiotTelemetry] = None):
+        self.headers = {
+            'X-Riot-Token': api_key
+        }
+        self.connections_per_host = connections_per_host or RIOT_CONNECTIONS_PER_HOST
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter(api_key)
+        self.base_url = (base_url or RIOT_API_BASE_URL).rstrip('/') or None
+        if self.base_url:
+            logger.warning(f"🧪 Riot API requests redirected to {self.base_url}")
+        # Stand-in servers inject faults on purpose, keep their breakers away from the real ones
+        self.breakers = breakers or (CircuitBreakers() if self.base_url else get_shared_circuit_breakers())
+        self.telemetry = telemetry or (RiotTelemetry() if self.base_url else get_shared_telemetry())
+        # Long-lived sessions keyed by host (euw1.api.riotgames.com, europe.api.riotgames.com, ...)
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        # url -> in-flight request task shared by every concurrent caller
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # url -> lane the in-flight request waits in, raised to the best lane among its callers
+        self._inflight_lanes: Dict[str, LaneTicket] = {}
+        # url -> callers still waiting on that task (the request is cancelled once nobody waits)
+        self._inflight_waiters: Dict[str, int] = {}
+        self.stats = {
+            'requests': 0,
+            'coalesced': 0,
+        }
+        self.coalesced_by_endpoint: Dict[str, int] = {}
+
+    def _get_session(self, host: str) -> aiohttp.ClientSession:
+        """Return the pooled session for a routing/platform host, creating it on first use"""
+        session = self._sessions.get(host)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.connections_per_host,
+                ttl_dns_cache=RIOT_DNS_CACHE_TTL,
+                keepalive_timeout=RIOT_KEEPALIVE_TIMEOUT,
+            )
+            session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+            self._sessions[host] = session
+        return session
+
+    async def get(self, url: str, timeout: aiohttp.ClientTimeout, endpoint: str) -> RiotResponse:
+        """GET a Riot API url once the rate limiter allows it.
+
+        `endpoint` names the Riot method (e.g. 'match-v5.match') and keys the
+        method rate limit. A 429 is returned to the caller as-is; its
+        Retry-After is already applied to the next acquire().
+
+        Callers asking for a url that is already in flight await that request
+        instead of sending their own, and a caller in a higher lane moves the
+        still-queued request up to its lane. The response body is immutable
+        bytes and json() parses a fresh object per caller, so sharing it is safe.
+
+        Raises CircuitOpenError without sending anything while the host's
+        breaker for this endpoint family is open.
+        """
+        task = self._inflight.get(url)
+        if task is not None:
+            self.stats['coalesced'] += 1
+            self.coalesced_by_endpoint[endpoint] = self.coalesced_by_endpoint.get(endpoint, 0) + 1
+            self.telemetry.record_coalesced(get_request_caller())
+            self._inflight_lanes[url].raise_to(get_request_lane())
+        else:
+            try:
+                self.breakers.before_request(breaker_key(urlsplit(url).hostname, endpoint))
+            except CircuitOpenError:
+                self.telemetry.record_fast_fail(endpoint, get_request_caller())
+                raise
+            self.stats['requests'] += 1
+            ticket = LaneTicket(get_request_lane())
+            task = asyncio.ensure_future(self._fetch(url, timeout, endpoint, get_request_caller(), ticket))
+            self._inflight[url] = task
+            self._inflight_lanes[url] = ticket
+            task.add_done_callback(lambda done: self._unlist(url, done))
+        self._inflight_waiters[url] = self._inflight_waiters.get(url, 0) + 1
+        try:
+            # shield: one caller being cancelled must not cancel the request for the others
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # Last interested caller gone (e.g. a losing hedged lookup) - drop the request too,
+            # while it is still queued in the rate limiter this frees its slot
+            if self._inflight_waiters.get(url) == 1 and not task.done():
+                task.cancel()
+                # Unlist it now so a caller arriving before the done-callback starts a fresh request
+                self._unlist(url, task)
+            raise
+        finally:
+            remaining = self._inflight_waiters.get(url, 1) - 1
+            if remaining > 0:
+                self._inflight_waiters[url] = remaining
+            else:
+                self._inflight_waiters.pop(url, None)
+
+    def _unlist(self, url: str, task: asyncio.Task):
+        """Forget the in-flight request for url, unless a newer one replaced it"""
+        if self._inflight.get(url) is task:
+            self._inflight.pop(url, None)
+            self._inflight_lanes.pop(url, None)
+
+    def _target_url(self, url: str) -> str:
+        """Real url, or the stand-in server url when a base url override is set"""
+        if not self.base_url:
+            return url
+        parts = urlsplit(url)
+        target = f"{self.base_url}/{parts.hostname}{parts.path}"
+        return f"{target}?{parts.query}" if parts.query else target
+
+    async def _fetch(self, url: str, timeout: aiohttp.ClientTimeout, endpoint: str, caller: str,
+                     ticket: LaneTicket) -> RiotResponse:
+        # Limits, sessions and coalescing stay keyed by the Riot host even when redirected
+        host = urlsplit(url).hostname
+        key = breaker_key(host, endpoint)
+        started = time.monotonic()
+        try:
+            await self.rate_limiter.acquire(host, endpoint, ticket=ticket)
+            started = time.monotonic()
+            session = self._get_session(host)
+            async with session.get(self._target_url(url), timeout=timeout) as response:
+                body = await response.read()
+                self.rate_limiter.update(host, endpoint, response.status, response.headers)
+        except asyncio.CancelledError:
+            self.breakers.release_probe(key)
+            raise
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            self.breakers.record_failure(key)
+            status = 'timeout' if isinstance(e, asyncio.TimeoutError) else 'error'
+            self.telemetry.record(endpoint, caller, url, status, time.monotonic() - started)
+            raise
+        self.telemetry.record(endpoint, caller, url, str(response.status), time.monotonic() - started)
+        if response.status >= 500:
+            self.breakers.record_failure(key)
+        else:
+            self.breakers.record_success(key)
+        return RiotResponse(response.status, response.headers, body)
+
+    def get_stats(self) -> Dict:
+        """Request, coalescing, rate limiter and per-lane scheduler counters"""
+        return {
+            **self.stats,
+            'coalesced_by_endpoint': dict(self.coalesced_by_endpoint),
+            'rate_limiter': dict(self.rate_limiter.stats),
+            'lanes': self.rate_limiter.get_lane_stats(),
+            'circuit_breakers': self.breakers.get_stats(),
+        }
+
+    async def close(self):
+        """Close all pooled sessions (call on bot shutdown)"""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+        if sessions:
+            logger.info(f"🔌 Closed {len(sessions)} Riot API sessions")
@@ -0,0 +1,11 @@
+"""
+Local stand-in for the Riot API (fixtures + latency/429/5xx injection) for offline load testing
+"""
+
+from .server import RiotStub, StubConfig, create_app
+
+__all__ = [
+    'RiotStub',
+    'StubConfig',
+    'create_app',
+]
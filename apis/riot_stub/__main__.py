@@ -0,0 +1,43 @@
+"""
+Run the Riot API stand-in:
+
+    cd apis && python -m riot_stub --port 8089 --latency-ms 40 --rate-429 0.02 --error-every 500 --error-burst 5
+
+then start a bot or script with RIOT_API_BASE_URL=http://127.0.0.1:8089 (any RIOT_API_KEY value works).
+Live stats: GET /_stub/stats, change knobs: POST /_stub/config {"rate_429": 0.1}, reset: POST /_stub/reset.
+With --record and RIOT_API_KEY set, paths without a recorded fixture are fetched from the real API once
+and saved under fixtures/recorded/<host>/<path>.json.
+"""
+
+import argparse
+import logging
+import os
+from dataclasses import fields
+
+from aiohttp import web
+
+from .server import FIXTURES_DIR, StubConfig, create_app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Riot API stand-in server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--fixtures', default=FIXTURES_DIR)
+    parser.add_argument('--record', action='store_true', help="record missing payloads from the real API (needs RIOT_API_KEY)")
+    defaults = StubConfig()
+    for field in fields(StubConfig):
+        parser.add_argument(f"--{field.name.replace('_', '-')}", type=type(getattr(defaults, field.name)),
+                            default=getattr(defaults, field.name))
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    config = StubConfig(**{field.name: getattr(args, field.name) for field in fields(StubConfig)})
+    record_key = os.getenv('RIOT_API_KEY') if args.record else None
+    if args.record and not record_key:
+        parser.error("--record needs RIOT_API_KEY")
+    web.run_app(create_app(config, args.fixtures, record_key), host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,370 @@
+"""
+Stand-in Riot API server
+Serves account-v1, summoner-v4, league-v4, champion-mastery-v4, match-v5 and spectator-v5 from
+JSON fixtures, with injectable latency, 429s and 5xx bursts, so the bots' hot paths can be
+exercised and benchmarked without a Riot key.
+
+Requests arrive as <base>/<riot host>/<riot path> (see RIOT_API_BASE_URL in riot_client.transport).
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import random
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, Optional
+
+import aiohttp
+from aiohttp import web
+
+logger = logging.getLogger('riot_stub')
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# match-v5 is served from regional hosts, match ids carry a platform prefix
+ROUTING_PLATFORMS = {'europe': 'euw1', 'americas': 'na1', 'asia': 'kr', 'sea': 'sg2'}
+
+
+@dataclass
+class StubConfig:
+    """Fault injection knobs, all adjustable at runtime via POST /_stub/config"""
+    latency_ms: float = 30.0            # base latency added to every response
+    jitter_ms: float = 20.0             # uniform random extra latency
+    rate_429: float = 0.0               # probability of a random 429
+    retry_after: int = 1                # Retry-After (seconds) sent with 429s
+    limit_type: str = 'method'          # X-Rate-Limit-Type of random 429s
+    app_rate_limit: str = '20:1,100:120'  # enforced per Riot host, '' disables
+    method_rate_limit: str = ''         # enforced per host + endpoint family, '' disables
+    error_every: int = 0                # start a 5xx burst every N requests (0 = off)
+    error_burst: int = 0                # length of each 5xx burst
+    error_status: int = 503
+    match_count: int = 20               # match ids returned per by-puuid request
+    in_game_rate: float = 1.0           # probability a spectator lookup finds a game
+
+
+class _Limit:
+    """Fixed-window counters for a 'count:seconds,...' rate limit header"""
+
+    def __init__(self, spec: str):
+        self.spec = spec
+        self.windows = []
+        for part in filter(None, spec.split(',')):
+            count, seconds = part.split(':')
+            self.windows.append([int(count), int(seconds), 0.0, 0])
+
+    def hit(self, now: float) -> Optional[int]:
+        """Count a request, return seconds until reset if a window is exceeded."""
+        retry = None
+        for window in self.windows:
+            count, seconds, started, used = window
+            if now - started >= seconds:
+                window[2], window[3] = now, 0
+            window[3] += 1
+            if window[3] > count:
+                wait = int(window[2] + seconds - now) + 1
+                retry = max(retry or 0, wait)
+        return retry
+
+    def counts(self) -> str:
+        return ','.join(f"{w[3]}:{w[1]}" for w in self.windows)
+
+
+class RiotStub:
+    def __init__(self, config: Optional[StubConfig] = None, fixtures_dir: str = FIXTURES_DIR,
+                 record_api_key: Optional[str] = None):
+        self.config = config or StubConfig()
+        self.fixtures_dir = fixtures_dir
+        # With a real key, responses not recorded yet are fetched from Riot and saved under fixtures/recorded/
+        self.record_api_key = record_api_key
+        self._record_session = None
+        self._fixtures: Dict[str, object] = {}
+        self._app_limits: Dict[str, _Limit] = {}
+        self._method_limits: Dict[tuple, _Limit] = {}
+        # match id -> puuid that asked for it, so the player shows up in their own matches
+        self._match_owner: Dict[str, str] = {}
+        self._served = 0
+        self._burst_left = 0
+        self._latencies = deque(maxlen=10000)
+        self.stats = {'requests': 0, 'ok': 0, 'not_found': 0, 'rate_limited': 0, 'errors': 0}
+        self.by_endpoint: Dict[str, int] = {}
+
+    # ----- fixtures -----
+
+    def _fixture(self, name: str, **values):
+        if name not in self._fixtures:
+            with open(os.path.join(self.fixtures_dir, f"{name}.json"), encoding='utf-8') as f:
+                self._fixtures[name] = json.load(f)
+        return _fill(copy.deepcopy(self._fixtures[name]), values)
+
+    def _recorded_path(self, host: str, path: str) -> str:
+        return os.path.join(self.fixtures_dir, 'recorded', host, path.strip('/') + '.json')
+
+    def _recorded(self, host: str, path: str):
+        """Exact recorded payload for this host/path if one was saved under fixtures/recorded/"""
+        recorded = self._recorded_path(host, path)
+        if os.path.isfile(recorded):
+            with open(recorded, encoding='utf-8') as f:
+                return json.load(f)
+        return None
+
+    async def _record(self, host: str, path: str, query_string: str):
+        """Fetch a payload from the real Riot API and save it as a recorded fixture"""
+        if self._record_session is None:
+            self._record_session = aiohttp.ClientSession(headers={'X-Riot-Token': self.record_api_key})
+        url = f"https://{host}{path}" + (f"?{query_string}" if query_string else '')
+        async with self._record_session.get(url) as response:
+            if response.status != 200:
+                logger.warning(f"⚠️ Recording {url} failed: {response.status}")
+                return None
+            payload = await response.json()
+        target = self._recorded_path(host, path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2)
+        logger.info(f"📼 Recorded {url}")
+        return payload
+
+    async def close(self):
+        if self._record_session is not None:
+            await self._record_session.close()
+
+    # ----- fault injection -----
+
+    def _rate_limit_headers(self, host: str, family: str, now: float):
+        headers = {}
+        retry = None
+        limit_type = None
+        if self.config.app_rate_limit:
+            limit = self._app_limits.get(host)
+            if limit is None or limit.spec != self.config.app_rate_limit:
+                limit = self._app_limits[host] = _Limit(self.config.app_rate_limit)
+            retry = limit.hit(now)
+            if retry:
+                limit_type = 'application'
+            headers['X-App-Rate-Limit'] = limit.spec
+            headers['X-App-Rate-Limit-Count'] = limit.counts()
+        if self.config.method_rate_limit:
+            key = (host, family)
+            limit = self._method_limits.get(key)
+            if limit is None or limit.spec != self.config.method_rate_limit:
+                limit = self._method_limits[key] = _Limit(self.config.method_rate_limit)
+            method_retry = limit.hit(now)
+            if method_retry and not retry:
+                retry, limit_type = method_retry, 'method'
+            headers['X-Method-Rate-Limit'] = limit.spec
+            headers['X-Method-Rate-Limit-Count'] = limit.counts()
+        return headers, retry, limit_type
+
+    def _injected_error(self) -> bool:
+        config = self.config
+        if self._burst_left > 0:
+            self._burst_left -= 1
+            return True
+        if config.error_every and config.error_burst and self._served % config.error_every == 0:
+            self._burst_left = config.error_burst - 1
+            return True
+        return False
+
+    # ----- request handling -----
+
+    async def handle(self, request: web.Request) -> web.Response:
+        started = time.monotonic()
+        host = request.match_info['host']
+        path = '/' + request.match_info['path']
+        platform = host.split('.')[0]
+        family, payload = self._route(platform, path, request.query)
+
+        self._served += 1
+        self.stats['requests'] += 1
+        self.by_endpoint[family] = self.by_endpoint.get(family, 0) + 1
+
+        delay = (self.config.latency_ms + random.uniform(0, self.config.jitter_ms)) / 1000
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        headers, retry, limit_type = self._rate_limit_headers(host, family, time.monotonic())
+        if retry is None and self.config.rate_429 and random.random() < self.config.rate_429:
+            retry, limit_type = self.config.retry_after, self.config.limit_type
+        if retry is not None:
+            self.stats['rate_limited'] += 1
+            headers.update({'Retry-After': str(retry), 'X-Rate-Limit-Type': limit_type})
+            response = web.json_response({'status': {'message': 'Rate limit exceeded', 'status_code': 429}},
+                                         status=429, headers=headers)
+        elif self._injected_error():
+            self.stats['errors'] += 1
+            response = web.Response(status=self.config.error_status, text='<html>Bad Gateway</html>',
+                                    content_type='text/html', headers=headers)
+        elif payload is None:
+            self.stats['not_found'] += 1
+            response = web.json_response({'status': {'message': 'Data not found', 'status_code': 404}},
+                                         status=404, headers=headers)
+        else:
+            self.stats['ok'] += 1
+            recorded = self._recorded(host, path)
+            if recorded is None and self.record_api_key:
+                recorded = await self._record(host, path, request.query_string)
+            response = web.json_response(recorded if recorded is not None else payload, headers=headers)
+
+        self._latencies.append(time.monotonic() - started)
+        return response
+
+    def _route(self, platform: str, path: str, query):
+        """(endpoint family, payload or None for 404) for a Riot path"""
+        parts = path.strip('/').split('/')
+
+        if path.startswith('/riot/account/v1/accounts/by-riot-id/'):
+            game_name, tag_line = parts[-2], parts[-1]
+            account = self._fixture('account', puuid=_fake_puuid(f"{game_name}#{tag_line}".lower()))
+            account.update({'gameName': game_name, 'tagLine': tag_line})
+            return 'account-v1.by-riot-id', account
+        if path.startswith('/riot/account/v1/region/by-game/'):
+            return 'account-v1.region-by-puuid', {'puuid': parts[-1], 'game': parts[-3], 'region': _home_platform(parts[-1])}
+        if path.startswith('/riot/account/v1/accounts/by-puuid/'):
+            return 'account-v1.by-puuid', self._fixture('account', puuid=parts[-1])
+
+        if path.startswith('/lol/summoner/v4/summoners/'):
+            lookup = parts[-2] if parts[-2] != 'summoners' else 'by-id'
+            summoner = self._fixture('summoner', puuid=parts[-1] if lookup == 'by-puuid' else _fake_puuid(parts[-1]))
+            return f"summoner-v4.{lookup}", summoner
+        if path.startswith('/lol/platform/v4/third-party-code/'):
+            return 'platform-v4.third-party-code', 'STUBCODE'
+
+        if path.startswith('/lol/league/v4/entries/by-puuid/') or path.startswith('/lol/league/v4/entries/by-summoner/'):
+            key = parts[-1]
+            # Deterministic spread: roughly one player in six is unranked
+            if int(hashlib.md5(key.encode()).hexdigest(), 16) % 6 == 0:
+                return f"league-v4.entries-{parts[-2]}", []
+            return f"league-v4.entries-{parts[-2]}", self._fixture('league_entries', puuid=key)
+        if path.startswith('/lol/league/v4/') and len(parts) > 3 and parts[3].endswith('leagues'):
+            tier = parts[3].replace('leagues', '').upper()
+            league = self._fixture('league_list')
+            league['tier'] = tier
+            return f"league-v4.{parts[3]}", league
+        if path.startswith('/lol/league/v4/entries/'):
+            return 'league-v4.entries', self._fixture('league_tier_entries') if query.get('page', '1') == '1' else []
+
+        if path.startswith('/lol/champion-mastery/v4/champion-masteries/by-puuid/'):
+            return 'champion-mastery-v4.top-by-puuid', self._fixture('mastery', puuid=parts[-2] if parts[-1] == 'top' else parts[-1])
+
+        if path.startswith('/lol/match/v5/matches/by-puuid/'):
+            puuid = parts[-2]
+            count = min(int(query.get('count', self.config.match_count)), self.config.match_count)
+            seed = int(hashlib.md5(puuid.encode()).hexdigest()[:8], 16)
+            prefix = ROUTING_PLATFORMS.get(platform, platform).upper()
+            ids = [f"{prefix}_{7000000000 + seed % 1000000 * 100 + i}" for i in range(count)]
+            for match_id in ids:
+                self._match_owner[match_id] = puuid
+            return 'match-v5.ids-by-puuid', ids
+        if path.startswith('/lol/match/v5/matches/') and parts[-1] == 'timeline':
+            match_id = parts[-2]
+            return 'match-v5.timeline', self._fixture('timeline', **_match_values(match_id, self._match_owner))
+        if path.startswith('/lol/match/v5/matches/'):
+            match_id = parts[-1]
+            return 'match-v5.match', self._fixture('match', **_match_values(match_id, self._match_owner))
+
+        if path.startswith('/lol/spectator/v5/active-games/by-summoner/'):
+            if random.random() >= self.config.in_game_rate:
+                return 'spectator-v5.active-game', None
+            return 'spectator-v5.active-game', self._fixture('active_game', puuid=parts[-1], platform=platform.upper(),
+                                                             game_id=_game_id(parts[-1]))
+        if path.startswith('/lol/spectator/v5/featured-games'):
+            return 'spectator-v5.featured-games', self._fixture('featured_games', puuid=_fake_puuid(platform),
+                                                                platform=platform.upper(), game_id=_game_id(platform))
+
+        return 'unknown', None
+
+    # ----- control endpoints -----
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        latencies = sorted(self._latencies)
+
+        def pct(p):
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000, 1) if latencies else 0.0
+
+        return web.json_response({
+            **self.stats,
+            'by_endpoint': self.by_endpoint,
+            'latency_ms': {'p50': pct(0.5), 'p95': pct(0.95), 'p99': pct(0.99)},
+            'config': asdict(self.config),
+        })
+
+    async def handle_config(self, request: web.Request) -> web.Response:
+        updates = await request.json()
+        known = {f.name: f.type for f in fields(StubConfig)}
+        for key, value in updates.items():
+            if key not in known:
+                return web.json_response({'error': f"unknown option {key}"}, status=400)
+            setattr(self.config, key, type(getattr(self.config, key))(value))
+        logger.info(f"🧪 Stub config updated: {updates}")
+        return web.json_response(asdict(self.config))
+
+    async def handle_reset(self, request: web.Request) -> web.Response:
+        self.stats = {key: 0 for key in self.stats}
+        self.by_endpoint.clear()
+        self._latencies.clear()
+        self._app_limits.clear()
+        self._method_limits.clear()
+        self._served = self._burst_left = 0
+        return web.json_response({'reset': True})
+
+
+def _fill(value, values: Dict[str, object]):
+    """Replace '{name}' placeholders in a fixture"""
+    if isinstance(value, dict):
+        return {k: _fill(v, values) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_fill(v, values) for v in value]
+    if isinstance(value, str) and '{' in value:
+        for name, replacement in values.items():
+            placeholder = '{' + name + '}'
+            if value == placeholder:
+                return replacement
+            value = value.replace(placeholder, str(replacement))
+    return value
+
+
+def _fake_puuid(seed: str) -> str:
+    digest = hashlib.sha256(seed.encode()).hexdigest()
+    return (digest + digest)[:78]
+
+
+def _home_platform(puuid: str) -> str:
+    # Stable "active shard" per fake player
+    platforms = list(ROUTING_PLATFORMS.values())
+    return platforms[int(hashlib.md5(puuid.encode()).hexdigest()[:8], 16) % len(platforms)]
+
+
+def _game_id(seed: str) -> int:
+    return 7000000000 + int(hashlib.md5(seed.encode()).hexdigest()[:8], 16) % 100000000
+
+
+def _match_values(match_id: str, owners: Dict[str, str]) -> Dict[str, object]:
+    platform, _, game_id = match_id.partition('_')
+    return {
+        'match_id': match_id,
+        'platform': platform,
+        'game_id': int(game_id) if game_id.isdigit() else _game_id(match_id),
+        'puuid': owners.get(match_id) or _fake_puuid(match_id),
+    }
+
+
+def create_app(config: Optional[StubConfig] = None, fixtures_dir: str = FIXTURES_DIR,
+               record_api_key: Optional[str] = None) -> web.Application:
+    stub = RiotStub(config, fixtures_dir, record_api_key)
+    app = web.Application()
+    app['stub'] = stub
+
+    async def _close(app):
+        await stub.close()
+
+    app.on_cleanup.append(_close)
+    app.router.add_get('/_stub/stats', stub.handle_stats)
+    app.router.add_post('/_stub/config', stub.handle_config)
+    app.router.add_post('/_stub/reset', stub.handle_reset)
+    app.router.add_get('/{host}/{path:.*}', stub.handle)
+    return app
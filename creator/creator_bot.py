@@ -11,7 +11,7 @@ import asyncio
 from datetime import datetime
 
 # Local modules (same folder)
-from creator_database import get_creator_db, get_all_creator_dbs, SPECIAL_CREATOR_GUILD_ID
+from creator_database import get_creator_db, get_all_creator_dbs, get_all_async_creator_dbs, SPECIAL_CREATOR_GUILD_ID
 from creator_scraper import RuneForgeScraper, DivineSkinsScraper
 
 # Logging setup
@@ -288,8 +288,9 @@ class CreatorBot(commands.Bot):
         logger.info("🔍 Checking for new mods/skins...")
         
         try:
-            for db in get_all_creator_dbs():
-                creators = db.get_all_creators()
+            # Async facades - scraping many creators must not hold the event loop on Postgres
+            for db in get_all_async_creator_dbs():
+                creators = await db.get_all_creators()
 
                 for creator in creators:
                     creator_id = creator['id']
@@ -556,7 +557,7 @@ class CreatorBot(commands.Bot):
     
     async def check_runeforge_updates(self, db, creator_id: int, guild_id: int, profile_url: str, discord_user_id: int):
         try:
-            if not db.get_creator_by_id(creator_id):
+            if not await db.get_creator_by_id(creator_id):
                 logger.warning("⚠️ Skipping RuneForge check; creator %s was removed", creator_id)
                 return
 
@@ -577,7 +578,7 @@ class CreatorBot(commands.Bot):
                 views = mod.get('views', 0)
                 downloads = mod.get('downloads', 0)
                 
-                existing = db.get_mod(creator_id, mod_id, 'runeforge')
+                existing = await db.get_mod(creator_id, mod_id, 'runeforge')
                 
                 if not existing:
                     await self.send_notification(
@@ -592,15 +593,15 @@ class CreatorBot(commands.Bot):
                         views,
                         downloads
                     )
-                    db.add_mod(creator_id, mod_id, mod_name, mod_url, updated_at, 'runeforge')
+                    await db.add_mod(creator_id, mod_id, mod_name, mod_url, updated_at, 'runeforge')
 
                     # Seed mod in every other guild row (same DB or other DBs) tracking
                     # this creator, so their monitoring loops won't re-notify.
-                    for seed_db in get_all_creator_dbs():
-                        for other_creator in seed_db.get_creators_by_user(discord_user_id, 'runeforge'):
+                    for seed_db in get_all_async_creator_dbs():
+                        for other_creator in await seed_db.get_creators_by_user(discord_user_id, 'runeforge'):
                             if other_creator['id'] == creator_id:
                                 continue
-                            seed_db.add_mod(other_creator['id'], mod_id, mod_name, mod_url, updated_at, 'runeforge')
+                            await seed_db.add_mod(other_creator['id'], mod_id, mod_name, mod_url, updated_at, 'runeforge')
 
                     # Send webhook notification for new mod
                     await self.send_webhook_notification(
@@ -616,7 +617,7 @@ class CreatorBot(commands.Bot):
                         downloads
                     )
                 elif existing['updated_at'] != updated_at:
-                    db.update_mod(creator_id, mod_id, updated_at, 'runeforge')
+                    await db.update_mod(creator_id, mod_id, updated_at, 'runeforge')
                     
         except Exception as e:
             logger.error("❌ Error checking RuneForge for %s: %s", profile_url, e)
@@ -624,7 +625,7 @@ class CreatorBot(commands.Bot):
     async def check_divineskins_updates(self, db, creator_id: int, guild_id: int, profile_url: str, discord_user_id: int):
         """[Not working for now] - DivineSkins requires JavaScript execution (CSR)"""
         try:
-            if not db.get_creator_by_id(creator_id):
+            if not await db.get_creator_by_id(creator_id):
                 logger.warning("⚠️ Skipping DivineSkins check; creator %s was removed", creator_id)
                 return
 
@@ -645,7 +646,7 @@ class CreatorBot(commands.Bot):
                 views = skin.get('views', 0)
                 downloads = skin.get('downloads', 0)
                 
-                existing = db.get_mod(creator_id, skin_id, 'divineskins')
+                existing = await db.get_mod(creator_id, skin_id, 'divineskins')
 
                 # Determine whether this skin was published before the cutoff
                 _DIVINESKINS_CUTOFF = datetime(2026, 5, 30)
@@ -660,12 +661,12 @@ class CreatorBot(commands.Bot):
                 if not existing:
                     if _is_old:
                         # Seed silently — skin existed before cutoff, no notification
-                        db.add_mod(creator_id, skin_id, skin_name, skin_url, updated_at, 'divineskins')
-                        for seed_db in get_all_creator_dbs():
-                            for other_creator in seed_db.get_creators_by_user(discord_user_id, 'divineskins'):
+                        await db.add_mod(creator_id, skin_id, skin_name, skin_url, updated_at, 'divineskins')
+                        for seed_db in get_all_async_creator_dbs():
+                            for other_creator in await seed_db.get_creators_by_user(discord_user_id, 'divineskins'):
                                 if other_creator['id'] == creator_id:
                                     continue
-                                seed_db.add_mod(other_creator['id'], skin_id, skin_name, skin_url, updated_at, 'divineskins')
+                                await seed_db.add_mod(other_creator['id'], skin_id, skin_name, skin_url, updated_at, 'divineskins')
                         continue
                     await self.send_notification(
                         db,
@@ -679,14 +680,14 @@ class CreatorBot(commands.Bot):
                         views,
                         downloads
                     )
-                    db.add_mod(creator_id, skin_id, skin_name, skin_url, updated_at, 'divineskins')
+                    await db.add_mod(creator_id, skin_id, skin_name, skin_url, updated_at, 'divineskins')
 
                     # Seed skin in every other guild row tracking this creator
-                    for seed_db in get_all_creator_dbs():
-                        for other_creator in seed_db.get_creators_by_user(discord_user_id, 'divineskins'):
+                    for seed_db in get_all_async_creator_dbs():
+                        for other_creator in await seed_db.get_creators_by_user(discord_user_id, 'divineskins'):
                             if other_creator['id'] == creator_id:
                                 continue
-                            seed_db.add_mod(other_creator['id'], skin_id, skin_name, skin_url, updated_at, 'divineskins')
+                            await seed_db.add_mod(other_creator['id'], skin_id, skin_name, skin_url, updated_at, 'divineskins')
 
                     # Send webhook notification for new skin
                     await self.send_webhook_notification(
@@ -702,7 +703,7 @@ class CreatorBot(commands.Bot):
                         downloads
                     )
                 elif existing['updated_at'] != updated_at:
-                    db.update_mod(creator_id, skin_id, updated_at, 'divineskins')
+                    await db.update_mod(creator_id, skin_id, updated_at, 'divineskins')
 
         except Exception as e:
             logger.error("❌ Error checking Divine Skins for %s: %s", profile_url, e)
@@ -711,9 +712,9 @@ class CreatorBot(commands.Bot):
         """Send webhook notifications to the source guild with creator info."""
         try:
             if guild_id is not None:
-                all_webhooks = db.get_guild_webhooks(guild_id)
+                all_webhooks = await db.get_guild_webhooks(guild_id)
             else:
-                all_webhooks = db.get_all_guild_webhooks()
+                all_webhooks = await db.get_all_guild_webhooks()
             
             if not all_webhooks:
                 logger.debug("ℹ️ No webhooks configured for guild %s", guild_id)
@@ -721,7 +722,7 @@ class CreatorBot(commands.Bot):
             
             # Fetch creator profile for avatar and additional info
             creator_avatar = None
-            creator_info = db.get_creator_by_id(creator_id)
+            creator_info = await db.get_creator_by_id(creator_id)
             if creator_info:
                 try:
                     platform_type = creator_info.get('platform', platform)
@@ -794,10 +795,10 @@ class CreatorBot(commands.Bot):
     async def send_notification(self, db, guild_id: int, discord_user_id: int, username: str, action: str, mod_name: str, mod_url: str, platform: str, views: int = 0, downloads: int = 0):
         try:
             if guild_id is not None:
-                guild_config = db.get_guild_config(guild_id)
+                guild_config = await db.get_guild_config(guild_id)
                 guild_configs = [guild_config] if guild_config else []
             else:
-                guild_configs = db.get_all_guild_configs()
+                guild_configs = await db.get_all_guild_configs()
 
             is_new_mod = 'posted new' in action.lower()
 
@@ -940,12 +941,12 @@ class CreatorBot(commands.Bot):
             # regardless of which DB detected the update first.
             if is_new_mod and not is_update:
                 mirrored_guilds = 0
-                for other_db in get_all_creator_dbs():
-                    for cfg in other_db.get_all_guild_configs():
+                for other_db in get_all_async_creator_dbs():
+                    for cfg in await other_db.get_all_guild_configs():
                         target_guild_id = cfg.get('guild_id')
                         if not target_guild_id or target_guild_id == guild_id:
                             continue
-                        if not other_db.has_creator_in_guild(target_guild_id, discord_user_id, platform):
+                        if not await other_db.has_creator_in_guild(target_guild_id, discord_user_id, platform):
                             continue
                         mirrored_guilds += 1
                         target_channel_id = cfg.get('new_mod_channel_id') or cfg.get('notification_channel_id') or NOTIFICATION_CHANNEL_ID
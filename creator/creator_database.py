@@ -6,13 +6,24 @@ PostgreSQL database with guild config, webhooks, and API key support
 import psycopg2
 from psycopg2.extras import RealDictCursor
 import os
+import sys
 import logging
 import hashlib
 import secrets
 from typing import Dict
 
+# Shared helpers live in <repo>/apis (async facade for the database)
+apis_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'apis'))
+if apis_dir not in sys.path:
+    sys.path.insert(0, apis_dir)
+
+from async_db import AsyncDatabase
+
 logger = logging.getLogger('creator_database')
 
+# CreatorDatabase shares one psycopg2 connection, so its queries are serialised on one thread
+CREATOR_DB_THREADS = int(os.getenv('CREATOR_DB_THREADS', '1'))
+
 DATABASE_URL = os.getenv('DATABASE_URL')
 SPECIAL_CREATOR_GUILD_ID = 1231167221330350111
 SPECIAL_GUILD_DATABASE_URL = os.getenv(f'CREATOR_DATABASE_URL_GUILD_{SPECIAL_CREATOR_GUILD_ID}')
@@ -812,3 +823,16 @@ def get_all_creator_dbs():
         if all(existing is not special_db for existing in databases):
             databases.append(special_db)
     return databases
+
+
+def get_async_creator_db(db: CreatorDatabase) -> AsyncDatabase:
+    """Async facade over a CreatorDatabase (same methods, awaited) - use from coroutines"""
+    adb = getattr(db, '_async_db', None)
+    if adb is None:
+        adb = AsyncDatabase(db, max_workers=CREATOR_DB_THREADS, name=f'creator:{db.label}')
+        db._async_db = adb
+    return adb
+
+
+def get_all_async_creator_dbs():
+    return [get_async_creator_db(db) for db in get_all_creator_dbs()]
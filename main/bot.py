@@ -105,6 +105,7 @@ import requests
 import json
 import datetime
 import random
+import time
 from bs4 import BeautifulSoup
 from difflib import SequenceMatcher
 from dotenv import load_dotenv
@@ -123,8 +124,10 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Import Orianna modules
-from database import initialize_database, get_db
-from riot_api import RiotAPI, load_champion_data
+from database import initialize_database, get_db, get_async_db
+from rank_events import RankEventListener
+from riot_api import (RiotAPI, load_champion_data, set_request_lane, set_request_caller, start_metrics_server,
+                     INTERACTIVE, BACKGROUND)
 from permissions import has_admin_permissions
 from emoji_dict import CHAMPION_EMOJIS, get_champion_emoji
 import profile_commands
@@ -178,6 +181,7 @@ GUILD_ID = 1153027935553454191  # Your server ID for slash commands
 # Global instances
 riot_api = None
 orianna_initialized = False
+rank_event_listener = None
 
 # ================================
 #        INTENTS
@@ -249,6 +253,12 @@ RANK_ROLES = {
     'UNRANKED': 1166294423567605811,
 }
 
+# Hourly rank/region role sweep: 'stored' (default) reads the best rank per user that worker.py
+# saved in user_ranks (one query for the whole guild), 'live' asks Riot for every verified account
+RANK_ROLE_SYNC_MODE = os.getenv('RANK_ROLE_SYNC_MODE', 'stored').lower()
+
+RANK_STATS_CHANNEL_ID = 1169498094308704286
+
 # Region Role Configuration
 REGION_ROLES = {
     'eune': 1166293788717764620,
@@ -678,8 +688,20 @@ class MyBot(commands.Bot):
         ]
         print("🤖 Bot instance created with extended timeouts for Railway")
 
+    async def close(self):
+        """Close pooled Riot API connections before shutting the bot down"""
+        if rank_event_listener:
+            await rank_event_listener.stop()
+        if riot_api:
+            try:
+                await riot_api.close()
+            except Exception as e:
+                print(f"⚠️ Error closing Riot API sessions: {e}")
+        await super().close()
+
     async def on_ready(self):
         """Called when bot successfully connects to Discord"""
+        global rank_event_listener
         print(f"✅ Bot connected as {self.user.name} (ID: {self.user.id})")
         print(f"✅ Connected to {len(self.guilds)} servers")
         print(f"✅ Bot is ready and online!")
@@ -698,6 +720,11 @@ class MyBot(commands.Bot):
         if not update_rank_stats_embed.is_running():
             update_rank_stats_embed.start()
             print("📊 Started rank stats embed update task (updates every 10 minutes)")
+        
+        # React to rank changes stored by worker.py instead of waiting for the next sweep
+        if rank_event_listener is None:
+            rank_event_listener = RankEventListener(DATABASE_URL, handle_rank_change_events)
+        rank_event_listener.start()
     
     async def on_member_join(self, member: discord.Member):
         """Automatically assign UNRANKED role to new members"""
@@ -770,6 +797,11 @@ class MyBot(commands.Bot):
                 # Create Riot API instance
                 riot_api = RiotAPI(RIOT_API_KEY)
                 self.riot_api = riot_api
+                if db:
+                    # Known puuid/Riot ID -> region survives restarts (riot_account_index table)
+                    riot_api.use_account_store(db)
+                # Plain-text Riot quota/latency metrics when RIOT_METRICS_PORT is set
+                self.riot_metrics_runner = await start_metrics_server(riot_api)
                 print("✅ Riot API instance created")
                 
                 # Load champion data from DDragon
@@ -844,6 +876,10 @@ class MyBot(commands.Bot):
         # Add global check for Orianna commands (channel restrictions)
         async def orianna_check(interaction: discord.Interaction) -> bool:
             """Check if command can be used in this channel"""
+            # Slash commands get the interactive Riot API lane (runs in the command's own task)
+            set_request_lane(INTERACTIVE)
+            set_request_caller(f"/{interaction.command.qualified_name}" if interaction.command else "interaction")
+            
             # Skip check for Loldle commands
             if interaction.command and interaction.command.name.startswith('loldle'):
                 return True
@@ -935,9 +971,14 @@ bot = MyBot()
 # ================================
 #        RANK ROLE MANAGEMENT
 # ================================
-async def update_user_rank_roles(user_id: int, guild_id: int = GUILD_ID):
+async def update_user_rank_roles(user_id: int, guild_id: int = GUILD_ID,
+                                 verified_accounts: Optional[list] = None,
+                                 ranks_by_account: Optional[dict] = None):
     """Update Discord roles based on League rank and regions
     
+    Bulk callers can pass the member's verified accounts and the prefetched
+    {(puuid, region): entries} ranks to skip the per-member database and Riot lookups.
+    
     Returns:
         bool: True if any changes were made, False if no changes needed
     """
@@ -952,48 +993,57 @@ async def update_user_rank_roles(user_id: int, guild_id: int = GUILD_ID):
         
         changes_made = False
         
-        db = get_db()
-        db_user = db.get_user_by_discord_id(user_id)
-        
         # Default rank for users without accounts
         highest_rank = 'UNRANKED'
         user_regions = set()
         
+        if verified_accounts is None:
+            # Queries run off the event loop so a slow database never stalls the gateway
+            adb = get_async_db()
+            db_user = await adb.get_user_by_discord_id(user_id)
+            accounts = await adb.get_user_accounts(db_user['id']) if db_user else []
+            verified_accounts = [a for a in accounts or [] if a.get('verified')]
+        
         # If user has linked accounts, check their rank
-        if db_user:
-            accounts = db.get_user_accounts(db_user['id'])
-            if accounts:
-                rank_priority = {
-                    'UNRANKED': -1, 'IRON': 0, 'BRONZE': 1, 'SILVER': 2, 'GOLD': 3,
-                    'PLATINUM': 4, 'EMERALD': 5, 'DIAMOND': 6,
-                    'MASTER': 7, 'GRANDMASTER': 8, 'CHALLENGER': 9
-                }
+        if verified_accounts:
+            rank_priority = {
+                'UNRANKED': -1, 'IRON': 0, 'BRONZE': 1, 'SILVER': 2, 'GOLD': 3,
+                'PLATINUM': 4, 'EMERALD': 5, 'DIAMOND': 6,
+                'MASTER': 7, 'GRANDMASTER': 8, 'CHALLENGER': 9
+            }
+            
+            if ranks_by_account is None:
+                # One batched lookup for every account (served from the rank cache when fresh)
+                try:
+                    ranks_by_account = await riot_api.get_ranked_stats_many(
+                        [(a['puuid'], a['region']) for a in verified_accounts]
+                    )
+                except Exception as e:
+                    print(f"⚠️ Error fetching ranks for user {user_id}: {e}")
+                    ranks_by_account = {}
+            
+            # Find highest rank across all verified accounts
+            for account in verified_accounts:
+                # Add region to set
+                region = account['region'].lower()
+                user_regions.add(region)
                 
-                # Find highest rank across all verified accounts
-                for account in accounts:
-                    if not account.get('verified'):
+                # Current rank from the batch
+                try:
+                    ranks = ranks_by_account.get((account['puuid'], account['region']))
+                    if not ranks:
                         continue
                     
-                    # Add region to set
-                    region = account['region'].lower()
-                    user_regions.add(region)
-                    
-                    # Fetch current rank
-                    try:
-                        ranks = await riot_api.get_ranked_stats_by_puuid(account['puuid'], account['region'])
-                        if not ranks:
-                            continue
-                        
-                        # Check Solo/Duo queue
-                        for rank_data in ranks:
-                            if 'SOLO' in rank_data.get('queueType', ''):
-                                tier = rank_data.get('tier', 'UNRANKED')
-                                if tier in rank_priority:
-                                    if rank_priority[tier] > rank_priority[highest_rank]:
-                                        highest_rank = tier
-                    except Exception as e:
-                        print(f"⚠️ Error fetching rank for {account['riot_id_game_name']}: {e}")
-                        continue
+                    # Check Solo/Duo queue
+                    for rank_data in ranks:
+                        if 'SOLO' in rank_data.get('queueType', ''):
+                            tier = rank_data.get('tier', 'UNRANKED')
+                            if tier in rank_priority:
+                                if rank_priority[tier] > rank_priority[highest_rank]:
+                                    highest_rank = tier
+                except Exception as e:
+                    print(f"⚠️ Error fetching rank for {account.get('riot_id_game_name', account['puuid'])}: {e}")
+                    continue
         
         # ===== UPDATE RANK ROLES =====
         # Check current rank role
@@ -1074,6 +1124,136 @@ async def update_user_rank_roles(user_id: int, guild_id: int = GUILD_ID):
         traceback.print_exc()
         return False
 
+def log_rank_change(member: discord.Member, old_rank: Optional[str], new_rank: Optional[str]):
+    """Print a promotion/demotion line for a member whose rank role changed"""
+    if old_rank == new_rank:
+        return
+    if old_rank is None:
+        print(f"📌 {member.name} assigned initial rank: {new_rank}")
+    elif new_rank == 'UNRANKED' and old_rank != 'UNRANKED':
+        print(f"📉 {member.name}: {old_rank} → {new_rank} (accounts removed or unranked)")
+    elif old_rank == 'UNRANKED' and new_rank != 'UNRANKED':
+        print(f"📈 {member.name}: {old_rank} → {new_rank} (ranked up!)")
+    else:
+        rank_priority = {
+            'IRON': 0, 'BRONZE': 1, 'SILVER': 2, 'GOLD': 3,
+            'PLATINUM': 4, 'EMERALD': 5, 'DIAMOND': 6,
+            'MASTER': 7, 'GRANDMASTER': 8, 'CHALLENGER': 9
+        }
+        if rank_priority.get(new_rank, -1) > rank_priority.get(old_rank, -1):
+            print(f"📈 {member.name}: {old_rank} → {new_rank} (promoted!)")
+        else:
+            print(f"📉 {member.name}: {old_rank} → {new_rank} (demoted)")
+
+async def sync_rank_roles_from_db(guild: discord.Guild, member_ids: Optional[set] = None) -> dict:
+    """Set rank/region roles from the ranks worker.py stored, without calling Riot
+    
+    One query loads every member's stored Solo/Duo tier and verified regions, the
+    wanted roles are worked out in memory and Discord is only called for members
+    whose role set differs. member_ids limits the sync to those members.
+    
+    Returns:
+        dict: counts of updated, skipped (already correct), unranked and errors
+    """
+    counts = {'updated': 0, 'skipped': 0, 'unranked': 0, 'errors': 0}
+    members = [m for m in guild.members if not m.bot and (member_ids is None or m.id in member_ids)]
+    if not members:
+        return counts
+    
+    snapshot = await get_async_db().get_rank_role_snapshot([m.id for m in members])
+    
+    rank_roles = {tier: guild.get_role(role_id) for tier, role_id in RANK_ROLES.items() if role_id}
+    rank_roles = {tier: role for tier, role in rank_roles.items() if role}
+    region_roles = {region: guild.get_role(role_id) for region, role_id in REGION_ROLES.items() if role_id}
+    region_roles = {region: role for region, role in region_roles.items() if role}
+    roles_by_id = {role.id: role for role in (*rank_roles.values(), *region_roles.values())}
+    rank_role_ids = {role.id for role in rank_roles.values()}
+    region_role_ids = {role.id for role in region_roles.values()}
+    
+    for member in members:
+        try:
+            member_role_ids = {role.id for role in member.roles}
+            old_rank = next((tier for tier, role in rank_roles.items() if role.id in member_role_ids), None)
+            
+            stored = snapshot.get(member.id)
+            regions = set()
+            if stored is None:
+                # No verified account
+                new_rank = 'UNRANKED'
+            else:
+                regions = set(stored['regions'])
+                tier = (stored['tier'] or '').upper()
+                if tier in RANK_ROLES:
+                    new_rank = tier
+                elif stored['tier'] is None and old_rank:
+                    # No Solo/Duo row yet (e.g. linked since the worker's last pass) - keep the current role
+                    new_rank = old_rank
+                else:
+                    new_rank = 'UNRANKED'
+            
+            managed = set(rank_role_ids)
+            wanted = {rank_roles[new_rank].id} if new_rank in rank_roles else set()
+            # Like update_user_rank_roles, region roles are left alone when there are no verified regions
+            if regions:
+                managed |= region_role_ids
+                wanted |= {region_roles[region].id for region in regions if region in region_roles}
+            
+            current = member_role_ids & managed
+            to_remove = [roles_by_id[role_id] for role_id in current - wanted]
+            to_add = [roles_by_id[role_id] for role_id in wanted - current]
+            
+            if new_rank == 'UNRANKED':
+                counts['unranked'] += 1
+            
+            if not to_remove and not to_add:
+                counts['skipped'] += 1
+                continue
+            
+            if to_remove:
+                await member.remove_roles(*to_remove, reason="Rank/region role sync")
+            if to_add:
+                await member.add_roles(*to_add, reason=f"League rank: {new_rank}")
+            counts['updated'] += 1
+            log_rank_change(member, old_rank, new_rank)
+        
+        except Exception as e:
+            print(f"⚠️ Error syncing roles for {member.name}: {e}")
+            counts['errors'] += 1
+    
+    return counts
+
+async def handle_rank_change_events(events: list):
+    """Refresh roles, rank leaderboards and the rank stats embed for users whose rank changed
+    
+    Called by RankEventListener with a batch of rank_change_events rows written by worker.py.
+    """
+    # Roles, leaderboards and rank stats all follow Solo/Duo only
+    discord_ids = {
+        event['snowflake'] for event in events
+        if event.get('snowflake') and event.get('queue') == 'RANKED_SOLO_5x5'
+    }
+    if not discord_ids:
+        return
+    
+    guild = bot.get_guild(GUILD_ID)
+    if guild:
+        # The events come from user_ranks, so roles are set from the stored rank in either
+        # sync mode - a Riot lookup could still be served the old rank from the rank cache
+        counts = await sync_rank_roles_from_db(guild, member_ids=discord_ids)
+        if counts['updated'] > 0:
+            help_cog = bot.get_cog('HelpCommands')
+            if help_cog:
+                await help_cog.update_rank_stats_embed(bot, GUILD_ID, RANK_STATS_CHANNEL_ID)
+    
+    leaderboard_cog = bot.get_cog('LeaderboardCommands')
+    if leaderboard_cog:
+        for lb_guild in bot.guilds:
+            if any(lb_guild.get_member(discord_id) for discord_id in discord_ids):
+                try:
+                    await leaderboard_cog.apply_rank_changes(lb_guild, discord_ids)
+                except Exception as e:
+                    logger.warning(f"⚠️ Failed to apply rank changes to leaderboard in guild {lb_guild.id}: {e}")
+
 # ================================
 #   AUTOMATIC RANK/REGION UPDATE
 # ================================
@@ -1120,6 +1300,9 @@ async def before_change_status():
 @tasks.loop(hours=1)
 async def auto_update_ranks():
     """Automatically update all members' rank and region roles every 1 hour"""
+    # Bulk refresh only uses Riot API capacity left over by commands
+    set_request_lane(BACKGROUND)
+    set_request_caller("auto_update_ranks")
     try:
         print("🔄 Starting automatic rank/region role update...")
         guild = bot.get_guild(GUILD_ID)
@@ -1127,12 +1310,40 @@ async def auto_update_ranks():
             print("⚠️ Guild not found")
             return
         
-        db = get_db()
+        if RANK_ROLE_SYNC_MODE == 'stored':
+            started = time.monotonic()
+            counts = await sync_rank_roles_from_db(guild)
+            print(f"✅ Auto-update complete in {time.monotonic() - started:.1f}s: {counts['updated']} changes, "
+                  f"{counts['skipped']} skipped (no changes), {counts['unranked']} unranked, {counts['errors']} errors")
+            return
+        
+        adb = get_async_db()
         updated_count = 0
         skipped_count = 0
         unranked_count = 0
         error_count = 0
         
+        # Every verified account in one query and every rank in one batch up front; the
+        # per-member updates below get both passed in, so a long role-edit loop never
+        # outlives the rank cache and re-asks Riot
+        accounts_by_member = None
+        ranks_by_account = None
+        try:
+            accounts_by_member = {}
+            for account in await adb.get_all_users_with_accounts():
+                accounts_by_member.setdefault(account['snowflake'], []).append(account)
+            member_ids = {member.id for member in guild.members if not member.bot}
+            pairs = [
+                (account['puuid'], account['region'])
+                for snowflake, accounts in accounts_by_member.items() if snowflake in member_ids
+                for account in accounts
+            ]
+            ranks_by_account = await riot_api.get_ranked_stats_many(pairs)
+        except Exception as e:
+            accounts_by_member = None
+            ranks_by_account = None
+            print(f"⚠️ Rank prefetch failed, falling back to per-member lookups: {e}")
+        
         # Process ALL guild members
         for member in guild.members:
             if member.bot:
@@ -1148,7 +1359,14 @@ async def auto_update_ranks():
                         break
                 
                 # Update roles (returns True if changes were made)
-                changed = await update_user_rank_roles(member.id, GUILD_ID)
+                if accounts_by_member is not None:
+                    changed = await update_user_rank_roles(
+                        member.id, GUILD_ID,
+                        verified_accounts=accounts_by_member.get(member.id, []),
+                        ranks_by_account=ranks_by_account,
+                    )
+                else:
+                    changed = await update_user_rank_roles(member.id, GUILD_ID)
                 
                 if not changed:
                     skipped_count += 1
@@ -1164,29 +1382,11 @@ async def auto_update_ranks():
                 
                 # Log rank changes (promotions/demotions)
                 if old_rank != new_rank:
-                    if old_rank is None:
-                        print(f"📌 {member.name} assigned initial rank: {new_rank}")
-                    elif new_rank == 'UNRANKED' and old_rank != 'UNRANKED':
-                        print(f"📉 {member.name}: {old_rank} → {new_rank} (accounts removed or unranked)")
-                    elif old_rank == 'UNRANKED' and new_rank != 'UNRANKED':
-                        print(f"📈 {member.name}: {old_rank} → {new_rank} (ranked up!)")
-                    else:
-                        rank_priority = {
-                            'IRON': 0, 'BRONZE': 1, 'SILVER': 2, 'GOLD': 3,
-                            'PLATINUM': 4, 'EMERALD': 5, 'DIAMOND': 6,
-                            'MASTER': 7, 'GRANDMASTER': 8, 'CHALLENGER': 9
-                        }
-                        if rank_priority.get(new_rank, -1) > rank_priority.get(old_rank, -1):
-                            print(f"📈 {member.name}: {old_rank} → {new_rank} (promoted!)")
-                        else:
-                            print(f"📉 {member.name}: {old_rank} → {new_rank} (demoted)")
+                    log_rank_change(member, old_rank, new_rank)
                     updated_count += 1
                 
                 if new_rank == 'UNRANKED':
                     unranked_count += 1
-                
-                # Small delay to avoid rate limits
-                await asyncio.sleep(0.5)
             
             except Exception as e:
                 print(f"⚠️ Error updating {member.name}: {e}")
@@ -1218,15 +1418,13 @@ async def update_rank_stats_embed():
             logger.warning("❌ Guild not found for rank stats update")
             return
         
-        channel_id = 1169498094308704286  # Rank stats channel
-        
         # Get help commands cog to use the method
         help_cog = bot.get_cog('HelpCommands')
         if not help_cog:
             logger.warning("❌ HelpCommands cog not found")
             return
         
-        await help_cog.update_rank_stats_embed(bot, GUILD_ID, channel_id)
+        await help_cog.update_rank_stats_embed(bot, GUILD_ID, RANK_STATS_CHANNEL_ID)
         logger.debug("✅ Rank stats embed updated")
     
     except Exception as e:
@@ -1421,8 +1619,13 @@ async def invite(interaction: discord.Interaction, user: discord.Member):
 # ================================
 # Updated: Custom emoji support for RuneForge tags
 @bot.tree.command(name="diagnose", description="Check RuneForge system configuration and status", guild=discord.Object(id=GUILD_ID))
-async def diagnose(interaction: discord.Interaction):
+@app_commands.describe(riot="Show Riot API quota, latency and cache telemetry instead (Admin only)")
+async def diagnose(interaction: discord.Interaction, riot: bool = False):
     """Diagnostic command to check RuneForge integration"""
+    if riot:
+        await diagnose_riot_api(interaction)
+        return
+
     await interaction.response.defer()
     
     embed = discord.Embed(
@@ -1504,6 +1707,83 @@ async def diagnose(interaction: discord.Interaction):
     
     await interaction.edit_original_response(embed=embed)
 
+async def diagnose_riot_api(interaction: discord.Interaction):
+    """/diagnose riot:True - Riot API quota consumption by feature"""
+    if not has_admin_permissions(interaction):
+        await interaction.response.send_message(
+            "❌ You need Administrator permission or Admin role to use this command!",
+            ephemeral=True
+        )
+        return
+
+    riot_api = getattr(bot, 'riot_api', None)
+    if riot_api is None:
+        await interaction.response.send_message("❌ Riot API is not initialized", ephemeral=True)
+        return
+
+    summary = riot_api.get_telemetry_summary()
+    stats = riot_api.get_request_stats()
+
+    def _ms(value):
+        return f"{value}ms" if value is not None else ">10s"
+
+    embed = discord.Embed(
+        title="📈 Riot API Telemetry",
+        description=(
+            f"Requests: **{summary['requests']}** ({summary['requests_per_minute']}/min over {summary['uptime_seconds'] // 60} min)\n"
+            f"429s: **{summary['rate_limited']}** • Retries: **{summary['retries']}** • Errors: **{summary['errors']}**\n"
+            f"Coalesced: **{summary['coalesced']}** • Circuit fast-fails: **{summary['fast_fails']}**"
+        ),
+        color=0x0099FF
+    )
+
+    callers = "\n".join(
+        f"`{row['name'][:28]}` {row['requests']} req • p50 {_ms(row['p50_ms'])} • p95 {_ms(row['p95_ms'])}"
+        for row in summary['callers']
+    )
+    embed.add_field(name="👥 By feature", value=callers or "No requests yet", inline=False)
+
+    endpoints = "\n".join(
+        f"`{row['name'][:28]}` {row['requests']} req • avg {row['avg_ms']}ms • p95 {_ms(row['p95_ms'])}"
+        for row in summary['endpoints']
+    )
+    embed.add_field(name="🔗 By endpoint", value=endpoints or "No requests yet", inline=False)
+
+    # Fullest app-limit window per host
+    quota_lines = []
+    for host, scopes in sorted(summary['quota'].items()):
+        windows = scopes.get('app') or []
+        if not windows:
+            continue
+        fullest = max(windows, key=lambda w: w['used'] / w['limit'] if w['limit'] else 0)
+        quota_lines.append(f"`{host.split('.')[0]}` {fullest['used']}/{fullest['limit']} per {fullest['seconds']}s")
+    embed.add_field(name="📊 App quota (this process)", value="\n".join(quota_lines[:10]) or "No requests yet", inline=False)
+
+    match_cache = stats.get('match_cache', {})
+    rank_cache = stats.get('rank_cache', {})
+    account_index = stats.get('account_index', {})
+    embed.add_field(
+        name="💾 Caches",
+        value=(
+            f"Matches: {match_cache.get('memory_hits', 0) + match_cache.get('disk_hits', 0)} hits / {match_cache.get('misses', 0)} misses\n"
+            f"Ranks: {rank_cache.get('hits', 0)} hits / {rank_cache.get('misses', 0)} misses\n"
+            f"Accounts: {account_index.get('platform_hits', 0) + account_index.get('riot_id_hits', 0)} hits / "
+            f"{account_index.get('platform_misses', 0) + account_index.get('riot_id_misses', 0)} misses"
+        ),
+        inline=False
+    )
+
+    open_circuits = stats.get('circuit_breakers', {}).get('not_closed', {})
+    if open_circuits:
+        embed.add_field(
+            name="🔌 Open circuits",
+            value="\n".join(f"`{name}` {info['state']}" for name, info in list(open_circuits.items())[:10]),
+            inline=False
+        )
+
+    embed.set_footer(text="Live metrics: GET /metrics when RIOT_METRICS_PORT is set")
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
 # ================================
 #        ADMIN COMMANDS
 # ================================
@@ -1575,11 +1855,11 @@ async def update_mastery(interaction: discord.Interaction):
     
     try:
         from database import get_db
-        from riot_api import RiotAPI
-        import os
         
         db = get_db()
-        riot_api = RiotAPI(os.getenv('RIOT_API_KEY'))
+        if not riot_api:
+            await interaction.followup.send("❌ Riot API not initialized", ephemeral=True)
+            return
         
         # Get all users with linked accounts
         conn = db.get_connection()
@@ -1619,19 +1899,7 @@ async def update_mastery(interaction: discord.Interaction):
                 
                 if mastery_data and len(mastery_data) > 0:
                     # Update in database
-                    for champ in mastery_data:
-                        try:
-                            db.update_champion_mastery(
-                                user_id,
-                                champ['championId'],
-                                champ['championPoints'],
-                                champ['championLevel'],
-                                champ.get('chestGranted', False),
-                                champ.get('tokensEarned', 0),
-                                champ.get('lastPlayTime', 0)
-                            )
-                        except Exception as e:
-                            print(f"⚠️ Error updating champion {champ['championId']} for user {snowflake}: {e}")
+                    db.bulk_update_champion_mastery(user_id, mastery_data, record_deltas=False)
                     updated += 1
                     print(f"✅ Updated mastery for user {snowflake} ({len(mastery_data)} champions)")
                 else:
@@ -1702,41 +1970,48 @@ async def update_ranks(interaction: discord.Interaction):
         unranked_count = 0
         error_count = 0
         
-        for member in guild.members:
-            if member.bot:
-                continue
-            
-            try:
-                # Update roles (returns True if changes were made)
-                changed = await update_user_rank_roles(member.id, guild.id)
+        if RANK_ROLE_SYNC_MODE == 'stored':
+            counts = await sync_rank_roles_from_db(guild)
+            updated_count = counts['updated']
+            skipped_count = counts['skipped']
+            unranked_count = counts['unranked']
+            error_count = counts['errors']
+        else:
+            for member in guild.members:
+                if member.bot:
+                    continue
                 
-                if not changed:
-                    skipped_count += 1
-                    # Still count unranked even if no change
+                try:
+                    # Update roles (returns True if changes were made)
+                    changed = await update_user_rank_roles(member.id, guild.id)
+                    
+                    if not changed:
+                        skipped_count += 1
+                        # Still count unranked even if no change
+                        for tier, role_id in RANK_ROLES.items():
+                            if tier == 'UNRANKED':
+                                role = guild.get_role(role_id)
+                                if role and role in member.roles:
+                                    unranked_count += 1
+                                break
+                        continue
+                    
+                    updated_count += 1
+                    
+                    # Get new rank
+                    new_rank = None
                     for tier, role_id in RANK_ROLES.items():
-                        if tier == 'UNRANKED':
-                            role = guild.get_role(role_id)
-                            if role and role in member.roles:
-                                unranked_count += 1
+                        role = guild.get_role(role_id)
+                        if role and role in member.roles:
+                            new_rank = tier
                             break
-                    continue
-                
-                updated_count += 1
-                
-                # Get new rank
-                new_rank = None
-                for tier, role_id in RANK_ROLES.items():
-                    role = guild.get_role(role_id)
-                    if role and role in member.roles:
-                        new_rank = tier
-                        break
-                
-                if new_rank == 'UNRANKED':
-                    unranked_count += 1
-                
-            except Exception as e:
-                error_count += 1
-                logging.error(f"Failed to update rank roles for {member.id}: {e}")
+                    
+                    if new_rank == 'UNRANKED':
+                        unranked_count += 1
+                    
+                except Exception as e:
+                    error_count += 1
+                    logging.error(f"Failed to update rank roles for {member.id}: {e}")
         
         embed = discord.Embed(
             title="✅ Rank Roles Updated",
@@ -6,16 +6,66 @@ Handles PostgreSQL connection and queries
 import os
 import time
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 from psycopg2 import pool
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import logging
 import json
+import sys
 import threading
 
+# Shared helpers live in <repo>/apis (async facade for the database)
+apis_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'apis'))
+if apis_dir not in sys.path:
+    sys.path.insert(0, apis_dir)
+
+from async_db import AsyncDatabase
+
 logger = logging.getLogger('database')
 
+TIER_VALUES = {
+    'IRON': 0, 'BRONZE': 1, 'SILVER': 2, 'GOLD': 3, 'PLATINUM': 4,
+    'EMERALD': 5, 'DIAMOND': 6, 'MASTER': 7, 'GRANDMASTER': 8, 'CHALLENGER': 9
+}
+DIVISION_VALUES = {'I': 4, 'II': 3, 'III': 2, 'IV': 1}
+
+# NOTIFY channel for rows added to rank_change_events (see rank_events.py)
+RANK_EVENTS_CHANNEL = 'rank_changes'
+
+
+def rank_ordinal(tier: Optional[str], rank: Optional[str], lp: Optional[int]) -> int:
+    """Sortable rank: tier*10000 + division*1000 + LP (apex tiers count as division I, unranked is negative)"""
+    tier = (tier or '').upper()
+    tier_value = TIER_VALUES.get(tier, -1)
+    if tier in ('MASTER', 'GRANDMASTER', 'CHALLENGER'):
+        division_value = 4
+    else:
+        division_value = DIVISION_VALUES.get((rank or '').upper(), 0)
+    return tier_value * 10000 + division_value * 1000 + int(lp or 0)
+
+
+def best_ranked_entries(entry_lists) -> List[Dict]:
+    """Highest league-v4 entry per queueType across several accounts' entries.
+
+    user_ranks keeps one row per (user, queue, season), so callers with several
+    verified accounts store this instead of writing each account in turn.
+    """
+    best = {}
+    for entries in entry_lists:
+        for entry in entries or []:
+            queue = entry.get('queueType')
+            if not queue:
+                continue
+            current = best.get(queue)
+            if current is None or (
+                rank_ordinal(entry.get('tier'), entry.get('rank'), entry.get('leaguePoints'))
+                > rank_ordinal(current.get('tier'), current.get('rank'), current.get('leaguePoints'))
+            ):
+                best[queue] = entry
+    return list(best.values())
+
+
 class Database:
     def __init__(self, database_url: str):
         self.database_url = database_url
@@ -238,6 +288,63 @@ class Database:
                     logger.warning(f"⚠️ Team migration already applied or error: {migration_error}")
                     conn.rollback()
 
+                # Run rank ordinal migration (sortable rank kept on user_ranks for leaderboards)
+                try:
+                    cur.execute("ALTER TABLE user_ranks ADD COLUMN IF NOT EXISTS rank_ordinal INTEGER")
+                    cur.execute("""
+                        UPDATE user_ranks SET rank_ordinal =
+                            (CASE tier
+                                WHEN 'CHALLENGER' THEN 9 WHEN 'GRANDMASTER' THEN 8 WHEN 'MASTER' THEN 7
+                                WHEN 'DIAMOND' THEN 6 WHEN 'EMERALD' THEN 5 WHEN 'PLATINUM' THEN 4
+                                WHEN 'GOLD' THEN 3 WHEN 'SILVER' THEN 2 WHEN 'BRONZE' THEN 1
+                                WHEN 'IRON' THEN 0 ELSE -1
+                            END) * 10000
+                            + (CASE
+                                WHEN tier IN ('MASTER', 'GRANDMASTER', 'CHALLENGER') THEN 4
+                                WHEN rank = 'I' THEN 4 WHEN rank = 'II' THEN 3
+                                WHEN rank = 'III' THEN 2 WHEN rank = 'IV' THEN 1 ELSE 0
+                            END) * 1000
+                            + COALESCE(league_points, 0)
+                        WHERE rank_ordinal IS NULL
+                    """)
+                    cur.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_ranks_queue_ordinal
+                        ON user_ranks(queue, rank_ordinal DESC)
+                    """)
+                    conn.commit()
+                    logger.info("✅ Rank ordinal migration applied")
+                except Exception as migration_error:
+                    logger.warning(f"⚠️ Rank ordinal migration already applied or error: {migration_error}")
+                    conn.rollback()
+
+                # Run rank change outbox migration (written by update_ranked_stats, drained by the bot)
+                try:
+                    cur.execute("""
+                        CREATE TABLE IF NOT EXISTS rank_change_events (
+                            id BIGSERIAL PRIMARY KEY,
+                            user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+                            snowflake BIGINT NOT NULL,
+                            queue VARCHAR(50) NOT NULL,
+                            old_tier VARCHAR(20),
+                            old_rank VARCHAR(5),
+                            old_lp INTEGER,
+                            new_tier VARCHAR(20),
+                            new_rank VARCHAR(5),
+                            new_lp INTEGER,
+                            created_at TIMESTAMP DEFAULT NOW(),
+                            consumed_at TIMESTAMP
+                        )
+                    """)
+                    cur.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_rank_events_pending
+                        ON rank_change_events(id) WHERE consumed_at IS NULL
+                    """)
+                    conn.commit()
+                    logger.info("✅ Rank change events migration applied")
+                except Exception as migration_error:
+                    logger.warning(f"⚠️ Rank change events migration already applied or error: {migration_error}")
+                    conn.rollback()
+
         except Exception as e:
             conn.rollback()
             logger.error(f"❌ Error creating tables: {e}")
@@ -907,6 +1014,75 @@ class Database:
         finally:
             self.return_connection(conn)
     
+    def bulk_update_champion_mastery(self, user_id: int, masteries: List[Dict],
+                                     record_deltas: bool = True) -> Tuple[int, int]:
+        """Upsert a whole champion-mastery-v4 list in one statement
+
+        masteries are Riot's entries (championId, championPoints, championLevel, ...).
+        With record_deltas, point gains are written to user_mastery_delta by the same
+        statement, compared against the stored scores in its snapshot.
+        Returns (champions upserted, deltas recorded).
+        """
+        rows = [
+            (user_id, m['championId'], m['championPoints'], m['championLevel'],
+             m.get('chestGranted', False), m.get('tokensEarned', 0), m.get('lastPlayTime'))
+            for m in masteries
+        ]
+        if not rows:
+            return 0, 0
+
+        upsert = """
+            INSERT INTO user_champion_stats
+            (user_id, champion_id, score, level, chest_granted, tokens_earned, last_play_time)
+            SELECT user_id, champion_id, score, level, chest_granted, tokens_earned, last_play_time
+            FROM incoming
+            ON CONFLICT (user_id, champion_id) DO UPDATE SET
+                score = EXCLUDED.score,
+                level = EXCLUDED.level,
+                chest_granted = EXCLUDED.chest_granted,
+                tokens_earned = EXCLUDED.tokens_earned,
+                last_play_time = EXCLUDED.last_play_time,
+                last_updated = NOW()
+        """
+        incoming = """
+            WITH incoming (user_id, champion_id, score, level, chest_granted, tokens_earned, last_play_time) AS (
+                VALUES %s
+            )
+        """
+        if record_deltas:
+            query = incoming + f"""
+                , previous AS (
+                    SELECT s.champion_id, s.score
+                    FROM user_champion_stats s
+                    JOIN incoming i ON s.user_id = i.user_id AND s.champion_id = i.champion_id
+                ),
+                upserted AS ({upsert})
+                INSERT INTO user_mastery_delta (user_id, champion_id, delta, value)
+                SELECT i.user_id, i.champion_id, i.score - COALESCE(p.score, 0), i.score
+                FROM incoming i
+                LEFT JOIN previous p ON p.champion_id = i.champion_id
+                WHERE i.score - COALESCE(p.score, 0) > 0
+                RETURNING champion_id
+            """
+        else:
+            query = incoming + upsert
+
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                deltas = execute_values(
+                    cur, query, rows,
+                    template="(%s::int, %s::int, %s::int, %s::int, %s::boolean, %s::int, %s::bigint)",
+                    page_size=len(rows), fetch=record_deltas
+                )
+                conn.commit()
+                return len(rows), len(deltas) if record_deltas else 0
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.return_connection(conn)
+    
     def get_user_champion_stats(self, user_id: int, champion_id: Optional[int] = None) -> List[Dict]:
         """Get champion stats for a user"""
         conn = self.get_connection()
@@ -961,28 +1137,103 @@ class Database:
     
     def update_ranked_stats(self, user_id: int, queue: str, tier: str, rank: str,
                            lp: int, wins: int, losses: int, hot_streak: bool = False,
-                           veteran: bool = False, fresh_blood: bool = False, season: str = '15'):
-        """Update ranked statistics"""
+                           veteran: bool = False, fresh_blood: bool = False, season: str = '15') -> bool:
+        """Update ranked statistics
+        
+        When tier, division or LP differ from the stored row, a rank_change_events
+        row is written in the same statement and NOTIFY rank_changes wakes the bot.
+        The row is per user, so callers store the user's best entry across their
+        accounts (best_ranked_entries()) - writing accounts one by one would turn
+        every pass into a run of false rank changes.
+        Returns True when the rank changed.
+        """
         conn = self.get_connection()
         try:
             with conn.cursor() as cur:
                 cur.execute("""
-                    INSERT INTO user_ranks 
-                    (user_id, queue, tier, rank, league_points, wins, losses, 
-                     hot_streak, veteran, fresh_blood, season)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (user_id, queue, season) DO UPDATE SET
-                        tier = EXCLUDED.tier,
-                        rank = EXCLUDED.rank,
-                        league_points = EXCLUDED.league_points,
-                        wins = EXCLUDED.wins,
-                        losses = EXCLUDED.losses,
-                        hot_streak = EXCLUDED.hot_streak,
-                        veteran = EXCLUDED.veteran,
-                        fresh_blood = EXCLUDED.fresh_blood,
-                        last_updated = NOW()
-                """, (user_id, queue, tier, rank, lp, wins, losses, hot_streak, veteran, fresh_blood, season))
+                    WITH previous AS (
+                        SELECT tier, rank, league_points FROM user_ranks
+                        WHERE user_id = %(user_id)s AND queue = %(queue)s AND season = %(season)s
+                    ),
+                    upserted AS (
+                        INSERT INTO user_ranks 
+                        (user_id, queue, tier, rank, league_points, wins, losses, 
+                         hot_streak, veteran, fresh_blood, season, rank_ordinal)
+                        VALUES (%(user_id)s, %(queue)s, %(tier)s, %(rank)s, %(lp)s, %(wins)s, %(losses)s,
+                                %(hot_streak)s, %(veteran)s, %(fresh_blood)s, %(season)s, %(ordinal)s)
+                        ON CONFLICT (user_id, queue, season) DO UPDATE SET
+                            tier = EXCLUDED.tier,
+                            rank = EXCLUDED.rank,
+                            league_points = EXCLUDED.league_points,
+                            wins = EXCLUDED.wins,
+                            losses = EXCLUDED.losses,
+                            hot_streak = EXCLUDED.hot_streak,
+                            veteran = EXCLUDED.veteran,
+                            fresh_blood = EXCLUDED.fresh_blood,
+                            rank_ordinal = EXCLUDED.rank_ordinal,
+                            last_updated = NOW()
+                        RETURNING tier, rank, league_points
+                    )
+                    INSERT INTO rank_change_events
+                        (user_id, snowflake, queue, old_tier, old_rank, old_lp, new_tier, new_rank, new_lp)
+                    SELECT %(user_id)s, u.snowflake, %(queue)s, p.tier, p.rank, p.league_points,
+                           up.tier, up.rank, up.league_points
+                    FROM upserted up
+                    JOIN users u ON u.id = %(user_id)s
+                    LEFT JOIN previous p ON TRUE
+                    WHERE p.tier IS DISTINCT FROM up.tier
+                       OR p.rank IS DISTINCT FROM up.rank
+                       OR p.league_points IS DISTINCT FROM up.league_points
+                    RETURNING snowflake
+                """, {
+                    'user_id': user_id, 'queue': queue, 'tier': tier, 'rank': rank, 'lp': lp,
+                    'wins': wins, 'losses': losses, 'hot_streak': hot_streak, 'veteran': veteran,
+                    'fresh_blood': fresh_blood, 'season': season, 'ordinal': rank_ordinal(tier, rank, lp),
+                })
+                event = cur.fetchone()
+                if event:
+                    # Delivered on commit
+                    cur.execute("SELECT pg_notify(%s, %s)", (RANK_EVENTS_CHANNEL, str(event[0])))
                 conn.commit()
+                return event is not None
+        finally:
+            self.return_connection(conn)
+
+    def claim_rank_change_events(self, limit: int = 500) -> List[Dict]:
+        """Take the oldest unconsumed rank change events (marked consumed in the same statement)"""
+        conn = self.get_connection()
+        try:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute("""
+                    UPDATE rank_change_events SET consumed_at = NOW()
+                    WHERE id IN (
+                        SELECT id FROM rank_change_events
+                        WHERE consumed_at IS NULL
+                        ORDER BY id
+                        LIMIT %s
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING id, user_id, snowflake, queue, old_tier, old_rank, old_lp,
+                              new_tier, new_rank, new_lp, created_at
+                """, (limit,))
+                events = cur.fetchall()
+                conn.commit()
+                return sorted(events, key=lambda e: e['id'])
+        finally:
+            self.return_connection(conn)
+
+    def prune_rank_change_events(self, days: int = 7) -> int:
+        """Delete consumed rank change events older than `days`"""
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    DELETE FROM rank_change_events
+                    WHERE consumed_at IS NOT NULL AND consumed_at < NOW() - make_interval(days => %s)
+                """, (days,))
+                deleted = cur.rowcount
+                conn.commit()
+                return deleted
         finally:
             self.return_connection(conn)
     
@@ -1265,103 +1516,55 @@ class Database:
     
     def get_rank_leaderboard(self, guild_id: Optional[int] = None, 
                             queue: str = 'RANKED_SOLO_5x5', limit: int = 10) -> List[Dict]:
-        """Get top ranked players - shows best rank per user with their summoner name"""
+        """Get top ranked players - shows best rank per user with their summoner name
+
+        Walks idx_ranks_queue_ordinal from the top and stops after `limit` users,
+        skipping rows where the same user has a better (or equal, older id) entry.
+        """
         conn = self.get_connection()
         try:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                # Build query with optional guild filter
-                guild_join = ""
                 guild_where = ""
                 params = [queue]
                 
                 if guild_id:
-                    guild_join = "JOIN guild_members gm ON u.id = gm.user_id"
-                    guild_where = "AND gm.guild_id = %s"
+                    guild_where = """AND EXISTS (
+                        SELECT 1 FROM guild_members gm
+                        WHERE gm.user_id = ur.user_id AND gm.guild_id = %s
+                    )"""
                     params.append(guild_id)
                 
                 params.append(limit)
                 
                 query = f"""
-                    WITH user_best_ranks AS (
-                        SELECT 
-                            ur.user_id,
-                            ur.tier,
-                            ur.rank,
-                            ur.league_points,
-                            ur.wins,
-                            ur.losses,
-                            CASE ur.tier
-                                WHEN 'CHALLENGER' THEN 9
-                                WHEN 'GRANDMASTER' THEN 8
-                                WHEN 'MASTER' THEN 7
-                                WHEN 'DIAMOND' THEN 6
-                                WHEN 'EMERALD' THEN 5
-                                WHEN 'PLATINUM' THEN 4
-                                WHEN 'GOLD' THEN 3
-                                WHEN 'SILVER' THEN 2
-                                WHEN 'BRONZE' THEN 1
-                                WHEN 'IRON' THEN 0
-                                ELSE -1
-                            END as tier_value,
-                            CASE ur.rank
-                                WHEN 'I' THEN 4
-                                WHEN 'II' THEN 3
-                                WHEN 'III' THEN 2
-                                WHEN 'IV' THEN 1
-                                ELSE 0
-                            END as rank_value,
-                            ROW_NUMBER() OVER (
-                                PARTITION BY ur.user_id 
-                                ORDER BY 
-                                    CASE ur.tier
-                                        WHEN 'CHALLENGER' THEN 9
-                                        WHEN 'GRANDMASTER' THEN 8
-                                        WHEN 'MASTER' THEN 7
-                                        WHEN 'DIAMOND' THEN 6
-                                        WHEN 'EMERALD' THEN 5
-                                        WHEN 'PLATINUM' THEN 4
-                                        WHEN 'GOLD' THEN 3
-                                        WHEN 'SILVER' THEN 2
-                                        WHEN 'BRONZE' THEN 1
-                                        WHEN 'IRON' THEN 0
-                                        ELSE -1
-                                    END DESC,
-                                    CASE ur.rank
-                                        WHEN 'I' THEN 4
-                                        WHEN 'II' THEN 3
-                                        WHEN 'III' THEN 2
-                                        WHEN 'IV' THEN 1
-                                        ELSE 0
-                                    END DESC,
-                                    ur.league_points DESC
-                            ) as rn
-                        FROM user_ranks ur
-                        WHERE ur.queue = %s
-                    )
                     SELECT 
                         u.snowflake,
-                        ubr.tier,
-                        ubr.rank,
-                        ubr.league_points,
-                        ubr.wins,
-                        ubr.losses,
+                        ur.tier,
+                        ur.rank,
+                        ur.league_points,
+                        ur.wins,
+                        ur.losses,
                         la.riot_id_game_name,
                         la.riot_id_tagline
-                    FROM user_best_ranks ubr
-                    JOIN users u ON ubr.user_id = u.id
-                    {guild_join}
-                    LEFT JOIN league_accounts la ON u.id = la.user_id 
-                        AND (la.primary_account = TRUE OR la.id = (
-                            SELECT id FROM league_accounts 
-                            WHERE user_id = u.id 
-                            ORDER BY primary_account DESC, id ASC 
-                            LIMIT 1
-                        ))
-                    WHERE ubr.rn = 1 {guild_where}
-                    ORDER BY 
-                        ubr.tier_value DESC,
-                        ubr.rank_value DESC,
-                        ubr.league_points DESC
+                    FROM user_ranks ur
+                    JOIN users u ON ur.user_id = u.id
+                    LEFT JOIN LATERAL (
+                        SELECT riot_id_game_name, riot_id_tagline
+                        FROM league_accounts
+                        WHERE user_id = u.id
+                        ORDER BY primary_account DESC, id ASC
+                        LIMIT 1
+                    ) la ON TRUE
+                    WHERE ur.queue = %s
+                        AND NOT EXISTS (
+                            SELECT 1 FROM user_ranks better
+                            WHERE better.user_id = ur.user_id
+                                AND better.queue = ur.queue
+                                AND (better.rank_ordinal > ur.rank_ordinal
+                                     OR (better.rank_ordinal = ur.rank_ordinal AND better.id < ur.id))
+                        )
+                        {guild_where}
+                    ORDER BY ur.rank_ordinal DESC
                     LIMIT %s
                 """
                 
@@ -1891,7 +2094,40 @@ class Database:
                 return cur.fetchall()
         finally:
             self.return_connection(conn)
-    
+
+    def get_rank_role_snapshot(self, snowflakes: List[int]) -> Dict[int, Dict]:
+        """Stored Solo/Duo tier and regions of every given Discord user with a verified account.
+
+        One query for the whole guild: tier is the latest RANKED_SOLO_5x5 row the
+        worker wrote - the best of the user's verified accounts, see
+        best_ranked_entries() - (None when it has none yet), regions are the lowercase regions
+        of the verified accounts. Users without a verified account are left out.
+        Returns {snowflake: {'tier': str | None, 'regions': [str]}}.
+        """
+        if not snowflakes:
+            return {}
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT u.snowflake,
+                           array_agg(DISTINCT lower(la.region)) AS regions,
+                           solo.tier
+                    FROM users u
+                    JOIN league_accounts la ON la.user_id = u.id AND la.verified = TRUE
+                    LEFT JOIN LATERAL (
+                        SELECT ur.tier FROM user_ranks ur
+                        WHERE ur.user_id = u.id AND ur.queue = 'RANKED_SOLO_5x5'
+                        ORDER BY ur.last_updated DESC NULLS LAST
+                        LIMIT 1
+                    ) solo ON TRUE
+                    WHERE u.snowflake = ANY(%s::bigint[])
+                    GROUP BY u.snowflake, solo.tier
+                """, (list(snowflakes),))
+                return {row[0]: {'tier': row[2], 'regions': list(row[1] or [])} for row in cur.fetchall()}
+        finally:
+            self.return_connection(conn)
+
     # ==================== HELP EMBED OPERATIONS ====================
     
     def save_help_embed(self, guild_id: int, channel_id: int, message_id: int):
@@ -2460,6 +2696,17 @@ def get_db() -> Database:
     return db
 
 
+# Async twin of the global database (same methods, awaited, run off the event loop)
+async_db = None
+
+def get_async_db() -> AsyncDatabase:
+    """Get the async facade over the global database - use from coroutines"""
+    global async_db
+    if async_db is None or async_db.db is not get_db():
+        async_db = AsyncDatabase(get_db(), name='main')
+    return async_db
+
+
 # ==================== PRO STATS OPERATIONS ====================
 
 class ProStatsDatabase:
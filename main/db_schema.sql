@@ -68,6 +68,7 @@ CREATE TABLE IF NOT EXISTS user_ranks (
     fresh_blood BOOLEAN DEFAULT FALSE,
     inactive BOOLEAN DEFAULT FALSE,
     season VARCHAR(10) DEFAULT '15',   -- Season identifier (e.g., '15', '16', etc)
+    rank_ordinal INTEGER,              -- tier*10000 + division*1000 + LP, set by update_ranked_stats
     last_updated TIMESTAMP DEFAULT NOW(),
     UNIQUE(user_id, queue, season)
 );
@@ -86,6 +87,23 @@ CREATE TABLE IF NOT EXISTS ranked_progress_snapshots (
     snapshot_at TIMESTAMP DEFAULT NOW()
 );
 
+-- Rank change outbox: one row per tier/division/LP change written by update_ranked_stats,
+-- drained by the main bot (NOTIFY rank_changes wakes it up)
+CREATE TABLE IF NOT EXISTS rank_change_events (
+    id BIGSERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    snowflake BIGINT NOT NULL,         -- Discord user ID
+    queue VARCHAR(50) NOT NULL,
+    old_tier VARCHAR(20),              -- NULL when the queue had no row yet
+    old_rank VARCHAR(5),
+    old_lp INTEGER,
+    new_tier VARCHAR(20),
+    new_rank VARCHAR(5),
+    new_lp INTEGER,
+    created_at TIMESTAMP DEFAULT NOW(),
+    consumed_at TIMESTAMP              -- set when the bot claims the event
+);
+
 
 -- Guild membership tracking
 CREATE TABLE IF NOT EXISTS guild_members (
@@ -215,6 +233,7 @@ CREATE INDEX IF NOT EXISTS idx_mastery_delta_user_champ ON user_mastery_delta(us
 CREATE INDEX IF NOT EXISTS idx_ranks_user ON user_ranks(user_id);
 CREATE INDEX IF NOT EXISTS idx_ranked_progress_lookup
     ON ranked_progress_snapshots(guild_id, discord_user_id, puuid, snapshot_at DESC);
+CREATE INDEX IF NOT EXISTS idx_rank_events_pending ON rank_change_events(id) WHERE consumed_at IS NULL;
 CREATE INDEX IF NOT EXISTS idx_guild_members_guild ON guild_members(guild_id);
 CREATE INDEX IF NOT EXISTS idx_verification_expires ON verification_codes(expires_at);
 CREATE INDEX IF NOT EXISTS idx_allowed_channels_guild ON allowed_channels(guild_id);
@@ -228,6 +247,18 @@ CREATE INDEX IF NOT EXISTS idx_betting_predictions_bet ON betting_predictions(be
 CREATE INDEX IF NOT EXISTS idx_betting_leaderboard_guild ON betting_leaderboard(guild_id);
 CREATE INDEX IF NOT EXISTS idx_rank_embed_guild ON rank_embed(guild_id);
 
+-- Riot account index (puuid -> platform, Riot ID -> puuid), filled by apis/riot_client on every lookup
+CREATE TABLE IF NOT EXISTS riot_account_index (
+    puuid VARCHAR(100) PRIMARY KEY,
+    platform VARCHAR(10),
+    routing VARCHAR(20),
+    game_name VARCHAR(100),
+    tag_line VARCHAR(20),
+    riot_id_key VARCHAR(130),  -- lower(gameName#tagLine)
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+CREATE INDEX IF NOT EXISTS idx_riot_account_index_riot_id ON riot_account_index(riot_id_key, updated_at DESC);
+
 -- ================================
 --    BAN SYSTEM TABLES
 -- ================================
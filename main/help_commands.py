@@ -576,6 +576,8 @@ class HelpCommands(commands.Cog):
     def __init__(self, bot: commands.Bot, guild_id: int):
         self.bot = bot
         self.guild = discord.Object(id=guild_id)
+        # Last rendered rank distribution per message, so unchanged counts are not re-sent
+        self._rank_stats_rendered = {}
     
     async def cog_load(self):
         """Called when the cog is loaded"""
@@ -974,10 +976,15 @@ class HelpCommands(commands.Cog):
                 return
             
             try:
-                message = await channel.fetch_message(message_id)
                 embed = await self.create_rank_stats_embed(guild)
+                rendered = tuple((field.name, field.value) for field in embed.fields)
+                if self._rank_stats_rendered.get(message_id) == rendered:
+                    logger.debug(f"Rank stats unchanged for guild {guild_id}, skipping edit")
+                    return
+                message = await channel.fetch_message(message_id)
                 view = RankStatsView(self)
                 await message.edit(embed=embed, view=view)
+                self._rank_stats_rendered[message_id] = rendered
                 logger.info(f"✅ Rank stats embed updated for guild {guild_id}")
             except discord.NotFound:
                 logger.warning(f"Rank stats message {message_id} not found")
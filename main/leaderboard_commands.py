@@ -348,8 +348,13 @@ class LeaderboardCommands(commands.Cog):
         subset.sort(key=lambda x: x['priority'], reverse=True)
         return subset
 
-    async def _get_or_refresh_persistent_rank_data(self, guild: discord.Guild, region: Optional[str], force_refresh: bool = False) -> tuple[list, str, int]:
-        """Return ranked data using cache, with guarded refresh to protect bot performance."""
+    async def _get_or_refresh_persistent_rank_data(self, guild: discord.Guild, region: Optional[str], force_refresh: bool = False,
+                                                   cached_only: bool = False) -> tuple[Optional[list], str, int]:
+        """Return ranked data using cache, with guarded refresh to protect bot performance.
+
+        With cached_only the cached board is returned whatever its age (None when
+        there is none) and nothing is fetched.
+        """
         guild_id = guild.id
         cache_key = self._rank_cache_key(guild_id, region)
         now = time.time()
@@ -357,6 +362,16 @@ class LeaderboardCommands(commands.Cog):
         last_fetch = float(self._persistent_rank_last_fetch_at.get(cache_key, 0))
         cache_age = now - last_fetch
 
+        if cached_only:
+            if cached is None and region:
+                all_key = self._rank_cache_key(guild_id, None)
+                cached_all = self._persistent_rank_cache.get(all_key)
+                if cached_all is not None:
+                    cached = self._build_region_subset_from_cached_all(cached_all, region)
+                    self._persistent_rank_cache[cache_key] = cached
+                    self._persistent_rank_last_fetch_at[cache_key] = self._persistent_rank_last_fetch_at.get(all_key, 0)
+            return cached, 'cache', 0
+
         if cached is not None and not force_refresh and cache_age <= RANK_CACHE_TTL_SECONDS:
             return cached, 'cache', 0
 
@@ -514,8 +529,9 @@ class LeaderboardCommands(commands.Cog):
         lp_prefix = "+" if lp_delta >= 0 else ""
         return f"today: {lp_prefix}{lp_delta} LP / {games_delta}G"
 
-    async def _collect_ranked_members(self, guild: discord.Guild, region: Optional[str] = None) -> list:
-        """Collect and sort ranked members in guild."""
+    async def _collect_ranked_members(self, guild: discord.Guild, region: Optional[str] = None,
+                                      members: Optional[list] = None, use_cache: bool = True) -> list:
+        """Collect and sort ranked members in guild (or only `members`)."""
         db = get_db()
 
         rank_priority = {
@@ -525,8 +541,9 @@ class LeaderboardCommands(commands.Cog):
         }
         division_priority = {'I': 4, 'II': 3, 'III': 2, 'IV': 1}
 
-        ranked_members = []
-        for member in guild.members:
+        # Pass 1: verified accounts of every member (DB only)
+        member_accounts = []
+        for member in (guild.members if members is None else members):
             if member.bot:
                 continue
 
@@ -538,18 +555,30 @@ class LeaderboardCommands(commands.Cog):
             if not accounts:
                 continue
 
+            accounts = [
+                account for account in accounts
+                if account.get('verified')
+                and not (region and account['region'].lower() != region.lower())
+            ]
+            if accounts:
+                member_accounts.append((member, accounts))
+
+        # Pass 2: one batched ranked lookup for the whole guild
+        ranks_by_account = await self.riot_api.get_ranked_stats_many([
+            (account['puuid'], account['region'])
+            for _, accounts in member_accounts
+            for account in accounts
+        ], use_cache=use_cache)
+
+        ranked_members = []
+        for member, accounts in member_accounts:
             best_rank_data = None
             best_priority = -1
             ranked_accounts_data = []
 
             for account in accounts:
-                if not account.get('verified'):
-                    continue
-                if region and account['region'].lower() != region.lower():
-                    continue
-
                 try:
-                    ranks = await self.riot_api.get_ranked_stats_by_puuid(account['puuid'], account['region'])
+                    ranks = ranks_by_account.get((account['puuid'], account['region']))
                     if not ranks:
                         continue
 
@@ -756,7 +785,7 @@ class LeaderboardCommands(commands.Cog):
         )
         await message.edit(embed=embed, view=self.persistent_rank_view)
 
-    async def _update_or_create_rank_embed(self, guild: discord.Guild, force_refresh: bool = False):
+    async def _update_or_create_rank_embed(self, guild: discord.Guild, force_refresh: bool = False, cached_only: bool = False):
         """Update persistent ranked leaderboard embed, or create it if missing."""
         db = get_db()
         region = self._get_persistent_rank_region(guild.id)
@@ -795,7 +824,10 @@ class LeaderboardCommands(commands.Cog):
             guild,
             region=region,
             force_refresh=force_refresh,
+            cached_only=cached_only,
         )
+        if ranked_members is None:
+            return
         total_pages = max(1, math.ceil(len(ranked_members) / RANK_PAGE_SIZE))
         current_page = int(self._persistent_rank_pages.get(guild.id, 1))
         current_page = max(1, min(current_page, total_pages))
@@ -836,6 +868,38 @@ class LeaderboardCommands(commands.Cog):
         logger.info("✅ Created persistent rank leaderboard embed for guild %s", guild.id)
         return {'status': fetch_status, 'cooldown_remaining': cooldown_remaining}
 
+    async def apply_rank_changes(self, guild: discord.Guild, discord_ids: set) -> bool:
+        """Refresh only these members in the cached leaderboards and re-render the persistent embed.
+
+        Called for rank change events from worker.py. Only the changed members are
+        looked up (bypassing the rank cache, which may still hold the old rank), the
+        cached boards are patched whatever their age and keep their original fetch
+        time, so full refreshes stay with the hourly task. Without a cached board
+        there is nothing to patch.
+        """
+        members = [m for m in (guild.get_member(i) for i in discord_ids) if m and not m.bot]
+        if not members:
+            return False
+
+        lock = self._persistent_rank_refresh_locks.setdefault(guild.id, asyncio.Lock())
+        async with lock:
+            keys = [key for key in self._persistent_rank_cache if key[0] == guild.id]
+            if not keys:
+                return False
+
+            fresh = await self._collect_ranked_members(guild, members=members, use_cache=False)
+            for key in keys:
+                cached = self._persistent_rank_cache.get(key) or []
+                region = None if key[1] == 'all' else key[1]
+                fresh_entries = self._build_region_subset_from_cached_all(fresh, region) if region else fresh
+                patched = [entry for entry in cached if entry['member'].id not in discord_ids] + fresh_entries
+                patched.sort(key=lambda x: x['priority'], reverse=True)
+                self._persistent_rank_cache[key] = patched
+
+        await self._update_or_create_rank_embed(guild, cached_only=True)
+        logger.info("✅ Applied %s rank change(s) to leaderboard for guild %s", len(members), guild.id)
+        return True
+
     @tasks.loop(hours=1)
     async def auto_update_rank_leaderboard_embed(self):
         """Auto-update permanent ranked leaderboard embeds for configured guilds."""
@@ -20,7 +20,8 @@ matplotlib.use('Agg')  # Render charts headlessly
 import matplotlib.pyplot as plt
 
 from database import get_db
-from riot_api import RiotAPI, RIOT_REGIONS, PLATFORM_ROUTES, get_champion_icon_url, get_rank_icon_url, CHAMPION_ID_TO_NAME
+from riot_api import (RiotAPI, RIOT_REGIONS, PLATFORM_ROUTES, get_champion_icon_url, get_rank_icon_url, CHAMPION_ID_TO_NAME,
+                      PlayerMatch)
 from emoji_dict import get_champion_emoji, get_rank_emoji, get_mastery_emoji, get_other_emoji, RANK_EMOJIS as RANK_EMOJIS_NEW
 from objective_icons import (
     get_objective_icon,
@@ -83,8 +84,8 @@ def build_live_status_value(active_game: Optional[Dict[str, Any]]) -> Optional[s
 
 # ==================== STATISTICS HELPER FUNCTIONS ====================
 
-def calculate_match_stats(matches: list, puuid: str) -> dict:
-    """Calculate comprehensive statistics from match data"""
+def calculate_match_stats(matches: List[PlayerMatch]) -> dict:
+    """Calculate comprehensive statistics from slim match records (one per game, any account)"""
     if not matches:
         return {}
     
@@ -106,68 +107,48 @@ def calculate_match_stats(matches: list, puuid: str) -> dict:
     }
     
     for match in matches:
-        if not match or 'info' not in match:
-            continue
-        
-        info = match['info']
-        
-        # Find player in participants
-        player_data = None
-        for participant in info.get('participants', []):
-            if participant.get('puuid') == puuid:
-                player_data = participant
-                break
-        
-        if not player_data:
+        if match is None:
             continue
         
         # Basic stats
         stats['total_games'] += 1
-        if player_data.get('win'):
+        if match.win:
             stats['wins'] += 1
         else:
             stats['losses'] += 1
         
-        stats['kills'] += player_data.get('kills', 0)
-        stats['deaths'] += player_data.get('deaths', 0)
-        stats['assists'] += player_data.get('assists', 0)
-        stats['cs'] += player_data.get('totalMinionsKilled', 0) + player_data.get('neutralMinionsKilled', 0)
-        stats['vision_score'] += player_data.get('visionScore', 0)
+        stats['kills'] += match.kills
+        stats['deaths'] += match.deaths
+        stats['assists'] += match.assists
+        stats['cs'] += match.cs
+        stats['vision_score'] += match.vision_score
         
-        # Game duration in minutes
-        # gameDuration is in seconds for newer matches (typical: 1200-2400s = 20-40min)
-        # and milliseconds for very old matches (would be > 1000000)
-        duration = info.get('gameDuration', 0)
-        if duration > 10000:  # Likely milliseconds (games can't be longer than ~2.7 hours = 10000s)
-            duration = duration / 1000  # Convert milliseconds to seconds
-        stats['game_duration'] += duration / 60  # Convert seconds to minutes
+        # Game duration in minutes (records are always in seconds)
+        stats['game_duration'] += match.game_duration / 60
         
         # Role tracking
-        role = player_data.get('teamPosition', 'UTILITY')
-        if not role or role == '':
-            role = 'UTILITY'
+        role = match.team_position or 'UTILITY'
         stats['roles'][role] = stats['roles'].get(role, 0) + 1
         
         # Champion tracking
-        champ_id = player_data.get('championId')
+        champ_id = match.champion_id
         if champ_id:
             if champ_id not in stats['champions']:
                 stats['champions'][champ_id] = {'games': 0, 'wins': 0}
             stats['champions'][champ_id]['games'] += 1
-            if player_data.get('win'):
+            if match.win:
                 stats['champions'][champ_id]['wins'] += 1
         
         # Game mode tracking
-        game_mode = info.get('gameMode', 'UNKNOWN')
-        queue_id = info.get('queueId', 0)
+        queue_id = match.queue_id
         
         # Categorize game modes
         mode_category = 'Normal'
         if queue_id in [420, 440]:  # Ranked Solo/Duo, Ranked Flex
             mode_category = 'Ranked'
             stats['ranked_games'].append({
-                'win': player_data.get('win'),
-                'timestamp': info.get('gameCreation', 0)
+                'win': match.win,
+                'timestamp': match.game_creation
             })
         elif queue_id in [450]:  # ARAM
             mode_category = 'ARAM'
@@ -177,11 +158,11 @@ def calculate_match_stats(matches: list, puuid: str) -> dict:
         if mode_category not in stats['game_modes']:
             stats['game_modes'][mode_category] = {'games': 0, 'wins': 0}
         stats['game_modes'][mode_category]['games'] += 1
-        if player_data.get('win'):
+        if match.win:
             stats['game_modes'][mode_category]['wins'] += 1
         
         # Track first game for account age
-        timestamp = info.get('gameCreation', 0)
+        timestamp = match.game_creation
         if timestamp > 0:
             if stats['first_game_timestamp'] is None or timestamp < stats['first_game_timestamp']:
                 stats['first_game_timestamp'] = timestamp
@@ -250,20 +231,11 @@ class ProfileCommands(commands.Cog):
             cs_vals = []
             win_mask = []
 
-            for md in sample:
-                match = md['match']
-                puuid = md['puuid']
-                participant = next((p for p in match['info']['participants'] if p.get('puuid') == puuid), None)
-                if not participant:
-                    continue
-                deaths = max(participant.get('deaths', 0), 1)
-                kda_vals.append((participant.get('kills', 0) + participant.get('assists', 0)) / deaths)
-                duration = match['info'].get('gameDuration', 0)
-                if duration > 10000:
-                    duration = duration / 1000
-                minutes = max(duration / 60, 1)
-                cs_vals.append((participant.get('totalMinionsKilled', 0) + participant.get('neutralMinionsKilled', 0)) / minutes)
-                win_mask.append(participant.get('win', False))
+            for match in sample:
+                kda_vals.append(match.kda)
+                minutes = max(match.game_duration / 60, 1)
+                cs_vals.append(match.cs / minutes)
+                win_mask.append(match.win)
 
             if not kda_vals:
                 return None
@@ -301,20 +273,15 @@ class ProfileCommands(commands.Cog):
     def _build_lp_chart(self, match_details: list) -> Optional[discord.File]:
         """Create a simple LP trend chart using ranked matches (estimated LP deltas)."""
         try:
-            ranked = [m for m in match_details if m['match']['info'].get('queueId') in (420, 440)]
+            ranked = [m for m in match_details if m.queue_id in (420, 440)]
             if len(ranked) < 2:
                 return None
 
-            ranked = sorted(ranked, key=lambda x: x['timestamp'])
+            ranked = sorted(ranked, key=lambda m: m.game_creation)
             lp_progress = []
             lp = 0
-            for md in ranked:
-                match = md['match']
-                puuid = md['puuid']
-                participant = next((p for p in match['info']['participants'] if p.get('puuid') == puuid), None)
-                if not participant:
-                    continue
-                win = participant.get('win', False)
+            for match in ranked:
+                win = match.win
                 delta = 20 if win else -16  # deterministic estimate
                 lp += delta
                 lp_progress.append(lp)
@@ -355,35 +322,19 @@ class ProfileCommands(commands.Cog):
             idx = list(range(1, games + 1))
 
             kda_vals, dmg_vals, cs_vals, wl_vals = [], [], [], []
-            for md in sample:
-                match = md['match']
-                puuid = md['puuid']
-                p = next((x for x in match['info']['participants'] if x.get('puuid') == puuid), None)
-                if not p:
-                    # Keep alignment
-                    kda_vals.append(0)
-                    dmg_vals.append(0)
-                    cs_vals.append(0)
-                    wl_vals.append(0)
-                    continue
-                deaths = max(p.get('deaths', 0), 1)
-                kda_vals.append((p.get('kills', 0) + p.get('assists', 0)) / deaths)
-                dmg_vals.append(p.get('totalDamageDealtToChampions', 0))
+            for match in sample:
+                kda_vals.append(match.kda)
+                dmg_vals.append(match.damage_to_champions)
                 # CS per game
-                cs_vals.append(p.get('totalMinionsKilled', 0) + p.get('neutralMinionsKilled', 0))
-                wl_vals.append(1 if p.get('win') else -1)
+                cs_vals.append(match.cs)
+                wl_vals.append(1 if match.win else -1)
 
             # LP progression (estimated) from ranked only
-            ranked = [m for m in match_details if m['match']['info'].get('queueId') in (420, 440)]
-            ranked = sorted(ranked, key=lambda x: x['timestamp']) if ranked else []
+            ranked = [m for m in match_details if m.queue_id in (420, 440)]
+            ranked = sorted(ranked, key=lambda m: m.game_creation) if ranked else []
             lp_progress, cur_lp = [], 0
-            for md in ranked:
-                match = md['match']
-                puuid = md['puuid']
-                p = next((x for x in match['info']['participants'] if x.get('puuid') == puuid), None)
-                if not p:
-                    continue
-                delta = 20 if p.get('win') else -16
+            for match in ranked:
+                delta = 20 if match.win else -16
                 cur_lp += delta
                 lp_progress.append(cur_lp)
 
@@ -688,16 +639,7 @@ class ProfileCommands(commands.Cog):
         # Fetch initial mastery snapshot
         mastery_data = await self.riot_api.get_champion_mastery(puuid, region, 200)
         if mastery_data:
-            for champ in mastery_data:
-                db.update_champion_mastery(
-                    user['id'],
-                    champ['championId'],
-                    champ['championPoints'],
-                    champ['championLevel'],
-                    champ.get('chestGranted', False),
-                    champ.get('tokensEarned', 0),
-                    champ.get('lastPlayTime'),
-                )
+            db.bulk_update_champion_mastery(user['id'], mastery_data, record_deltas=False)
 
         if interaction.guild:
             db.add_guild_member(interaction.guild.id, user['id'])
@@ -1060,36 +1002,28 @@ class ProfileCommands(commands.Cog):
             
                 logger.info(f"📋 Total match IDs collected: {len(all_match_ids_with_context)}")
             
-                # Fetch match details (cap at 80 for performance) and sort by timestamp
+                # Fetch slim match records (cap at 80 for performance) and sort by timestamp
+                # Only the fields the profile reads are kept, the full payloads are dropped right away
                 temp_matches = []
                 for match_id, puuid, region in all_match_ids_with_context[:80]:
-                    match_details = await self.riot_api.get_match_details(match_id, region)
-                    if match_details:
-                        temp_matches.append({
-                            'match': match_details,
-                            'puuid': puuid,
-                            'timestamp': match_details['info']['gameCreation']
-                        })
+                    player_match = await self.riot_api.get_player_match(match_id, region, puuid)
+                    if player_match:
+                        temp_matches.append(player_match)
             
                 # Sort by timestamp (newest first) and take top 80
-                temp_matches.sort(key=lambda x: x['timestamp'], reverse=True)
+                temp_matches.sort(key=lambda m: m.game_creation, reverse=True)
                 all_match_details = temp_matches[:80]
             
                 # Collect recently played champions (first 3 unique)
-                for match_data in all_match_details[:10]:
+                for match in all_match_details[:10]:
                     if len(recently_played) >= 3:
                         break
-                    match = match_data['match']
-                    puuid = match_data['puuid']
-                    for participant in match['info']['participants']:
-                        if participant['puuid'] == puuid:
-                            champ_name = participant.get('championName', '')
-                            if champ_name and champ_name not in [r['champion'] for r in recently_played]:
-                                recently_played.append({
-                                    'champion': champ_name,
-                                    'time': 'Today'
-                                })
-                            break
+                    champ_name = match.champion_name
+                    if champ_name and champ_name not in [r['champion'] for r in recently_played]:
+                        recently_played.append({
+                            'champion': champ_name,
+                            'time': 'Today'
+                        })
             
                 fetch_time = time.time() - fetch_start
                 logger.info(f"✅ Fetched {len(all_match_details)} total match details in {fetch_time:.1f}s")
@@ -1097,52 +1031,7 @@ class ProfileCommands(commands.Cog):
                 logger.error(f"❌ Error fetching match history: {e}")
         
             # Calculate comprehensive statistics
-            combined_stats = {}
-            for match_data in all_match_details:
-                match = match_data['match']
-                puuid = match_data['puuid']
-            
-                stats = calculate_match_stats([match], puuid)
-            
-                # Merge stats
-                if not combined_stats:
-                    combined_stats = stats
-                else:
-                    combined_stats['total_games'] += stats['total_games']
-                    combined_stats['wins'] += stats['wins']
-                    combined_stats['losses'] += stats['losses']
-                    combined_stats['kills'] += stats['kills']
-                    combined_stats['deaths'] += stats['deaths']
-                    combined_stats['assists'] += stats['assists']
-                    combined_stats['cs'] += stats['cs']
-                    combined_stats['vision_score'] += stats['vision_score']
-                    combined_stats['game_duration'] += stats['game_duration']
-                
-                    # Merge roles
-                    for role, count in stats.get('roles', {}).items():
-                        combined_stats['roles'][role] = combined_stats['roles'].get(role, 0) + count
-                
-                    # Merge champions
-                    for champ_id, champ_data in stats.get('champions', {}).items():
-                        if champ_id not in combined_stats['champions']:
-                            combined_stats['champions'][champ_id] = {'games': 0, 'wins': 0}
-                        combined_stats['champions'][champ_id]['games'] += champ_data['games']
-                        combined_stats['champions'][champ_id]['wins'] += champ_data['wins']
-                
-                    # Merge game modes
-                    for mode, mode_data in stats.get('game_modes', {}).items():
-                        if mode not in combined_stats['game_modes']:
-                            combined_stats['game_modes'][mode] = {'games': 0, 'wins': 0}
-                        combined_stats['game_modes'][mode]['games'] += mode_data['games']
-                        combined_stats['game_modes'][mode]['wins'] += mode_data['wins']
-                
-                    # Track earliest game
-                    if stats.get('first_game_timestamp'):
-                        if not combined_stats.get('first_game_timestamp') or stats['first_game_timestamp'] < combined_stats['first_game_timestamp']:
-                            combined_stats['first_game_timestamp'] = stats['first_game_timestamp']
-                
-                    # Merge ranked games
-                    combined_stats['ranked_games'].extend(stats.get('ranked_games', []))
+            combined_stats = calculate_match_stats(all_match_details)
         
             # Cancel keep-alive and delete loading message
             keep_alive_task.cancel()
@@ -1268,13 +1157,9 @@ class ProfileCommands(commands.Cog):
                     # Recent sample (up to 20 most recent games) for trend
                     recent_sample = min(20, total_games)
                     recent_wins = 0
-                    for match_data in all_match_details[:recent_sample]:
-                        match = match_data['match']
-                        puuid = match_data['puuid']
-                        for participant in match['info'].get('participants', []):
-                            if participant.get('puuid') == puuid and participant.get('win'):
-                                recent_wins += 1
-                                break
+                    for match in all_match_details[:recent_sample]:
+                        if match.win:
+                            recent_wins += 1
 
                     recent_wr = (recent_wins / recent_sample * 100) if recent_sample > 0 else 0
                 
@@ -1313,9 +1198,8 @@ class ProfileCommands(commands.Cog):
                     games_today = 0
                     games_week = 0
                 
-                    for match_data in all_match_details:
-                        match = match_data['match']
-                        timestamp = match['info'].get('gameCreation', 0) / 1000  # Convert to seconds
+                    for match in all_match_details:
+                        timestamp = match.game_creation / 1000  # Convert to seconds
                         game_time = datetime.fromtimestamp(timestamp)
                     
                         if game_time >= today_start:
@@ -3327,18 +3211,17 @@ class ProfileView(discord.ui.View):
             return matches
         
         filtered = []
-        for match_data in matches:
-            match = match_data['match']
-            queue_id = match['info'].get('queueId', 0)
+        for match in matches:
+            queue_id = match.queue_id
             
             if self.queue_filter == 'soloq' and queue_id == 420:
-                filtered.append(match_data)
+                filtered.append(match)
             elif self.queue_filter == 'flex' and queue_id == 440:
-                filtered.append(match_data)
+                filtered.append(match)
             elif self.queue_filter == 'normals' and queue_id in [400, 430, 490]:
-                filtered.append(match_data)
+                filtered.append(match)
             elif self.queue_filter == 'other' and queue_id not in [420, 440, 400, 430, 490]:
-                filtered.append(match_data)
+                filtered.append(match)
         
         return filtered
     
@@ -3422,20 +3305,13 @@ class ProfileView(discord.ui.View):
         # Recently Played (unique champions from last matches with timestamp)
         if filtered_matches:
             recently_played = []
-            for match_data in filtered_matches[:20]:  # Check last 20 games
-                match = match_data['match']
-                puuid = match_data['puuid']
-                game_timestamp = match['info'].get('gameCreation', 0)
-                
-                for participant in match['info']['participants']:
-                    if participant['puuid'] == puuid:
-                        champ = participant.get('championName', '')
-                        if champ and champ not in [r['champion'] for r in recently_played]:
-                            recently_played.append({
-                                'champion': champ,
-                                'timestamp': game_timestamp
-                            })
-                        break
+            for match in filtered_matches[:20]:  # Check last 20 games
+                champ = match.champion_name
+                if champ and champ not in [r['champion'] for r in recently_played]:
+                    recently_played.append({
+                        'champion': champ,
+                        'timestamp': match.game_creation
+                    })
                 if len(recently_played) >= 3:
                     break
             
@@ -3528,17 +3404,12 @@ class ProfileView(discord.ui.View):
                 last_10_deaths = 0
                 last_10_assists = 0
                 
-                for match_data in last_10:
-                    match = match_data['match']
-                    puuid = match_data['puuid']
-                    for participant in match['info']['participants']:
-                        if participant['puuid'] == puuid:
-                            if participant['win']:
-                                last_10_wins += 1
-                            last_10_kills += participant['kills']
-                            last_10_deaths += participant['deaths']
-                            last_10_assists += participant['assists']
-                            break
+                for match in last_10:
+                    if match.win:
+                        last_10_wins += 1
+                    last_10_kills += match.kills
+                    last_10_deaths += match.deaths
+                    last_10_assists += match.assists
                 
                 last_10_kda = (last_10_kills + last_10_assists) / max(last_10_deaths, 1)
                 last_10_wr = (last_10_wins / 10 * 100)
@@ -3551,17 +3422,12 @@ class ProfileView(discord.ui.View):
                     prev_10_deaths = 0
                     prev_10_assists = 0
                     
-                    for match_data in prev_10:
-                        match = match_data['match']
-                        puuid = match_data['puuid']
-                        for participant in match['info']['participants']:
-                            if participant['puuid'] == puuid:
-                                if participant['win']:
-                                    prev_10_wins += 1
-                                prev_10_kills += participant['kills']
-                                prev_10_deaths += participant['deaths']
-                                prev_10_assists += participant['assists']
-                                break
+                    for match in prev_10:
+                        if match.win:
+                            prev_10_wins += 1
+                        prev_10_kills += match.kills
+                        prev_10_deaths += match.deaths
+                        prev_10_assists += match.assists
                     
                     prev_10_kda = (prev_10_kills + prev_10_assists) / max(prev_10_deaths, 1)
                     prev_10_wr = (prev_10_wins / 10 * 100)
@@ -3648,15 +3514,10 @@ class ProfileView(discord.ui.View):
                 total_duration = 0
                 gold_games_counted = 0
                 
-                for match_data in filtered_matches[:20]:
-                    match = match_data['match']
-                    puuid = match_data['puuid']
-                    for participant in match['info']['participants']:
-                        if participant['puuid'] == puuid:
-                            total_gold += participant.get('goldEarned', 0)
-                            total_duration += match['info']['gameDuration'] / 60  # Convert to minutes
-                            gold_games_counted += 1
-                            break
+                for match in filtered_matches[:20]:
+                    total_gold += match.gold_earned
+                    total_duration += match.game_duration / 60  # Convert to minutes
+                    gold_games_counted += 1
                 
                 if gold_games_counted > 0:
                     avg_gold_per_min = total_gold / total_duration if total_duration > 0 else 0
@@ -3937,20 +3798,15 @@ class ProfileView(discord.ui.View):
         damage_games = 0
         damage_sample = min(30, len(self.all_match_details))
 
-        for match_data in self.all_match_details[:damage_sample]:
-            match = match_data['match']
-            puuid = match_data['puuid']
-            for participant in match['info']['participants']:
-                if participant['puuid'] == puuid:
-                    total_damage += participant.get('totalDamageDealtToChampions', 0)
-                    total_physical += participant.get('physicalDamageDealtToChampions', 0)
-                    total_magic += participant.get('magicDamageDealtToChampions', 0)
-                    total_true += participant.get('trueDamageDealtToChampions', 0)
-                    total_to_champs += participant.get('totalDamageDealtToChampions', 0)
-                    total_to_objectives += participant.get('damageDealtToObjectives', 0)
-                    total_mitigated += participant.get('damageSelfMitigated', 0)
-                    damage_games += 1
-                    break
+        for match in self.all_match_details[:damage_sample]:
+            total_damage += match.damage_to_champions
+            total_physical += match.physical_damage
+            total_magic += match.magic_damage
+            total_true += match.true_damage
+            total_to_champs += match.damage_to_champions
+            total_to_objectives += match.damage_to_objectives
+            total_mitigated += match.damage_mitigated
+            damage_games += 1
         
         if damage_games > 0:
             avg_damage = total_damage / damage_games
@@ -3981,39 +3837,15 @@ class ProfileView(discord.ui.View):
         obj_games = 0
         obj_sample = min(30, len(self.all_match_details))
 
-        for match_data in self.all_match_details[:obj_sample]:
-            match = match_data['match']
-            puuid = match_data['puuid']
-            
-            # Find player's team
-            player_team_id = None
-            for participant in match['info']['participants']:
-                if participant['puuid'] == puuid:
-                    player_team_id = participant['teamId']
-                    towers += participant.get('turretKills', 0)
-                    inhibs += participant.get('inhibitorKills', 0)
-                    break
+        for match in self.all_match_details[:obj_sample]:
+            towers += match.turret_kills
+            inhibs += match.inhibitor_kills
             
-            if player_team_id:
-                # Count team objectives
-                for team in match['info'].get('teams', []):
-                    if team['teamId'] == player_team_id:
-                        objectives = team.get('objectives', {})
-                        
-                        # Dragons (total count - API doesn't provide types)
-                        dragon_obj = objectives.get('dragon', {})
-                        dragon_kills = dragon_obj.get('kills', 0)
-                        dragons['total'] = dragons.get('total', 0) + dragon_kills
-                        
-                        # Barons
-                        baron_obj = objectives.get('baron', {})
-                        barons += baron_obj.get('kills', 0)
-                        
-                        # Heralds
-                        herald_obj = objectives.get('riftHerald', {})
-                        heralds += herald_obj.get('kills', 0)
-                        
-                        break
+            if match.team_id:
+                # Team objectives (dragon total - API doesn't provide types)
+                dragons['total'] = dragons.get('total', 0) + match.team_dragons
+                barons += match.team_barons
+                heralds += match.team_heralds
                 
                 obj_games += 1
         
@@ -4045,20 +3877,14 @@ class ProfileView(discord.ui.View):
         
         gold_sample = min(15, len(self.all_match_details))
 
-        for match_data in self.all_match_details[:gold_sample]:
-            match = match_data['match']
-            puuid = match_data['puuid']
+        for match in self.all_match_details[:gold_sample]:
+            # Gold per minute checkpoints
+            gold_per_min = match.gold_earned / max(match.game_duration / 60, 1)
             
-            for participant in match['info']['participants']:
-                if participant['puuid'] == puuid:
-                    # Gold per minute checkpoints
-                    gold_per_min = participant.get('goldEarned', 0) / (match['info']['gameDuration'] / 60)
-                    
-                    # Approximate gold at intervals (simplified)
-                    gold_at_10.append(gold_per_min * 10)
-                    gold_at_15.append(gold_per_min * 15)
-                    gold_at_20.append(gold_per_min * 20)
-                    break
+            # Approximate gold at intervals (simplified)
+            gold_at_10.append(gold_per_min * 10)
+            gold_at_15.append(gold_per_min * 15)
+            gold_at_20.append(gold_per_min * 20)
         
         if gold_at_10:
             avg_10 = sum(gold_at_10) / len(gold_at_10)
@@ -4135,27 +3961,15 @@ class ProfileView(discord.ui.View):
         # Show newest matches first (top of embed)
         display_count = min(10, len(filtered_matches))
         
-        for match_data in filtered_matches[:display_count]:
-            match = match_data['match']
-            puuid = match_data['puuid']
-
-            player_data = None
-            for participant in match['info']['participants']:
-                if participant['puuid'] == puuid:
-                    player_data = participant
-                    break
-
-            if not player_data:
-                continue
-
-            won = player_data['win']
-            champion = player_data.get('championName', 'Unknown')
-            kills = player_data['kills']
-            deaths = player_data['deaths']
-            assists = player_data['assists']
-            damage = player_data.get('totalDamageDealtToChampions', 0)
-            cs = player_data.get('totalMinionsKilled', 0) + player_data.get('neutralMinionsKilled', 0)
-            vision = player_data.get('visionScore', 0)
+        for match in filtered_matches[:display_count]:
+            won = match.win
+            champion = match.champion_name or 'Unknown'
+            kills = match.kills
+            deaths = match.deaths
+            assists = match.assists
+            damage = match.damage_to_champions
+            cs = match.cs
+            vision = match.vision_score
 
             if won:
                 wins += 1
@@ -4171,19 +3985,16 @@ class ProfileView(discord.ui.View):
             total_vision += vision
             
             # Check if MVP (most damage in team)
-            team_participants = [p for p in match['info']['participants'] if p['teamId'] == player_data['teamId']]
-            max_damage = max([p.get('totalDamageDealtToChampions', 0) for p in team_participants])
+            max_damage = match.team_max_damage
             if damage >= max_damage and max_damage > 0:
                 mvp_count += 1
 
             result_emoji = get_other_emoji('win') if won else get_other_emoji('loss')
             champ_emoji = get_champion_emoji(champion)
 
-            queue_id = match['info'].get('queueId', 0)
+            queue_id = match.queue_id
             game_mode = get_queue_name(queue_id)
-            duration = match['info']['gameDuration']
-            if duration > 1000:
-                duration = duration / 1000
+            duration = match.game_duration
             
             total_duration += duration
 
@@ -4247,17 +4058,14 @@ class ProfileView(discord.ui.View):
         # Fetch ranked matches from today
         all_ranked_matches = []
         
-        for match_data in self.all_match_details:
-            match = match_data['match']
-            puuid = match_data['puuid']
-            
+        for match in self.all_match_details:
             # Check if match is from today
-            game_creation = match['info'].get('gameCreation', 0)
+            game_creation = match.game_creation
             if game_creation < today_timestamp:
                 continue
             
             # Check if it's ranked (and apply queue filter)
-            queue_id = match['info'].get('queueId', 0)
+            queue_id = match.queue_id
             
             # Apply queue filter
             if self.queue_filter == 'soloq' and queue_id != 420:
@@ -4272,19 +4080,7 @@ class ProfileView(discord.ui.View):
                 if queue_id not in [420, 440]:
                     continue
             
-            # Find player data
-            player_data = None
-            for participant in match['info']['participants']:
-                if participant['puuid'] == puuid:
-                    player_data = participant
-                    break
-            
-            if player_data:
-                all_ranked_matches.append({
-                    'match': match,
-                    'player': player_data,
-                    'timestamp': game_creation
-                })
+            all_ranked_matches.append(match)
         
         if not all_ranked_matches:
             lp_emoji = get_other_emoji('lp')
@@ -4297,7 +4093,7 @@ class ProfileView(discord.ui.View):
             return embed
         
         # Sort by timestamp
-        all_ranked_matches.sort(key=lambda x: x['timestamp'])
+        all_ranked_matches.sort(key=lambda m: m.game_creation)
         
         # Calculate LP with enhanced estimation
         import random
@@ -4312,15 +4108,12 @@ class ProfileView(discord.ui.View):
         current_streak = 0
         last_result = None
         
-        for match_info in all_ranked_matches:
-            player = match_info['player']
-            match = match_info['match']
-            
-            won = player['win']
-            champion = player.get('championName', 'Unknown')
-            kills = player['kills']
-            deaths = player['deaths']
-            assists = player['assists']
+        for match in all_ranked_matches:
+            won = match.win
+            champion = match.champion_name or 'Unknown'
+            kills = match.kills
+            deaths = match.deaths
+            assists = match.assists
             
             # Enhanced LP estimation (same as /lp command)
             if won:
@@ -4353,7 +4146,7 @@ class ProfileView(discord.ui.View):
                 current_streak = 1 if won else -1
             last_result = won
             
-            queue_id = match['info']['queueId']
+            queue_id = match.queue_id
             queue_name = "Solo/Duo" if queue_id == 420 else "Flex"
             
             champ_emoji = get_champion_emoji(champion)
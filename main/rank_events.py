@@ -0,0 +1,150 @@
+"""
+Rank change events
+worker.py stores each user's best rank per queue (across their verified accounts) through
+Database.update_ranked_stats, which writes a rank_change_events row (and sends NOTIFY
+rank_changes) whenever that tier, division or LP changes. RankEventListener
+keeps one LISTEN connection open, drains the outbox in small batches and hands the changed
+users to the bot, so roles, leaderboards and the rank stats embed are refreshed for just those
+users instead of being re-polled. Events written while the bot is offline are picked up on start
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+from database import RANK_EVENTS_CHANNEL, get_async_db
+
+logger = logging.getLogger('rank_events')
+
+# Wait this long after a NOTIFY so one worker pass lands as one batch, not one edit per user
+RANK_EVENT_DEBOUNCE_SECONDS = float(os.getenv('RANK_EVENT_DEBOUNCE_SECONDS', '20'))
+
+# Drain the outbox at least this often even without a NOTIFY (e.g. while LISTEN is reconnecting)
+RANK_EVENT_POLL_SECONDS = float(os.getenv('RANK_EVENT_POLL_SECONDS', '300'))
+
+RANK_EVENT_BATCH_SIZE = 500
+
+# Consumed events are kept this many days for debugging
+RANK_EVENT_RETENTION_DAYS = 7
+
+
+class RankEventListener:
+    """LISTEN rank_changes and call `handler(events)` with each batch of claimed events."""
+
+    def __init__(self, database_url: str, handler: Callable[[List[Dict]], Awaitable[None]]):
+        self.database_url = database_url
+        self.handler = handler
+        self._conn = None
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._last_prune = 0.0
+        self._connected_once = False
+        self.stats = {'notifies': 0, 'batches': 0, 'events': 0, 'errors': 0, 'reconnects': 0}
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name='rank-events')
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._close()
+
+    def _open_connection(self):
+        """Blocking connect + LISTEN - run in a thread"""
+        conn = psycopg2.connect(self.database_url, connect_timeout=10)
+        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        with conn.cursor() as cur:
+            cur.execute(f"LISTEN {RANK_EVENTS_CHANNEL}")
+        return conn
+
+    async def _connect(self):
+        if self._connected_once:
+            self.stats['reconnects'] += 1
+        conn = await asyncio.to_thread(self._open_connection)
+        asyncio.get_running_loop().add_reader(conn.fileno(), self._on_readable)
+        self._conn = conn
+        self._connected_once = True
+        logger.info(f"👂 Listening for {RANK_EVENTS_CHANNEL} notifications")
+
+    def _close(self):
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            asyncio.get_running_loop().remove_reader(conn.fileno())
+        except Exception:
+            pass
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _on_readable(self):
+        try:
+            self._conn.poll()
+        except Exception as e:
+            logger.warning(f"⚠️ Rank event connection lost: {e}")
+            self._close()
+            self._wake.set()
+            return
+        if self._conn.notifies:
+            self.stats['notifies'] += len(self._conn.notifies)
+            self._conn.notifies.clear()
+            self._wake.set()
+
+    async def _run(self):
+        # Drain whatever piled up while the bot was offline first
+        self._wake.set()
+        while True:
+            try:
+                if self._conn is None:
+                    await self._connect()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=RANK_EVENT_POLL_SECONDS)
+                    await asyncio.sleep(RANK_EVENT_DEBOUNCE_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+                await self._drain()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats['errors'] += 1
+                logger.error(f"❌ Rank event listener error: {e}")
+                self._close()
+                await asyncio.sleep(30)
+
+    async def _drain(self):
+        adb = get_async_db()
+        while True:
+            events = await adb.claim_rank_change_events(RANK_EVENT_BATCH_SIZE)
+            if not events:
+                break
+            self.stats['batches'] += 1
+            self.stats['events'] += len(events)
+            logger.info(f"📨 {len(events)} rank change event(s) for {len({e['snowflake'] for e in events})} user(s)")
+            try:
+                await self.handler(events)
+            except Exception as e:
+                # Events are already consumed - the hourly sweeps repair anything missed here
+                self.stats['errors'] += 1
+                logger.error(f"❌ Rank event handler failed: {e}", exc_info=True)
+            if len(events) < RANK_EVENT_BATCH_SIZE:
+                break
+
+        if time.monotonic() - self._last_prune > 3600:
+            self._last_prune = time.monotonic()
+            deleted = await adb.prune_rank_change_events(RANK_EVENT_RETENTION_DAYS)
+            if deleted:
+                logger.info(f"🧹 Pruned {deleted} old rank change events")
@@ -14,6 +14,8 @@ from bs4 import BeautifulSoup
 import asyncio
 from datetime import datetime, timedelta
 
+from riot_api import get_ddragon
+
 logger = logging.getLogger('skin_tierlist_commands')
 
 # Global session for better performance
@@ -206,59 +208,21 @@ class SkinTierlistView(discord.ui.View):
 class SkinScraper:
     """Fetches skin information from Riot Data Dragon (primary) and wiki (fallback)"""
 
-    # Cache at class level so it persists for the bot's lifetime
-    _ddragon_version: Optional[str] = None
-    _ddragon_champions: Optional[Dict] = None  # {name_lower: dd_key}
-
-    @staticmethod
-    async def _ensure_ddragon_cache() -> bool:
-        """Populate version + champion-list cache. Returns True on success."""
-        session = await get_session()
-        try:
-            if SkinScraper._ddragon_version is None:
-                async with session.get(
-                    "https://ddragon.leagueoflegends.com/api/versions.json",
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as resp:
-                    if resp.status != 200:
-                        return False
-                    versions = await resp.json(content_type=None)
-                    SkinScraper._ddragon_version = versions[0]
-
-            if SkinScraper._ddragon_champions is None:
-                url = f"https://ddragon.leagueoflegends.com/cdn/{SkinScraper._ddragon_version}/data/en_US/champion.json"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                    if resp.status != 200:
-                        return False
-                    data = await resp.json(content_type=None)
-                    # map display-name-lower → dd_key (e.g. "twisted fate" → "TwistedFate")
-                    SkinScraper._ddragon_champions = {
-                        v["name"].lower(): k for k, v in data["data"].items()
-                    }
-            return True
-        except Exception as e:
-            logger.warning(f"Failed to populate Data Dragon cache: {e}")
-            return False
-
     @staticmethod
     async def _fetch_from_ddragon(champion_name: str) -> List[Dict]:
-        """Fetch skins from Riot Data Dragon. Returns list or [] on failure."""
+        """Fetch skins from Riot Data Dragon (shared service, disk cached). Returns list or [] on failure."""
         try:
-            if not await SkinScraper._ensure_ddragon_cache():
-                return []
+            ddragon = get_ddragon()
+            await ddragon.ensure_loaded()
 
-            dd_key = SkinScraper._ddragon_champions.get(champion_name.lower())
+            dd_key = ddragon.champion_ids_by_name.get(champion_name.lower())
             if not dd_key:
                 logger.warning(f"Champion '{champion_name}' not found in Data Dragon champion list")
                 return []
 
-            version = SkinScraper._ddragon_version
-            url = f"https://ddragon.leagueoflegends.com/cdn/{version}/data/en_US/champion/{dd_key}.json"
-            session = await get_session()
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                if resp.status != 200:
-                    return []
-                data = await resp.json(content_type=None)
+            data = await ddragon.get_json(f"data/en_US/champion/{dd_key}.json")
+            if not data:
+                return []
 
             skins_raw = data["data"][dd_key]["skins"]
             skins = []
@@ -105,12 +105,13 @@ class StatsCommands(commands.Cog):
         if not match_ids:
             return None
 
+        # Slim per-player records, the full payloads are not kept around
         filtered_matches = []
         for mid in match_ids:
-            details = await self.riot_api.get_match_details(mid, region)
-            if not details or 'info' not in details:
+            match = await self.riot_api.get_player_match(mid, region, puuid)
+            if not match:
                 continue
-            queue_id = details['info'].get('queueId', 0)
+            queue_id = match.queue_id
             if queue_filter == 'ranked' and queue_id not in (420, 440):
                 continue
             if queue_filter == 'soloq' and queue_id != 420:
@@ -119,7 +120,7 @@ class StatsCommands(commands.Cog):
                 continue
             if queue_filter == 'arena' and queue_id not in (1700, 1710):
                 continue
-            filtered_matches.append(details)
+            filtered_matches.append(match)
             if len(filtered_matches) >= games:
                 break
 
@@ -133,39 +134,22 @@ class StatsCommands(commands.Cog):
         streak = []
 
         for match in filtered_matches:
-            info = match['info']
-            participant = None
-            for p in info.get('participants', []):
-                if p.get('puuid') == puuid:
-                    participant = p
-                    break
-            if not participant:
-                continue
-
-            duration = info.get('gameDuration', 0)
-            if duration > 10000:
-                duration = duration / 1000
-            duration_minutes = max(duration / 60, 1)
-
-            team_kills = sum(pp.get('kills', 0) for pp in info.get('participants', []) if pp.get('teamId') == participant.get('teamId'))
-            kp = (participant.get('kills', 0) + participant.get('assists', 0)) / team_kills if team_kills > 0 else 0
-
             stats_list.append({
-                'win': participant.get('win', False),
-                'kills': participant.get('kills', 0),
-                'deaths': participant.get('deaths', 0),
-                'assists': participant.get('assists', 0),
-                'damage': participant.get('totalDamageDealtToChampions', 0),
-                'cs': participant.get('totalMinionsKilled', 0) + participant.get('neutralMinionsKilled', 0),
-                'vision': participant.get('visionScore', 0),
-                'kp': kp,
-                'duration_min': duration_minutes,
-                'champion_id': participant.get('championId'),
-                'role': participant.get('teamPosition', 'UTILITY') or 'UTILITY'
+                'win': match.win,
+                'kills': match.kills,
+                'deaths': match.deaths,
+                'assists': match.assists,
+                'damage': match.damage_to_champions,
+                'cs': match.cs,
+                'vision': match.vision_score,
+                'kp': match.kill_participation,
+                'duration_min': max(match.game_duration / 60, 1),
+                'champion_id': match.champion_id,
+                'role': match.team_position or 'UTILITY'
             })
 
             # Track recents (based on filtered order, likely newest-first)
-            cname_recent = participant.get('championName') or CHAMPION_ID_TO_NAME.get(participant.get('championId'))
+            cname_recent = match.champion_name or CHAMPION_ID_TO_NAME.get(match.champion_id)
             if cname_recent:
                 recent_champs.append(cname_recent)
 
@@ -8,7 +8,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 
-from database import get_db
+from database import get_db, best_ranked_entries
 from emoji_dict import get_rank_emoji
 
 logger = logging.getLogger("team_commands")
@@ -502,31 +502,41 @@ class TeamCommands(commands.Cog):
         if not accounts:
             return cached_ranks
 
+        pairs = [
+            (account.get("puuid"), account.get("region"))
+            for account in accounts
+            if account.get("puuid") and account.get("region")
+        ]
+        try:
+            ranks_by_account = await riot_api.get_ranked_stats_many(pairs)
+        except Exception as error:
+            logger.warning("Failed live rank fetch for user %s: %s", user_id, error)
+            return cached_ranks
+
         all_live_ranks = []
-        for account in accounts:
-            puuid = account.get("puuid")
-            region = account.get("region")
-            if not puuid or not region:
-                continue
-            try:
-                live_ranks = await riot_api.get_ranked_stats_by_puuid(puuid, region)
-                if live_ranks:
-                    all_live_ranks.extend(live_ranks)
-                    for queue in live_ranks:
-                        db.update_ranked_stats(
-                            user_id,
-                            queue.get("queueType", ""),
-                            queue.get("tier", "UNRANKED"),
-                            queue.get("rank", ""),
-                            int(queue.get("leaguePoints", 0) or 0),
-                            int(queue.get("wins", 0) or 0),
-                            int(queue.get("losses", 0) or 0),
-                            bool(queue.get("hotStreak", False)),
-                            bool(queue.get("veteran", False)),
-                            bool(queue.get("freshBlood", False)),
-                        )
-            except Exception as error:
-                logger.warning("Failed live rank fetch for user %s account %s: %s", user_id, account.get("id"), error)
+        for puuid, region in pairs:
+            live_ranks = ranks_by_account.get((puuid, region))
+            if live_ranks:
+                all_live_ranks.extend(live_ranks)
+
+        # One row per queue for the user - store the best account, not each account in turn
+        if all(ranks_by_account.get(pair) is not None for pair in pairs):
+            for queue in best_ranked_entries(ranks_by_account.get(pair) for pair in pairs):
+                try:
+                    db.update_ranked_stats(
+                        user_id,
+                        queue.get("queueType", ""),
+                        queue.get("tier", "UNRANKED"),
+                        queue.get("rank", ""),
+                        int(queue.get("leaguePoints", 0) or 0),
+                        int(queue.get("wins", 0) or 0),
+                        int(queue.get("losses", 0) or 0),
+                        bool(queue.get("hotStreak", False)),
+                        bool(queue.get("veteran", False)),
+                        bool(queue.get("freshBlood", False)),
+                    )
+                except Exception as error:
+                    logger.warning("Failed to store rank for user %s queue %s: %s", user_id, queue.get("queueType"), error)
 
         return all_live_ranks if all_live_ranks else cached_ranks
 
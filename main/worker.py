@@ -7,8 +7,8 @@ import os
 import asyncio
 import logging
 
-from database import initialize_database, get_db
-from riot_api import RiotAPI, load_champion_data
+from database import initialize_database, get_db, best_ranked_entries
+from riot_api import RiotAPI, load_champion_data, request_lane, request_caller, start_metrics_server, BACKGROUND
 
 # Setup logging
 logging.basicConfig(
@@ -45,68 +45,31 @@ async def update_user_mastery(user_id: int, account: dict):
             logger.warning(f"Failed to get mastery for user {user_id}")
             return
         
-        # Get old mastery from database
-        old_mastery = {
-            stat['champion_id']: stat 
-            for stat in db.get_user_champion_stats(user_id)
-        }
-        
-        updates = 0
-        deltas_recorded = 0
-        
-        for champ in new_mastery:
-            champ_id = champ['championId']
-            new_points = champ['championPoints']
-            new_level = champ['championLevel']
-            
-            # Update champion stats
-            db.update_champion_mastery(
-                user_id,
-                champ_id,
-                new_points,
-                new_level,
-                champ.get('chestGranted', False),
-                champ.get('tokensEarned', 0),
-                champ.get('lastPlayTime')
-            )
-            updates += 1
-            
-            # Check for point changes (record delta)
-            if champ_id in old_mastery:
-                old_points = old_mastery[champ_id]['score']
-                delta = new_points - old_points
-                
-                # Only record if there's a change
-                if delta > 0:
-                    db.add_mastery_delta(user_id, champ_id, delta, new_points)
-                    deltas_recorded += 1
-            else:
-                # New champion - record initial value as delta
-                if new_points > 0:
-                    db.add_mastery_delta(user_id, champ_id, new_points, new_points)
-                    deltas_recorded += 1
+        # Upsert every champion and record point deltas in one round trip
+        updates, deltas_recorded = db.bulk_update_champion_mastery(user_id, new_mastery)
         
         logger.info(f"✅ Updated {updates} champions for user {user_id} ({deltas_recorded} deltas)")
         
     except Exception as e:
         logger.error(f"❌ Error updating user {user_id}: {e}")
 
-async def update_user_ranks(user_id: int, account: dict):
-    """Update ranked stats for a single user account"""
+async def update_user_ranks(user_id: int, accounts: list):
+    """Update ranked stats for a user - best entry per queue across all verified accounts
+    
+    user_ranks has one row per (user, queue, season); writing each account in turn would
+    leave whichever account came last and flip the stored rank on every pass.
+    """
     try:
-        # Get summoner data
-        summoner_data = await riot_api.get_summoner_by_puuid(
-            account['puuid'],
-            account['region']
+        ranks_by_account = await riot_api.get_ranked_stats_many(
+            [(account['puuid'], account['region']) for account in accounts]
         )
-        
-        if not summoner_data:
+        if any(ranks_by_account.get((a['puuid'], a['region'])) is None for a in accounts):
+            # A failed lookup could hide the best account - keep the stored rank until next pass
+            logger.warning(f"⚠️ Rank lookup failed for user {user_id}, keeping stored rank")
             return
         
-        # Get ranked stats
-        ranked_stats = await riot_api.get_ranked_stats(
-            summoner_data['id'],
-            account['region']
+        ranked_stats = best_ranked_entries(
+            ranks_by_account.get((a['puuid'], a['region'])) for a in accounts
         )
         
         # Decide which season to write to. Default to CURRENT_SEASON (S15).
@@ -134,8 +97,10 @@ async def update_user_ranks(user_id: int, account: dict):
         if not ranked_stats:
             return
 
+        # update_ranked_stats writes a rank change event (picked up by the bot) when tier/division/LP moved
+        changed_queues = []
         for queue in ranked_stats:
-            db.update_ranked_stats(
+            changed = db.update_ranked_stats(
                 user_id,
                 queue['queueType'],
                 queue.get('tier', 'UNRANKED'),
@@ -148,7 +113,11 @@ async def update_user_ranks(user_id: int, account: dict):
                 queue.get('freshBlood', False),
                 season=season_to_use
             )
+            if changed:
+                changed_queues.append(queue['queueType'])
         
+        if changed_queues:
+            logger.info(f"📨 Rank changed for user {user_id}: {', '.join(changed_queues)}")
         logger.info(f"✅ Updated ranks for user {user_id}")
         
     except Exception as e:
@@ -160,25 +129,26 @@ async def update_all_users():
         logger.info("🔄 Starting update cycle...")
         
         # Get all users with accounts
-        users = db.get_all_users_with_accounts()
+        rows = db.get_all_users_with_accounts()
+        accounts_by_user = {}
+        for row in rows:
+            accounts_by_user.setdefault(row['user_id'], []).append(row)
         
-        logger.info(f"📊 Found {len(users)} accounts to update")
+        logger.info(f"📊 Found {len(rows)} accounts of {len(accounts_by_user)} users to update")
         
-        for i, user_data in enumerate(users):
+        for i, (user_id, accounts) in enumerate(accounts_by_user.items()):
             try:
-                logger.info(f"Updating {i+1}/{len(users)}: User {user_data['user_id']}")
+                logger.info(f"Updating {i+1}/{len(accounts_by_user)}: User {user_id}")
                 
                 # Update mastery
-                await update_user_mastery(user_data['user_id'], user_data)
+                for account in accounts:
+                    await update_user_mastery(user_id, account)
                 
-                # Update ranks
-                await update_user_ranks(user_data['user_id'], user_data)
-                
-                # Rate limit protection - wait between users
-                await asyncio.sleep(2)
+                # Update ranks (RiotAPI's rate limiter paces the requests)
+                await update_user_ranks(user_id, accounts)
                 
             except Exception as e:
-                logger.error(f"❌ Error updating user {user_data['user_id']}: {e}")
+                logger.error(f"❌ Error updating user {user_id}: {e}")
                 continue
         
         logger.info("✅ Update cycle completed!")
@@ -195,7 +165,9 @@ async def worker_loop():
     
     while True:
         try:
-            await update_all_users()
+            # Background lane: stays under part of the rate limit so the bot keeps headroom on the shared key
+            with request_lane(BACKGROUND), request_caller('worker.update_all_users'):
+                await update_all_users()
             
             # Wait 1 hour before next update
             logger.info("⏰ Sleeping for 1 hour...")
@@ -218,11 +190,16 @@ async def main():
     
     # Initialize Riot API
     riot_api = RiotAPI(RIOT_API_KEY)
+    riot_api.use_account_store(db)
+    await start_metrics_server(riot_api)
     await load_champion_data()
     logger.info("✅ Riot API initialized")
     
     # Start worker loop
-    await worker_loop()
+    try:
+        await worker_loop()
+    finally:
+        await riot_api.close()
 
 if __name__ == "__main__":
     try:
@@ -20,6 +20,7 @@ import os
 from typing import Optional
 
 from HEXBET.config import RANK_EMOJIS as CFG_RANK_EMOJIS
+from tracker_database import get_async_tracker_db
 
 logger = logging.getLogger('crash_game')
 
@@ -137,7 +138,7 @@ class LivePhaseView(discord.ui.View):
         bet_info['cashout_mult'] = current_mult
         payout = int(bet_info['amount'] * current_mult)
         bet_info['payout'] = payout
-        self.cog.db.update_balance(user_id, payout)
+        await self.cog.adb.update_balance(user_id, payout)
 
         profit = payout - bet_info['amount']
         await interaction.response.send_message(
@@ -191,7 +192,7 @@ class CrashBetModal(discord.ui.Modal, title='🚀 Join Crash Round'):
             )
             return
 
-        balance = self.cog.db.get_balance(user_id)
+        balance = await self.cog.adb.get_balance(user_id)
         if balance < amount:
             await interaction.response.send_message(
                 f"❌ Insufficient balance. You have **{balance:,}** tokens.", ephemeral=True
@@ -209,9 +210,13 @@ class CrashBetModal(discord.ui.Modal, title='🚀 Join Crash Round'):
             except ValueError:
                 auto_cashout = None
 
-        # Deduct tokens immediately
-        self.cog.db.update_balance(user_id, -amount)
-        round_state['bets'][user_id] = {
+        # The round may have gone live (or this user joined twice) while the balance was read
+        if round_state['phase'] != 'betting' or user_id in round_state['bets']:
+            await interaction.response.send_message("❌ Betting phase has ended.", ephemeral=True)
+            return
+
+        # Take the seat before awaiting the deduction so nothing can slip in between
+        seat = {
             'user': interaction.user,
             'amount': amount,
             'auto_cashout': auto_cashout,
@@ -219,14 +224,30 @@ class CrashBetModal(discord.ui.Modal, title='🚀 Join Crash Round'):
             'cashout_mult': None,
             'payout': 0,
         }
+        round_state['bets'][user_id] = seat
+        # Deduct tokens immediately - conditional, so a bet placed elsewhere meanwhile can't overdraw
+        try:
+            new_balance = await self.cog.adb.try_spend_balance(user_id, amount)
+        except Exception as e:
+            logger.error(f"❌ Failed to deduct crash bet for {interaction.user}: {e}")
+            new_balance = None
+            error_message = "❌ Could not place your bet, please try again."
+        else:
+            error_message = "❌ Insufficient balance."
+        if new_balance is None:
+            # No unpaid seat - it could otherwise be cashed out
+            if round_state['bets'].get(user_id) is seat:
+                round_state['bets'].pop(user_id, None)
+            await interaction.response.send_message(error_message, ephemeral=True)
+            return
 
         ac_str = f" (auto-cashout at **{auto_cashout:.2f}x**)" if auto_cashout else ""
-        rank_name, division, rank_lp, rank_emoji = get_rank_info(balance - amount)
+        rank_name, division, rank_lp, rank_emoji = get_rank_info(new_balance)
         rank_str = f"{rank_emoji} {rank_name} {division}".strip()
 
         await interaction.response.send_message(
             f"✅ Joined with **{amount:,}** tokens{ac_str}!\n"
-            f"Balance: **{balance - amount:,}** tokens | {rank_str} · {rank_lp} LP",
+            f"Balance: **{new_balance:,}** tokens | {rank_str} · {rank_lp} LP",
             ephemeral=True,
         )
         logger.info(f"🚀 User {interaction.user} joined crash with {amount} tokens")
@@ -249,6 +270,7 @@ class CrashCog(commands.Cog):
     def __init__(self, bot: commands.Bot, db):
         self.bot = bot
         self.db = db
+        self.adb = get_async_tracker_db(db)
         self.current_round: Optional[dict] = None
         self._round_task: Optional[asyncio.Task] = None
         self._last_result_msg: Optional[discord.Message] = None
@@ -390,7 +412,7 @@ class CrashCog(commands.Cog):
                 history.pop(0)
 
             # Process auto-cashouts
-            for user_id, bet_info in self.current_round['bets'].items():
+            for user_id, bet_info in list(self.current_round['bets'].items()):
                 if bet_info.get('cashed_out'):
                     continue
                 ac = bet_info.get('auto_cashout')
@@ -399,7 +421,7 @@ class CrashCog(commands.Cog):
                     bet_info['cashed_out'] = True
                     bet_info['cashout_mult'] = mult
                     bet_info['payout'] = payout
-                    self.db.update_balance(user_id, payout)
+                    await self.adb.update_balance(user_id, payout)
 
             # Update embed every tick
             tick_count += 1
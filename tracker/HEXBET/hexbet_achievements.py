@@ -312,6 +312,56 @@ class UserAchievements:
         return badge_str
 
 
+# Bet achievements as thresholds on hexbet_bet_counters - a settled bet only needs the
+# milestones of the counters it moved
+COUNTER_MILESTONES = {
+    'total_bets': ((1, "first_bet"), (10, "ten_bets"), (50, "fifty_bets"), (100, "hundred_bets")),
+    'wins': ((1, "first_win"),),
+    'win_streak': ((5, "streak_five"), (10, "streak_ten")),
+}
+
+# (min bets, min win rate %, achievement)
+WIN_RATE_MILESTONES = ((20, 55, "wr_55"), (30, 60, "wr_60"))
+
+# (min profit in tokens, achievement)
+PROFIT_MILESTONES = ((1000, "profit_1k"),)
+
+
+def evaluate_bet_achievements(counters: Dict, earned: set, won: Optional[bool] = None) -> List[str]:
+    """Achievements the counters qualify for that are not in `earned`.
+
+    won is the outcome of the bet that was just added: a loss only moves the bet
+    count (which can still lift a win rate over its minimum), a win moves
+    everything. won=None checks every milestone (full re-check).
+    """
+    if won is None or won:
+        moved = ('total_bets', 'wins', 'win_streak')
+    else:
+        moved = ('total_bets',)
+
+    unlocked = []
+    for counter in moved:
+        value = counters.get(counter, 0)
+        for threshold, achievement_id in COUNTER_MILESTONES[counter]:
+            if value >= threshold and achievement_id not in earned:
+                unlocked.append(achievement_id)
+
+    total_bets = counters.get('total_bets', 0)
+    if total_bets:
+        win_rate = counters.get('wins', 0) / total_bets * 100
+        for min_bets, min_rate, achievement_id in WIN_RATE_MILESTONES:
+            if total_bets >= min_bets and win_rate >= min_rate and achievement_id not in earned:
+                unlocked.append(achievement_id)
+
+    if won is None or won:
+        profit = counters.get('total_payout', 0) - counters.get('total_wagered', 0)
+        for min_profit, achievement_id in PROFIT_MILESTONES:
+            if profit >= min_profit and achievement_id not in earned:
+                unlocked.append(achievement_id)
+
+    return unlocked
+
+
 class AchievementChecker:
     """System to check and award achievements"""
     
@@ -320,65 +370,22 @@ class AchievementChecker:
         self.hexbet_cog = hexbet_cog
     
     async def check_achievements(self, user_id: int, trigger: str = None):
-        """Check and award achievements based on user stats"""
+        """Check every bet milestone against the user's counters and award what is missing.
+
+        Settlement awards achievements itself (evaluate_bet_achievements inside
+        settle_and_pay_match); this is the full re-check for manual triggers.
+        """
         try:
             user_achievements = UserAchievements(user_id, self.db)
-            stats = self.db.get_user_betting_stats(user_id)
+            counters = self.db.get_bet_counters(user_id)
             
-            if not stats:
+            if not counters or not counters['total_bets']:
                 return []
             
             newly_earned = []
-            
-            # Check each achievement
-            if not user_achievements.has_achievement("first_bet"):
-                if stats['total_bets'] >= 1:
-                    if user_achievements.earn_achievement("first_bet"):
-                        newly_earned.append("first_bet")
-            
-            if not user_achievements.has_achievement("ten_bets"):
-                if stats['total_bets'] >= 10:
-                    if user_achievements.earn_achievement("ten_bets"):
-                        newly_earned.append("ten_bets")
-            
-            if not user_achievements.has_achievement("fifty_bets"):
-                if stats['total_bets'] >= 50:
-                    if user_achievements.earn_achievement("fifty_bets"):
-                        newly_earned.append("fifty_bets")
-            
-            if not user_achievements.has_achievement("hundred_bets"):
-                if stats['total_bets'] >= 100:
-                    if user_achievements.earn_achievement("hundred_bets"):
-                        newly_earned.append("hundred_bets")
-            
-            if not user_achievements.has_achievement("first_win"):
-                if stats['wins'] >= 1:
-                    if user_achievements.earn_achievement("first_win"):
-                        newly_earned.append("first_win")
-            
-            if not user_achievements.has_achievement("wr_55"):
-                if stats['total_bets'] >= 20 and stats['win_rate'] >= 55:
-                    if user_achievements.earn_achievement("wr_55"):
-                        newly_earned.append("wr_55")
-            
-            if not user_achievements.has_achievement("wr_60"):
-                if stats['total_bets'] >= 30 and stats['win_rate'] >= 60:
-                    if user_achievements.earn_achievement("wr_60"):
-                        newly_earned.append("wr_60")
-            
-            if not user_achievements.has_achievement("profit_1k"):
-                if stats['roi'] > 0 and (stats['total_payout'] - stats['total_wagered']) >= 1000:
-                    if user_achievements.earn_achievement("profit_1k"):
-                        newly_earned.append("profit_1k")
-            
-            # Check streak achievements
-            if stats['streak'] >= 5 and not user_achievements.has_achievement("streak_five"):
-                if user_achievements.earn_achievement("streak_five"):
-                    newly_earned.append("streak_five")
-            
-            if stats['streak'] >= 10 and not user_achievements.has_achievement("streak_ten"):
-                if user_achievements.earn_achievement("streak_ten"):
-                    newly_earned.append("streak_ten")
+            for achievement_id in evaluate_bet_achievements(counters, user_achievements.earned_achievements):
+                if user_achievements.earn_achievement(achievement_id):
+                    newly_earned.append(achievement_id)
             
             return newly_earned
         
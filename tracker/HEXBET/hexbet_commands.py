@@ -8,10 +8,12 @@ import logging
 import time
 import itertools
 import os
+from collections import deque
 from typing import Optional, List, Tuple
 
-from tracker_database import TrackerDatabase
-from riot_api import RiotAPI, platform_to_region, CHAMPION_ID_TO_NAME
+from tracker_database import TrackerDatabase, get_async_tracker_db
+from riot_api import (RiotAPI, platform_to_region, CHAMPION_ID_TO_NAME, get_ddragon, set_request_lane,
+                     set_request_caller, BACKGROUND, MatchSummary)
 from HEXBET.config import (
     ROLE_EMOJIS as CFG_ROLE_EMOJIS,
     RANK_EMOJIS as CFG_RANK_EMOJIS,
@@ -30,7 +32,7 @@ from HEXBET.dpm_scraper import scrape_dpm_pro_accounts
 from HEXBET.hexbet_config_database import get_hexbet_config_db
 from HEXBET.hexbet_webhooks import get_webhook_manager
 from HEXBET.hexbet_hub_menu import HexbetMainMenuView
-from HEXBET.hexbet_achievements import AchievementChecker, UserAchievements
+from HEXBET.hexbet_achievements import UserAchievements, evaluate_bet_achievements
 from HEXBET.hexbet_history_filter import BetHistoryView, BetAnalyticsView
 from HEXBET.hexbet_h2h_stats import HeadToHeadAnalyzer, H2HView
 
@@ -40,37 +42,21 @@ logger = logging.getLogger('hexbet')
 CHAMP_ROLES_CACHE = {}
 
 async def load_champion_roles_from_ddragon():
-    """Load champion position data from Data Dragon API - called at bot startup"""
+    """Fill champion tags/titles from the shared DDragon service (disk cached) - called at bot startup"""
     global CHAMP_ROLES_CACHE
     try:
-        # Get latest version
-        async with aiohttp.ClientSession() as session:
-            async with session.get('https://ddragon.leagueoflegends.com/api/versions.json') as resp:
-                versions = await resp.json()
-                latest_version = versions[0]
-            
-            # Get champion data - this now includes role information
-            champion_url = f'https://ddragon.leagueoflegends.com/cdn/{latest_version}/data/en_US/champion.json'
-            async with session.get(champion_url) as resp:
-                data = await resp.json()
-                
-                # Build role mappings from ddragon
-                # Note: ddragon provides 'classes' or similar tags, we'll use primary position
-                for champ_name, champ_data in data['data'].items():
-                    try:
-                        champ_id = int(champ_data['key'])
-                        # Store champion data for reference
-                        CHAMP_ROLES_CACHE[champ_id] = {
-                            'name': champ_name,
-                            'title': champ_data.get('title', ''),
-                            'tags': champ_data.get('tags', [])  # Classes/tags from ddragon
-                        }
-                    except (KeyError, ValueError):
-                        continue
+        ddragon = get_ddragon()
+        await ddragon.ensure_loaded()
+        for champ_id, champ in ddragon.champions.items():
+            # Store champion data for reference
+            CHAMP_ROLES_CACHE[champ_id] = {
+                'name': champ['id'],
+                'title': champ['title'],
+                'tags': champ['tags']  # Classes/tags from ddragon
+            }
         
-        logger.info(f"✅ Loaded {len(CHAMP_ROLES_CACHE)} champions from ddragon")
-        logger.info(f"📊 Sample: {list(CHAMP_ROLES_CACHE.items())[:3]}")  # Log first 3 for debugging
-        return True
+        logger.info(f"✅ Loaded {len(CHAMP_ROLES_CACHE)} champions from ddragon {ddragon.version}")
+        return bool(CHAMP_ROLES_CACHE)
     except Exception as e:
         logger.error(f"❌ Failed to load champion data from ddragon: {e}")
         return False
@@ -91,6 +77,7 @@ CLEANUP_INTERVAL = 1  # minute - how often to delete old settled bets
 MIN_MINUTES_BEFORE_SETTLE = 12  # 12 minutes - minimum game duration before settlement check
 POLL_INTERVAL_SECONDS = 300  # 5 minutes - avoid rate limits
 MAX_PLAYERS_TO_SCAN = 100  # Maximum players to scan per featured check (increased to find more games)
+SETTLE_FETCH_CONCURRENCY = 4  # match/timeline requests in flight per platform while settling
 
 ROLE_LABELS = [
     ("Top", CFG_ROLE_EMOJIS.get('TOP', '🗻')),
@@ -224,6 +211,8 @@ class Hexbet(commands.Cog):
         self.bot = bot
         self.riot_api = riot_api
         self.db = db
+        # Same methods as coroutines - use from tasks/handlers so queries never block the event loop
+        self.adb = get_async_tracker_db(db)
         self.config_db = get_hexbet_config_db()
         self.webhook_manager = get_webhook_manager()
         self._gm_cutoff_cache: dict[str, tuple[int, float]] = {}
@@ -233,6 +222,8 @@ class Hexbet(commands.Cog):
         self.spectate_targets = {}
         self.spectate_seen_games = set()
         self.scouting_seen_games = set()
+        self._settle_semaphores: dict[str, asyncio.Semaphore] = {}
+        self.settle_latencies = deque(maxlen=200)  # seconds from game end to payout, recent matches
         self.db.ensure_hexbet_tables()
         self.featured_task.start()
         self.leaderboard_task.start()
@@ -781,8 +772,7 @@ class Hexbet(commands.Cog):
         blue_ordered = self._assign_roles(blue_team)
         red_ordered = self._assign_roles(red_team)
 
-        await self._enrich_players(blue_ordered, region)
-        await self._enrich_players(red_ordered, region)
+        await self._enrich_players(blue_ordered + red_ordered, region)
         self._apply_lobby_average(blue_ordered + red_ordered)
 
         if all(p.get('streamer_mode', False) for p in blue_ordered) or all(p.get('streamer_mode', False) for p in red_ordered):
@@ -852,22 +842,7 @@ class Hexbet(commands.Cog):
             query_name = target['name']
 
             try:
-                riot_lookup = query_name
-                conn = self.db.get_connection()
-                cur = conn.cursor()
-                cur.execute(
-                    """
-                    SELECT riot_id FROM hexbet_verified_players
-                    WHERE LOWER(player_name) = LOWER(%s)
-                    LIMIT 1
-                    """,
-                    (query_name,),
-                )
-                row = cur.fetchone()
-                cur.close()
-                self.db.return_connection(conn)
-                if row and row[0]:
-                    riot_lookup = row[0]
+                riot_lookup = await self.adb.get_verified_riot_id_by_name(query_name) or query_name
 
                 if '#' in riot_lookup:
                     game_name, tag_line = riot_lookup.split('#', 1)
@@ -1004,8 +979,7 @@ class Hexbet(commands.Cog):
         blue_ordered = self._assign_roles(blue_team)
         red_ordered = self._assign_roles(red_team)
 
-        await self._enrich_players(blue_ordered, region)
-        await self._enrich_players(red_ordered, region)
+        await self._enrich_players(blue_ordered + red_ordered, region)
         self._apply_lobby_average(blue_ordered + red_ordered)
 
         # Find the scouted player in the enriched participants to show their real rank
@@ -1401,7 +1375,7 @@ class Hexbet(commands.Cog):
             region = region_map.get(platform, 'euw')
             
             # Get random PUUIDs from high-elo pool (reduced limit to minimize rate limits)
-            puuids = self.db.get_random_high_elo_puuids(region, limit=MAX_PLAYERS_TO_SCAN)
+            puuids = await self.adb.get_random_high_elo_puuids(region, limit=MAX_PLAYERS_TO_SCAN)
             if not puuids:
                 logger.warning(f"⚠️ No PUUIDs in pool for {region}")
                 return
@@ -1487,8 +1461,7 @@ class Hexbet(commands.Cog):
 
                     # Enrich both teams and calculate team-specific average for streamer mode
                     logger.info("🔍 Enriching player data...")
-                    await self._enrich_players(blue_ordered, region)
-                    await self._enrich_players(red_ordered, region)
+                    await self._enrich_players(blue_ordered + red_ordered, region)
                     
                     # Apply lobby-wide average for streamer mode (fairer when teams have uneven ranked players)
                     all_players = blue_ordered + red_ordered
@@ -1578,159 +1551,210 @@ class Hexbet(commands.Cog):
         except Exception as e:
             logger.error(f"Error posting featured game: {e}", exc_info=True)
 
+    def _settle_semaphore(self, platform: str) -> asyncio.Semaphore:
+        """Caps concurrent settlement Riot calls per platform"""
+        semaphore = self._settle_semaphores.get(platform)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(SETTLE_FETCH_CONCURRENCY)
+            self._settle_semaphores[platform] = semaphore
+        return semaphore
+
+    def _record_settle_latency(self, match: dict, summary: MatchSummary):
+        """Game end -> payout committed, in seconds"""
+        if not summary.game_end or summary.game_end < 10**12:
+            return
+        latency = time.time() - summary.game_end / 1000
+        self.settle_latencies.append(latency)
+        logger.info(f"⏱️ Match {match['game_id']} paid out {latency:.0f}s after game end")
+
+    def get_settle_latency_stats(self) -> dict:
+        """count / avg / p50 / p95 / max of recent game-end-to-payout latencies (seconds)"""
+        values = sorted(self.settle_latencies)
+        if not values:
+            return {'count': 0}
+        return {
+            'count': len(values),
+            'avg': sum(values) / len(values),
+            'p50': values[len(values) // 2],
+            'p95': values[min(len(values) - 1, int(len(values) * 0.95))],
+            'max': values[-1],
+        }
+
     async def try_settle_match(self):
-        """Check and settle all open matches that are ready (including scouting matches)"""
-        matches = self.db.get_open_matches() + self.db.get_open_scouting_matches()
+        """Check and settle all open matches that are ready (including scouting matches)
+
+        Match details are fetched concurrently (SETTLE_FETCH_CONCURRENCY per platform),
+        then every match that has ended is settled in parallel.
+        """
+        matches = await self.adb.get_open_matches() + await self.adb.get_open_scouting_matches()
         if not matches:
             return
-        
-        for match in matches:
-            start_time = match.get('start_time') or 0
-            if not start_time:
-                continue
-            # Wait until reasonable duration has passed to avoid early fetch
-            if (time.time() * 1000) - start_time < MIN_MINUTES_BEFORE_SETTLE * 60 * 1000:
-                continue
-            
+
+        # Wait until reasonable duration has passed to avoid early fetch
+        now_ms = time.time() * 1000
+        ready = [
+            match for match in matches
+            if match.get('start_time') and now_ms - match['start_time'] >= MIN_MINUTES_BEFORE_SETTLE * 60 * 1000
+        ]
+        if not ready:
+            return
+
+        async def fetch_summary(match: dict) -> Optional[MatchSummary]:
             platform = match.get('platform', 'euw1')
-            region = platform_to_region(platform)
             match_ref = f"{platform.upper()}_{match['game_id']}"
-            try:
-                data = await self.riot_api.get_match_details(match_ref, region)
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to pull match details for settlement: {e}")
-                continue
-            
-            if not data or 'info' not in data:
-                continue
-            
-            info = data.get('info', {})
-            game_duration = info.get('gameDuration', 0)  # Duration in seconds
-            
-            # REFUND PROTECTION: Auto-refund if game < 180 seconds (3 minutes) = remake/afk
-            if game_duration < 180:
-                logger.info(f"🔄 Game {match['game_id']} is a REMAKE ({game_duration}s < 3min) - refunding all bets")
-                refunds = self.db.refund_match(match['id'])
-                
-                # Delete match messages from ALL guilds
-                match_messages = self.db.get_match_messages(match['id'])
-                for guild_id, channel_id, message_id in match_messages:
-                    try:
-                        channel = await self._resolve_channel(channel_id)
-                        if channel:
-                            msg = await channel.fetch_message(message_id)
-                            await msg.delete()
-                            logger.info(f"🗑️ Deleted remake match message {message_id} in guild {guild_id}")
-                    except discord.NotFound:
-                        logger.info(f"Message {message_id} in guild {guild_id} already deleted")
-                    except Exception as e:
-                        logger.warning(f"Failed to delete remake message {message_id} in guild {guild_id}: {e}")
-                
-                # Log refund to bet logs channel
+            async with self._settle_semaphore(platform):
                 try:
-                    bet_logs_channel_id = self._get_channel_id(match.get('guild_id'), 'logs') if match.get('guild_id') else DEFAULT_BET_LOGS_CHANNEL_ID
-                    log_channel = self.bot.get_channel(bet_logs_channel_id)
-                    if log_channel:
-                        log_embed = discord.Embed(
-                            title="🔄 Match Refunded (Remake)",
-                            description=f"Game duration: {game_duration}s (< 3 min)",
-                            color=0x95A5A6,
-                            timestamp=discord.utils.utcnow()
-                        )
-                        log_embed.add_field(name="Match ID", value=str(match['id']), inline=True)
-                        log_embed.add_field(name="Game ID", value=str(match['game_id']), inline=True)
-                        
-                        total_refunded = sum(amount for _, amount in refunds)
-                        bettors_count = len(refunds)
-                        
-                        log_embed.add_field(name="Bettors", value=str(bettors_count), inline=True)
-                        log_embed.add_field(name="Total Refunded", value=str(total_refunded), inline=True)
-                        
-                        if bettors_count > 0:
-                            refund_list = [f"<@{uid}>: +{amount}" for uid, amount in refunds]
-                            log_embed.add_field(name="Refunds", value="\n".join(refund_list[:10]), inline=False)
-                        
-                        await log_channel.send(embed=log_embed)
+                    # Slim record: duration, winner and participant teams are all settlement reads
+                    return await self.riot_api.get_match_summary(match_ref, platform_to_region(platform))
                 except Exception as e:
-                    logger.warning(f"Failed to log refund: {e}")
-                
-                continue  # Skip to next match
-            
-            winner_team = next((t.get('teamId') for t in info.get('teams', []) if t.get('win')), None)
-            if winner_team not in (100, 200):
-                continue
-            
-            winner = 'blue' if winner_team == 100 else 'red'
-            timeline_summary = None
-            try:
-                timeline_data = await self.riot_api.get_match_timeline(match_ref, region)
-                timeline_summary = self._extract_timeline_analytics(info, timeline_data)
-            except Exception as tl_err:
-                logger.warning(f"⚠️ Failed to extract timeline analytics for {match_ref}: {tl_err}")
+                    logger.warning(f"⚠️ Failed to pull match details for settlement: {e}")
+                    return None
 
-            payouts = self.db.settle_match(match['id'], winner)
-            for user_id, amount, payout, won in payouts:
-                if payout:
-                    self.db.update_balance(user_id, payout)
-                self.db.record_result(user_id, amount, payout, won)
-                
-                # Check and award achievements
+        summaries = await asyncio.gather(*(fetch_summary(match) for match in ready))
+        # No summary yet = game still running
+        ended = [(match, summary) for match, summary in zip(ready, summaries) if summary]
+        if not ended:
+            return
+
+        results = await asyncio.gather(
+            *(self._settle_ended_match(match, summary) for match, summary in ended),
+            return_exceptions=True
+        )
+        for (match, _), result in zip(ended, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ Failed to settle match {match['game_id']}: {result}", exc_info=result)
+
+    async def _settle_ended_match(self, match: dict, summary: MatchSummary):
+        """Refund a remake or settle, pay out and announce one finished match"""
+        platform = match.get('platform', 'euw1')
+        region = platform_to_region(platform)
+        match_ref = f"{platform.upper()}_{match['game_id']}"
+        game_duration = summary.game_duration  # Duration in seconds
+        
+        # REFUND PROTECTION: Auto-refund if game < 180 seconds (3 minutes) = remake/afk
+        if game_duration < 180:
+            logger.info(f"🔄 Game {match['game_id']} is a REMAKE ({game_duration}s < 3min) - refunding all bets")
+            refunds = await self.adb.refund_match(match['id'])
+            
+            # Delete match messages from ALL guilds
+            match_messages = await self.adb.get_match_messages(match['id'])
+            for guild_id, channel_id, message_id in match_messages:
                 try:
-                    checker = AchievementChecker(self.db, self)
-                    newly_earned = await checker.check_achievements(user_id, trigger='bet_settled')
-                    if newly_earned:
-                        logger.info(f"🎖️ User {user_id} earned achievements: {', '.join(newly_earned)}")
-                except Exception as ach_err:
-                    logger.warning(f"⚠️ Failed to check achievements for user {user_id}: {ach_err}")
-            
-            await self._update_match_message(match, winner, payouts, timeline_summary=timeline_summary)
-            logger.info(f"✅ Settled match {match['game_id']} - Winner: {winner.upper()}")
-            
-            # Send webhook notification for bet result
-            try:
-                match_data = {
-                    'game_id': match['game_id'],
-                    'platform': match.get('platform'),
-                    'blue_team': match.get('blue_team', {}),
-                    'red_team': match.get('red_team', {}),
-                    'winner': winner,
-                    'payouts': [{'user_id': uid, 'bet': amt, 'payout': pay, 'won': w} for uid, amt, pay, w in payouts]
-                }
-                await self.webhook_manager.send_bet_result_notification(match['id'], winner, match_data)
-                logger.info(f"📡 Webhook notification sent for bet result {match['id']}")
-            except Exception as webhook_err:
-                logger.warning(f"⚠️ Failed to send webhook notification: {webhook_err}")
+                    channel = await self._resolve_channel(channel_id)
+                    if channel:
+                        msg = await channel.fetch_message(message_id)
+                        await msg.delete()
+                        logger.info(f"🗑️ Deleted remake match message {message_id} in guild {guild_id}")
+                except discord.NotFound:
+                    logger.info(f"Message {message_id} in guild {guild_id} already deleted")
+                except Exception as e:
+                    logger.warning(f"Failed to delete remake message {message_id} in guild {guild_id}: {e}")
             
-            # Log settlement to bet logs channel
+            # Log refund to bet logs channel
             try:
                 bet_logs_channel_id = self._get_channel_id(match.get('guild_id'), 'logs') if match.get('guild_id') else DEFAULT_BET_LOGS_CHANNEL_ID
                 log_channel = self.bot.get_channel(bet_logs_channel_id)
                 if log_channel:
                     log_embed = discord.Embed(
-                        title="🏁 Match Settled",
-                        color=0x2ECC71 if winner == 'blue' else 0xE74C3C,
+                        title="🔄 Match Refunded (Remake)",
+                        description=f"Game duration: {game_duration}s (< 3 min)",
+                        color=0x95A5A6,
                         timestamp=discord.utils.utcnow()
                     )
                     log_embed.add_field(name="Match ID", value=str(match['id']), inline=True)
                     log_embed.add_field(name="Game ID", value=str(match['game_id']), inline=True)
-                    log_embed.add_field(name="Winner", value=winner.upper(), inline=True)
                     
-                    total_paid = sum(payout for _, _, payout, _ in payouts)
-                    winners_count = sum(1 for _, _, _, won in payouts if won)
+                    total_refunded = sum(amount for _, amount in refunds)
+                    bettors_count = len(refunds)
                     
-                    log_embed.add_field(name="Winners", value=str(winners_count), inline=True)
-                    log_embed.add_field(name="Total Payout", value=str(total_paid), inline=True)
+                    log_embed.add_field(name="Bettors", value=str(bettors_count), inline=True)
+                    log_embed.add_field(name="Total Refunded", value=str(total_refunded), inline=True)
                     
-                    if winners_count > 0:
-                        winner_list = [f"<@{uid}>: +{payout}" for uid, _, payout, won in payouts if won]
-                        log_embed.add_field(name="Payouts", value="\n".join(winner_list[:10]), inline=False)
-
-                    if timeline_summary:
-                        log_embed.add_field(name="📉 Timeline Analytics", value=timeline_summary, inline=False)
+                    if bettors_count > 0:
+                        refund_list = [f"<@{uid}>: +{amount}" for uid, amount in refunds]
+                        log_embed.add_field(name="Refunds", value="\n".join(refund_list[:10]), inline=False)
                     
                     await log_channel.send(embed=log_embed)
             except Exception as e:
-                logger.warning(f"Failed to log settlement: {e}")
+                logger.warning(f"Failed to log refund: {e}")
+            
+            return
+        
+        winner_team = summary.winning_team
+        if winner_team not in (100, 200):
+            return
+        
+        winner = 'blue' if winner_team == 100 else 'red'
+
+        # Settle, credit, update stats/streaks and award achievements in one transaction -
+        # before the timeline, which only feeds the announcement
+        settled = await self.adb.settle_and_pay_match(
+            match['id'], winner, evaluate_achievements=evaluate_bet_achievements
+        )
+        if settled is None:
+            logger.info(f"⏭️ Match {match['game_id']} was already settled elsewhere")
+            return
+        payouts, earned = settled
+        for user_id, newly_earned in earned.items():
+            logger.info(f"🎖️ User {user_id} earned achievements: {', '.join(newly_earned)}")
+        self._record_settle_latency(match, summary)
+
+        timeline_summary = None
+        try:
+            async with self._settle_semaphore(platform):
+                timeline_data = await self.riot_api.get_match_timeline(match_ref, region)
+            timeline_summary = self._extract_timeline_analytics(summary, timeline_data)
+        except Exception as tl_err:
+            logger.warning(f"⚠️ Failed to extract timeline analytics for {match_ref}: {tl_err}")
+
+        await self._update_match_message(match, winner, payouts, timeline_summary=timeline_summary)
+        logger.info(f"✅ Settled match {match['game_id']} - Winner: {winner.upper()}")
+        
+        # Send webhook notification for bet result
+        try:
+            match_data = {
+                'game_id': match['game_id'],
+                'platform': match.get('platform'),
+                'blue_team': match.get('blue_team', {}),
+                'red_team': match.get('red_team', {}),
+                'winner': winner,
+                'payouts': [{'user_id': uid, 'bet': amt, 'payout': pay, 'won': w} for uid, amt, pay, w in payouts]
+            }
+            await self.webhook_manager.send_bet_result_notification(match['id'], winner, match_data)
+            logger.info(f"📡 Webhook notification sent for bet result {match['id']}")
+        except Exception as webhook_err:
+            logger.warning(f"⚠️ Failed to send webhook notification: {webhook_err}")
+        
+        # Log settlement to bet logs channel
+        try:
+            bet_logs_channel_id = self._get_channel_id(match.get('guild_id'), 'logs') if match.get('guild_id') else DEFAULT_BET_LOGS_CHANNEL_ID
+            log_channel = self.bot.get_channel(bet_logs_channel_id)
+            if log_channel:
+                log_embed = discord.Embed(
+                    title="🏁 Match Settled",
+                    color=0x2ECC71 if winner == 'blue' else 0xE74C3C,
+                    timestamp=discord.utils.utcnow()
+                )
+                log_embed.add_field(name="Match ID", value=str(match['id']), inline=True)
+                log_embed.add_field(name="Game ID", value=str(match['game_id']), inline=True)
+                log_embed.add_field(name="Winner", value=winner.upper(), inline=True)
+                
+                total_paid = sum(payout for _, _, payout, _ in payouts)
+                winners_count = sum(1 for _, _, _, won in payouts if won)
+                
+                log_embed.add_field(name="Winners", value=str(winners_count), inline=True)
+                log_embed.add_field(name="Total Payout", value=str(total_paid), inline=True)
+                
+                if winners_count > 0:
+                    winner_list = [f"<@{uid}>: +{payout}" for uid, _, payout, won in payouts if won]
+                    log_embed.add_field(name="Payouts", value="\n".join(winner_list[:10]), inline=False)
+
+                if timeline_summary:
+                    log_embed.add_field(name="📉 Timeline Analytics", value=timeline_summary, inline=False)
+                
+                await log_channel.send(embed=log_embed)
+        except Exception as e:
+            logger.warning(f"Failed to log settlement: {e}")
 
     async def _update_match_message(self, match: dict, winner: str, payouts: List[tuple], timeline_summary: Optional[str] = None):
         """Update match message to show final result and send notifications"""
@@ -2014,7 +2038,8 @@ class Hexbet(commands.Cog):
         except Exception as e:
             logger.warning(f"Error updating live odds: {e}")
 
-    async def refresh_leaderboard_embed(self, page: int = 1, sort_by: str = 'rank'):
+    async def refresh_leaderboard_embed(self, sort_by: str = 'rank'):
+        """Re-render the permanent leaderboard at page 1 (its buttons page by key from there)"""
         try:
             guild_id = self.bot.guilds[0].id if self.bot.guilds else None
             leaderboard_channel_id = self._get_channel_id(guild_id, 'leaderboard') if guild_id else DEFAULT_LEADERBOARD_CHANNEL_ID
@@ -2023,9 +2048,7 @@ class Hexbet(commands.Cog):
             if not channel:
                 return
 
-            all_players = self._compute_leaderboard(limit=None, sort_by=sort_by)
-            embed, total_pages = self._make_leaderboard_embed(all_players, page, sort_by)
-            view = LeaderboardView(self, page=page, total_pages=total_pages, sort_by=sort_by)
+            embed, view = await self._build_leaderboard(sort_by)
 
             existing = await self._find_leaderboard_message(channel)
             if existing:
@@ -2045,44 +2068,37 @@ class Hexbet(commands.Cog):
                     return msg
         return None
 
-    def _compute_leaderboard(self, limit: Optional[int] = 10, sort_by: str = 'rank'):
-        conn = self.db.get_connection()
-        try:
-            with conn.cursor() as cur:
-                base_query = """
-                    SELECT discord_id, balance, total_won, bets_won, bets_placed,
-                           CASE WHEN bets_placed>0 THEN ROUND((bets_won::decimal/bets_placed)*100,2) ELSE 0 END as win_rate
-                    FROM user_balances
-                """
-                # Always fetch all rows and sort in Python (rank sort requires it)
-                cur.execute(base_query)
-                rows = cur.fetchall()
-                res = []
-                for r in rows:
-                    balance = r[1] or 0
-                    lp_total, rank_name, division = self._balance_to_rank(balance)
-                    res.append({
-                        'discord_id': r[0],
-                        'balance': balance,
-                        'total_won': r[2] or 0,
-                        'bets_won': r[3] or 0,
-                        'bets_placed': r[4] or 0,
-                        'win_rate': float(r[5] or 0),
-                        'lp_total': lp_total,
-                        'rank_name': rank_name,
-                        'division': division,
-                    })
-                if sort_by == 'total_won':
-                    res.sort(key=lambda x: (x['total_won'], x['lp_total']), reverse=True)
-                elif sort_by == 'balance':
-                    res.sort(key=lambda x: x['balance'], reverse=True)
-                else:  # default: rank (LP)
-                    res.sort(key=lambda x: x['lp_total'], reverse=True)
-                if limit:
-                    res = res[:limit]
-                return res
-        finally:
-            self.db.return_connection(conn)
+    async def _build_leaderboard(self, sort_by: str = 'rank', page: int = 1, after=None, before=None, start=None):
+        """(embed, LeaderboardView) for one page; ranking and paging happen in SQL (see get_hexbet_leaderboard_page)"""
+        per_page = 10
+        total_players = await self.adb.get_hexbet_leaderboard_count()
+        total_pages = max(1, (total_players + per_page - 1) // per_page)
+        page = max(1, min(page, total_pages))
+
+        page_players = []
+        if page > 1 and (after is not None or before is not None or start is not None):
+            page_players = await self.adb.get_hexbet_leaderboard_page(
+                sort_by, after=after, before=before, start=start, limit=per_page
+            )
+            # Board shifted under the cursor (e.g. paged back past the top) - restart from the top
+            if before is not None and len(page_players) < per_page:
+                page_players = []
+        if not page_players:
+            page = 1
+            page_players = await self.adb.get_hexbet_leaderboard_page(sort_by, limit=per_page)
+
+        # Copies: the top page is shared with the database cache
+        page_players = [dict(row) for row in page_players]
+        for row in page_players:
+            row['lp_total'], row['rank_name'], row['division'] = self._balance_to_rank(row['balance'])
+
+        embed = self._make_leaderboard_embed(page_players, page, sort_by, total_players, total_pages)
+        keys = [self.db.leaderboard_key(row, sort_by) for row in page_players]
+        view = LeaderboardView(
+            self, page=page, total_pages=total_pages, sort_by=sort_by,
+            first_key=keys[0] if keys else None, last_key=keys[-1] if keys else None,
+        )
+        return embed, view
 
     @staticmethod
     def _balance_to_rank(balance: int):
@@ -2100,14 +2116,11 @@ class Hexbet(commands.Cog):
         divisions = ['IV', 'III', 'II', 'I']
         return lp, TIER_ORDER[tier_idx], divisions[div_idx]
 
-    def _make_leaderboard_embed(self, all_players: list, page: int, sort_by: str) -> tuple:
-        """Build a leaderboard embed for the given page. Returns (embed, total_pages)."""
-        total_players = len(all_players)
+    def _make_leaderboard_embed(self, page_players: list, page: int, sort_by: str,
+                                total_players: int, total_pages: int) -> discord.Embed:
+        """Build a leaderboard embed for one already-fetched page."""
         per_page = 10
-        total_pages = max(1, (total_players + per_page - 1) // per_page)
-        page = max(1, min(page, total_pages))
         start_idx = (page - 1) * per_page
-        page_players = all_players[start_idx:start_idx + per_page]
 
         sort_titles = {'rank': 'Rank 🏆', 'balance': 'Balance 💰', 'total_won': 'Won 🏅'}
         sort_title = sort_titles.get(sort_by, 'Rank 🏆')
@@ -2147,7 +2160,7 @@ class Hexbet(commands.Cog):
                 ),
                 inline=False,
             )
-        return embed, total_pages
+        return embed
 
     def _assign_roles(self, players: List[dict]) -> List[dict]:
         """
@@ -2469,19 +2482,23 @@ class Hexbet(commands.Cog):
         return final_ordered
 
     async def _enrich_players(self, players: List[dict], region: str):
+        # Primary path: one batched by-PUUID lookup for the whole lobby (rank cache + per-platform fan-out).
+        puuid_ranks = {}
+        pairs = [(p['puuid'], region) for p in players if p.get('puuid')]
+        if pairs:
+            try:
+                puuid_ranks = await self.riot_api.get_ranked_stats_many(pairs)
+            except Exception as e:
+                logger.warning(f"⚠️ Batched ranked-by-puuid failed for {len(pairs)} players: {e}")
+
         async def _fetch_rank_stats(player: dict) -> List[dict]:
             puuid = player.get('puuid')
             if not puuid:
                 logger.warning(f"⚠️ Player {player.get('riotIdGameName', 'unknown')} missing PUUID - keys: {list(player.keys())}")
 
-            # Primary path: by PUUID (most reliable when available).
-            if puuid:
-                try:
-                    stats_by_puuid = await self.riot_api.get_ranked_stats_by_puuid(puuid, region)
-                    if isinstance(stats_by_puuid, list):
-                        return stats_by_puuid
-                except Exception as e:
-                    logger.warning(f"⚠️ Ranked-by-puuid failed for {player.get('summonerName', 'unknown')}: {e}")
+            stats_by_puuid = puuid_ranks.get((puuid, region)) if puuid else None
+            if isinstance(stats_by_puuid, list):
+                return stats_by_puuid
 
             # Fallback path: by encrypted summonerId from spectator payload.
             summoner_id = player.get('summonerId')
@@ -2504,6 +2521,15 @@ class Hexbet(commands.Cog):
 
         tasks_rank = [_fetch_rank_stats_guarded(p) for p in players]
         ranks = await asyncio.gather(*tasks_rank, return_exceptions=True)
+
+        # Verified pro/streamer names for the whole lobby in one query
+        try:
+            verified = await self.adb.get_verified_players_by_riot_ids(
+                [p.get('riotId') for p in players if p.get('riotId')]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load ProNames for lobby: {e}")
+            verified = {}
         
         # First pass: get basic stats and mark streamer mode
         for p, r in zip(players, ranks):
@@ -2571,36 +2597,24 @@ class Hexbet(commands.Cog):
             
             # If not in static database, check lolpros.gg and database (async)
             if not badge and riot_id:
-                badge = await check_and_verify_player(riot_id, self.db)
+                badge = await check_and_verify_player(riot_id, self.adb)
             
             p['is_pro'] = badge == get_pro_emoji() if badge else is_pro_player(riot_id)
             p['is_streamer'] = badge == get_streamer_emoji() if badge else is_streamer_player(riot_id)
             p['badge_emoji'] = badge
             
-            # Load ProName and badge from database if player is verified pro/streamer
-            if riot_id:
-                try:
-                    conn = self.db.get_connection()
-                    cursor = conn.cursor()
-                    cursor.execute(
-                        "SELECT player_name, player_type FROM hexbet_verified_players WHERE riot_id = %s",
-                        (riot_id,)
-                    )
-                    result = cursor.fetchone()
-                    cursor.close()
-                    self.db.return_connection(conn)
-                    if result:
-                        p['pro_name'] = result[0]
-                        player_type = result[1]
-                        # Always set badge for verified players (override any previous value)
-                        if player_type == 'pro':
-                            p['badge_emoji'] = get_pro_emoji()
-                            logger.info(f"🎖️ Set PRO badge for {p['pro_name']} ({riot_id})")
-                        elif player_type == 'streamer':
-                            p['badge_emoji'] = get_streamer_emoji()
-                            logger.info(f"📺 Set STREAMER badge for {p['pro_name']} ({riot_id})")
-                except Exception as e:
-                    logger.warning(f"Failed to load ProName for {riot_id}: {e}")
+            # ProName and badge if player is verified pro/streamer
+            result = verified.get(riot_id) if riot_id else None
+            if result:
+                p['pro_name'] = result[0]
+                player_type = result[1]
+                # Always set badge for verified players (override any previous value)
+                if player_type == 'pro':
+                    p['badge_emoji'] = get_pro_emoji()
+                    logger.info(f"🎖️ Set PRO badge for {p['pro_name']} ({riot_id})")
+                elif player_type == 'streamer':
+                    p['badge_emoji'] = get_streamer_emoji()
+                    logger.info(f"📺 Set STREAMER badge for {p['pro_name']} ({riot_id})")
 
     
     async def _should_skip_game(self, blue_team: List[dict], red_team: List[dict]) -> bool:
@@ -2904,7 +2918,7 @@ class Hexbet(commands.Cog):
             lines.append(f"**Suspicious:** {smurf_str}")
         return "\n".join(lines)
 
-    def _extract_timeline_analytics(self, match_info: dict, timeline_data: Optional[dict]) -> Optional[str]:
+    def _extract_timeline_analytics(self, match: MatchSummary, timeline_data: Optional[dict]) -> Optional[str]:
         """Extract concise post-game analytics from Match-V5 timeline payload."""
         if not timeline_data or not isinstance(timeline_data, dict):
             return None
@@ -2914,12 +2928,9 @@ class Hexbet(commands.Cog):
         if not frames:
             return None
 
-        participant_team = {}
-        for p in match_info.get('participants', []):
-            pid = p.get('participantId')
-            tid = p.get('teamId')
-            if isinstance(pid, int) and tid in (100, 200):
-                participant_team[pid] = tid
+        participant_team = {
+            pid: tid for pid, tid in enumerate(match.participant_teams, start=1) if tid in (100, 200)
+        }
 
         kills = {100: 0, 200: 0}
         dragon_types = {100: [], 200: []}
@@ -3009,7 +3020,7 @@ class Hexbet(commands.Cog):
         else:
             gold_line = "Gold@15: Even"
 
-        game_duration_min = max(1, int((match_info.get('gameDuration', 0) or 0) / 60))
+        game_duration_min = max(1, int(match.game_duration / 60))
         total_kills = kills[100] + kills[200]
         kill_pace = total_kills / game_duration_min
 
@@ -4030,7 +4041,7 @@ class Hexbet(commands.Cog):
         
         for platform, region in region_map.items():
             try:
-                puuids = self.db.get_random_high_elo_puuids(region, limit=10)
+                puuids = await self.adb.get_random_high_elo_puuids(region, limit=10)
                 
                 if not puuids:
                     results.append(f"❌ {platform.upper()}: **No players in pool**")
@@ -4051,6 +4062,13 @@ class Hexbet(commands.Cog):
             except Exception as e:
                 results.append(f"❌ {platform.upper()}: **{str(e)[:50]}**")
         
+        latency = self.get_settle_latency_stats()
+        if latency['count']:
+            results.append(
+                f"⏱️ Settlement: **p50 {latency['p50']:.0f}s / p95 {latency['p95']:.0f}s** "
+                f"from game end to payout ({latency['count']} matches)"
+            )
+
         summary = "**HEXBET Debug - High-Elo Pool**\n\n" + "\n".join(results)
         await interaction.followup.send(summary, ephemeral=False)
 
@@ -4218,8 +4236,7 @@ class Hexbet(commands.Cog):
                     
                     # Enrich player data
                     logger.info("🔍 Enriching player data...")
-                    await self._enrich_players(blue_ordered, region)
-                    await self._enrich_players(red_ordered, region)
+                    await self._enrich_players(blue_ordered + red_ordered, region)
                     self._apply_lobby_average(blue_ordered + red_ordered)
                     
                     score_blue = self._team_score(blue_ordered)
@@ -4598,7 +4615,7 @@ class Hexbet(commands.Cog):
         }
         
         logger.info(f"🔄 Starting pool fetch: {len(regions)} regions, sample_size={sample_size}")
-        logger.info(f"📝 Regions will be processed sequentially to avoid rate limits")
+        logger.info(f"📝 Regions are processed sequentially, RiotAPI paces requests to the rate limits")
         
         for idx, region in enumerate(regions, 1):
             region_count = 0
@@ -4632,16 +4649,11 @@ class Hexbet(commands.Cog):
                             total_fetched += 1
                             region_count += 1
                             diagnostics['summoner_lookup_successes'] += 1
-                    
-                    # Rate limit between individual summoner fetches
-                    if idx % 10 == 0 and idx > 0:
-                        await asyncio.sleep(0.5)
                 
                 logger.info(f"✅ {region} Challenger: fetched {region_count}/{len(sampled)} players")
             else:
                 diagnostics['league_endpoints_empty'] += 1
                 logger.warning(f"⚠️ {region} Challenger: No data returned")
-            await asyncio.sleep(1.2)  # Rate limit
             
             # Grandmaster
             logger.info(f"🔍 Fetching Grandmaster from {region}")
@@ -4671,15 +4683,11 @@ class Hexbet(commands.Cog):
                             total_fetched += 1
                             region_count += 1
                             diagnostics['summoner_lookup_successes'] += 1
-                        
-                        if idx % 10 == 0 and idx > 0:
-                            await asyncio.sleep(0.5)
                 
                 logger.info(f"✅ {region} Grandmaster: fetched {region_count - gm_start}/{len(sampled)} players")
             else:
                 diagnostics['league_endpoints_empty'] += 1
                 logger.warning(f"⚠️ {region} Grandmaster: No data returned")
-            await asyncio.sleep(1.2)
             
             # Master
             logger.info(f"🔍 Fetching Master from {region}")
@@ -4709,15 +4717,11 @@ class Hexbet(commands.Cog):
                             total_fetched += 1
                             region_count += 1
                             diagnostics['summoner_lookup_successes'] += 1
-                        
-                        if idx % 10 == 0 and idx > 0:
-                            await asyncio.sleep(0.5)
                 
                 logger.info(f"✅ {region} Master: fetched {region_count - master_start}/{len(sampled)} players")
             else:
                 diagnostics['league_endpoints_empty'] += 1
                 logger.warning(f"⚠️ {region} Master: No data returned")
-            await asyncio.sleep(1.2)
             
             # Diamond I (page 1 only, ~200 players)
             logger.info(f"🔍 Fetching Diamond I from {region}")
@@ -4746,25 +4750,17 @@ class Hexbet(commands.Cog):
                             total_fetched += 1
                             region_count += 1
                             diagnostics['summoner_lookup_successes'] += 1
-                        
-                        if idx % 10 == 0 and idx > 0:
-                            await asyncio.sleep(0.5)
                 
                 logger.info(f"✅ {region} Diamond I: fetched {region_count - dia_start}/{len(sampled)} players")
             else:
                 diagnostics['league_endpoints_empty'] += 1
                 logger.warning(f"⚠️ {region} Diamond I: No data returned")
-            await asyncio.sleep(1.2)
             
             if region_count > 0:
                 summary_lines.append(f"• {region.upper()}: {region_count} players")
                 logger.info(f"✅ {region.upper()} total: {region_count} players fetched")
             else:
                 logger.warning(f"⚠️ {region.upper()}: No players fetched")
-            
-            # Wait 3 seconds between regions to avoid rate limiting
-            logger.info(f"⏸️ Waiting 3s before next region...")
-            await asyncio.sleep(3)
         
         logger.info(f"📊 Fetch completed: {total_fetched} total players from {len(regions)} regions")
         
@@ -4822,6 +4818,9 @@ class Hexbet(commands.Cog):
     @tasks.loop(hours=1)
     async def pool_update_task(self):
         """Auto-update player pool every hour"""
+        # Pool refresh only uses Riot API capacity left over by commands
+        set_request_lane(BACKGROUND)
+        set_request_caller('hexbet.pool_update')
         try:
             logger.info("🔄 Hourly player pool update started...")
             fetched, summary, diagnostics = await self._fetch_and_update_pool(sample_size=50)
@@ -6227,6 +6226,7 @@ These players will now appear more frequently in betting matches!"""
                                 logger.warning(f"⚠️ Failed to delete bet embed for match {match_id}: {e}")
                     
                     conn.commit()
+                    self.db.invalidate_leaderboard()
                     await interaction.followup.send(f"✅ Closed {len(matches)} open matches and deleted {deleted_embeds} bet embeds", ephemeral=True)
                 else:
                     await interaction.followup.send("ℹ️ No open matches to close", ephemeral=True)
@@ -6645,8 +6645,7 @@ class SpecialBetModal(discord.ui.Modal, title='Create Special Bet (1000 tokens)'
             red_ordered = self.cog._assign_roles(red_team)
             
             # Enrich player data
-            await self.cog._enrich_players(blue_ordered, region)
-            await self.cog._enrich_players(red_ordered, region)
+            await self.cog._enrich_players(blue_ordered + red_ordered, region)
             
             # Apply lobby-wide average for streamer mode
             all_players = blue_ordered + red_ordered
@@ -6912,12 +6911,16 @@ class BetOUModal(discord.ui.Modal, title='Game Length: Over/Under 22.5 min'):
 
 
 class LeaderboardView(discord.ui.View):
-    def __init__(self, cog: 'Hexbet', page: int = 1, total_pages: int = 1, sort_by: str = 'rank'):
+    def __init__(self, cog: 'Hexbet', page: int = 1, total_pages: int = 1, sort_by: str = 'rank',
+                 first_key: Optional[tuple] = None, last_key: Optional[tuple] = None):
         super().__init__(timeout=None)
         self.cog = cog
         self.page = page
         self.total_pages = total_pages
         self.sort_by = sort_by
+        # Keyset bounds of the page on screen (see TrackerDatabase.get_hexbet_leaderboard_page)
+        self.first_key = first_key
+        self.last_key = last_key
 
         # Disable navigation buttons if on first/last page
         self.children[1].disabled = (page == 1)           # Previous (index 1 after dropdown)
@@ -6934,10 +6937,7 @@ class LeaderboardView(discord.ui.View):
     )
     async def sort_select(self, interaction: discord.Interaction, select: discord.ui.Select):
         try:
-            new_sort = select.values[0]
-            all_players = self.cog._compute_leaderboard(limit=None, sort_by=new_sort)
-            embed, total_pages = self.cog._make_leaderboard_embed(all_players, 1, new_sort)
-            new_view = LeaderboardView(self.cog, page=1, total_pages=total_pages, sort_by=new_sort)
+            embed, new_view = await self.cog._build_leaderboard(select.values[0])
             await interaction.response.edit_message(embed=embed, view=new_view)
         except Exception as e:
             logger.error(f"Failed to change sort: {e}")
@@ -6946,10 +6946,9 @@ class LeaderboardView(discord.ui.View):
     @discord.ui.button(label="◀️ Previous", style=discord.ButtonStyle.secondary, custom_id="hexbet_leaderboard_prev")
     async def previous_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
-            all_players = self.cog._compute_leaderboard(limit=None, sort_by=self.sort_by)
-            new_page = max(1, self.page - 1)
-            embed, total_pages = self.cog._make_leaderboard_embed(all_players, new_page, self.sort_by)
-            new_view = LeaderboardView(self.cog, page=new_page, total_pages=total_pages, sort_by=self.sort_by)
+            embed, new_view = await self.cog._build_leaderboard(
+                self.sort_by, page=self.page - 1, before=self.first_key
+            )
             await interaction.response.edit_message(embed=embed, view=new_view)
         except Exception as e:
             logger.error(f"Failed to go to previous page: {e}")
@@ -6958,9 +6957,9 @@ class LeaderboardView(discord.ui.View):
     @discord.ui.button(label="🔄 Refresh", style=discord.ButtonStyle.primary, custom_id="hexbet_leaderboard_refresh")
     async def refresh_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
-            all_players = self.cog._compute_leaderboard(limit=None, sort_by=self.sort_by)
-            embed, total_pages = self.cog._make_leaderboard_embed(all_players, self.page, self.sort_by)
-            new_view = LeaderboardView(self.cog, page=self.page, total_pages=total_pages, sort_by=self.sort_by)
+            embed, new_view = await self.cog._build_leaderboard(
+                self.sort_by, page=self.page, start=self.first_key
+            )
             await interaction.response.edit_message(embed=embed, view=new_view)
         except Exception as e:
             logger.error(f"Failed to refresh leaderboard: {e}")
@@ -6969,10 +6968,9 @@ class LeaderboardView(discord.ui.View):
     @discord.ui.button(label="Next ▶️", style=discord.ButtonStyle.secondary, custom_id="hexbet_leaderboard_next")
     async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
-            all_players = self.cog._compute_leaderboard(limit=None, sort_by=self.sort_by)
-            new_page = min(self.total_pages, self.page + 1)
-            embed, total_pages = self.cog._make_leaderboard_embed(all_players, new_page, self.sort_by)
-            new_view = LeaderboardView(self.cog, page=new_page, total_pages=total_pages, sort_by=self.sort_by)
+            embed, new_view = await self.cog._build_leaderboard(
+                self.sort_by, page=self.page + 1, after=self.last_key
+            )
             await interaction.response.edit_message(embed=embed, view=new_view)
         except Exception as e:
             logger.error(f"Failed to go to next page: {e}")
@@ -3,14 +3,21 @@ HEXBET Configuration Database
 Manages per-guild configuration for HEXBET bot
 """
 
-import psycopg2
 from psycopg2.extras import RealDictCursor
 import os
+import sys
 import logging
 from typing import Optional, Dict, List, Tuple
 import hashlib
 import secrets
 
+# Shared helpers live in <repo>/apis (connection pool)
+apis_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'apis'))
+if apis_dir not in sys.path:
+    sys.path.insert(0, apis_dir)
+
+from db_pool import get_shared_pool
+
 logger = logging.getLogger('hexbet_config')
 
 DATABASE_URL = os.getenv('DATABASE_URL')
@@ -21,11 +28,12 @@ class HexbetConfigDB:
     
     def __init__(self, database_url: str = None):
         self.database_url = database_url or DATABASE_URL
+        self.pool = get_shared_pool(self.database_url, name='tracker-shared')
         self._ensure_tables()
     
     def get_connection(self):
-        """Get database connection"""
-        return psycopg2.connect(self.database_url)
+        """Borrow a pooled connection: `with self.get_connection() as conn:` commits and returns it"""
+        return self.pool.connection()
     
     def _ensure_tables(self):
         """Create necessary tables if they don't exist"""
@@ -281,6 +289,12 @@ class HexbetConfigDB:
                 return cur.rowcount > 0
 
 
+_config_db: Optional[HexbetConfigDB] = None
+
+
 def get_hexbet_config_db() -> HexbetConfigDB:
     """Get singleton instance of config database"""
-    return HexbetConfigDB()
+    global _config_db
+    if _config_db is None:
+        _config_db = HexbetConfigDB()
+    return _config_db
@@ -13,12 +13,7 @@ import logging
 from typing import Optional, List
 from datetime import datetime, timedelta
 
-from .lfg_database import (
-    get_lfg_profile, create_lfg_profile, update_lfg_profile,
-    create_lfg_listing, get_active_listings, update_listing_status,
-    cleanup_expired_listings, get_all_lfg_profiles, get_lfg_profiles_count,
-    update_saved_description, get_user_active_listings
-)
+from .lfg_database import aio as lfg_db, get_lfg_profiles_count
 from .config import (
     LFG_LISTINGS_CHANNEL_ID, LFG_PROFILES_CHANNEL_ID, 
     LISTING_EXPIRATION_HOURS, COLORS, PROFILES_PER_PAGE,
@@ -232,7 +227,7 @@ class RoleSelectView(View):
                 return
             
             # Create profile
-            success = create_lfg_profile(
+            success = await lfg_db.create_lfg_profile(
                 user_id=self.user_id,
                 riot_id_game_name=self.game_name,
                 riot_id_tagline=self.tagline,
@@ -256,7 +251,7 @@ class RoleSelectView(View):
                             flex_rank = f"{queue['tier']} {queue['rank']}"
                 
                 # Update profile with rank data
-                update_lfg_profile(self.user_id, solo_rank=solo_rank, flex_rank=flex_rank)
+                await lfg_db.update_lfg_profile(self.user_id, solo_rank=solo_rank, flex_rank=flex_rank)
                 
                 # Create settings embed similar to screenshot
                 embed = discord.Embed(
@@ -337,7 +332,7 @@ class RoleSelectView(View):
 async def refresh_user_listings(bot, user_id: int, updated_profile: dict):
     """Refresh all active listing embeds for a user with updated profile data."""
     try:
-        listings = get_user_active_listings(user_id)
+        listings = await lfg_db.get_user_active_listings(user_id)
         
         if not listings:
             return 0
@@ -422,7 +417,7 @@ class EditRiotIDModal(discord.ui.Modal, title="Change Riot ID"):
             return
         
         # Update profile
-        success = update_lfg_profile(
+        success = await lfg_db.update_lfg_profile(
             self.user_id,
             riot_id_game_name=game_name,
             riot_id_tagline=tagline
@@ -430,7 +425,7 @@ class EditRiotIDModal(discord.ui.Modal, title="Change Riot ID"):
         
         if success:
             # Refresh active listings
-            updated_profile = get_lfg_profile(self.user_id)
+            updated_profile = await lfg_db.get_lfg_profile(self.user_id)
             refreshed = await refresh_user_listings(self.bot, self.user_id, updated_profile)
             
             msg = f"✅ Riot ID updated to: **{game_name}#{tagline}**"
@@ -473,11 +468,11 @@ class EditRegionModal(discord.ui.Modal, title="Change Region"):
             return
         
         # Update profile
-        success = update_lfg_profile(self.user_id, region=region_input)
+        success = await lfg_db.update_lfg_profile(self.user_id, region=region_input)
         
         if success:
             # Refresh active listings
-            updated_profile = get_lfg_profile(self.user_id)
+            updated_profile = await lfg_db.get_lfg_profile(self.user_id)
             refreshed = await refresh_user_listings(self.bot, self.user_id, updated_profile)
             
             msg = f"✅ Region updated to: **{REGIONS[region_input]}**"
@@ -524,11 +519,11 @@ class EditProfileLinkModal(discord.ui.Modal, title="Edit Profile Link"):
                 return
         
         # Update profile (empty string to remove link)
-        success = update_lfg_profile(self.user_id, profile_link=link if link else None)
+        success = await lfg_db.update_lfg_profile(self.user_id, profile_link=link if link else None)
         
         if success:
             # Refresh active listings
-            updated_profile = get_lfg_profile(self.user_id)
+            updated_profile = await lfg_db.get_lfg_profile(self.user_id)
             refreshed = await refresh_user_listings(self.bot, self.user_id, updated_profile)
             
             if link:
@@ -575,28 +570,17 @@ class ConfirmDeleteModal(discord.ui.Modal, title="Delete Profile - Confirm"):
             return
         
         # Delete profile from database
-        from .lfg_database import get_db_connection
-        conn = get_db_connection()
-        cur = conn.cursor()
-        
-        try:
-            cur.execute("DELETE FROM lfg_profiles WHERE user_id = %s", (self.user_id,))
-            conn.commit()
-            
+        if await lfg_db.delete_lfg_profile(self.user_id):
             await interaction.response.send_message(
                 "✅ Profile deleted successfully!\n\n"
                 "You can create a new profile anytime with `/lfgsetup`",
                 ephemeral=True
             )
-        except Exception as e:
-            conn.rollback()
+        else:
             await interaction.response.send_message(
                 "❌ Failed to delete profile. Please try again.",
                 ephemeral=True
             )
-        finally:
-            cur.close()
-            conn.close()
 
 
 class ProfileEditView(View):
@@ -644,7 +628,7 @@ class ProfileEditView(View):
         current_voice = self.current_profile.get('voice_required', False)
         new_voice = not current_voice
         
-        update_lfg_profile(self.user_id, voice_required=new_voice)
+        await lfg_db.update_lfg_profile(self.user_id, voice_required=new_voice)
         self.current_profile['voice_required'] = new_voice
         
         await interaction.response.send_message(
@@ -688,10 +672,10 @@ class ProfileDescriptionModal(discord.ui.Modal, title="Profile Description"):
             self.description.default = current_description
     
     async def on_submit(self, interaction: discord.Interaction):
-        update_lfg_profile(self.user_id, description=self.description.value)
+        await lfg_db.update_lfg_profile(self.user_id, description=self.description.value)
         
         # Refresh active listings
-        updated_profile = get_lfg_profile(self.user_id)
+        updated_profile = await lfg_db.get_lfg_profile(self.user_id)
         refreshed = await refresh_user_listings(self.bot, self.user_id, updated_profile)
         
         msg = "✅ Description updated!"
@@ -720,7 +704,7 @@ class PlaystyleSelectView(View):
     
     async def style_callback(self, interaction: discord.Interaction):
         style_id = interaction.data['custom_id'].replace('style_', '')
-        update_lfg_profile(self.user_id, playstyle=style_id)
+        await lfg_db.update_lfg_profile(self.user_id, playstyle=style_id)
         
         style_name = PLAYSTYLES[style_id]['name']
         await interaction.response.send_message(
@@ -866,10 +850,8 @@ class CreateListingView(View):
     
     async def edit_profile_callback(self, interaction: discord.Interaction):
         """Open profile edit menu."""
-        from .lfg_database import get_lfg_profile
-        
         # Refresh profile data
-        profile = get_lfg_profile(self.user_id)
+        profile = await lfg_db.get_lfg_profile(self.user_id)
         if not profile:
             await interaction.response.send_message(
                 "❌ Profile not found!",
@@ -913,7 +895,7 @@ class CreateListingView(View):
         await interaction.response.defer(ephemeral=True)
         
         # Create listing in database
-        listing_id = create_lfg_listing(
+        listing_id = await lfg_db.create_lfg_listing(
             creator_user_id=self.user_id,
             queue_type=self.queue_type,
             roles_needed=self.roles_needed,
@@ -938,7 +920,7 @@ class CreateListingView(View):
         channel = interaction.guild.get_channel(LFG_LISTINGS_CHANNEL_ID)
         if channel:
             message = await channel.send(embed=embed, view=view)
-            update_listing_status(listing_id, 'active', message.id)
+            await lfg_db.update_listing_status(listing_id, 'active', message.id)
         else:
             await interaction.followup.send(
                 f"⚠️ LFG channel not found (ID: {LFG_LISTINGS_CHANNEL_ID}). Contact an administrator.",
@@ -1093,7 +1075,7 @@ class EditDescriptionModal(discord.ui.Modal, title="Edit Description"):
         new_description = self.description_input.value
         
         # Update saved description in database
-        success = update_saved_description(self.user_id, new_description)
+        success = await lfg_db.update_saved_description(self.user_id, new_description)
         
         if success:
             # Update the embed
@@ -1177,7 +1159,7 @@ class ListingActionView(View):
             )
             return
         
-        update_listing_status(self.listing_id, 'filled')
+        await lfg_db.update_listing_status(self.listing_id, 'filled')
         
         embed = interaction.message.embeds[0]
         embed.color = discord.Color.greyple()
@@ -1218,7 +1200,7 @@ class LFGCommands(commands.Cog):
     @tasks.loop(minutes=30)
     async def cleanup_task(self):
         """Periodically cleanup expired listings."""
-        cleanup_expired_listings()
+        await lfg_db.cleanup_expired_listings()
     
     @cleanup_task.before_loop
     async def before_cleanup(self):
@@ -1240,7 +1222,7 @@ class LFGCommands(commands.Cog):
     ):
         """Create LFG profile with interactive setup."""
         # Check if profile exists
-        existing = get_lfg_profile(interaction.user.id)
+        existing = await lfg_db.get_lfg_profile(interaction.user.id)
         if existing:
             await interaction.response.send_message(
                 "❌ You already have a profile!\n\n"
@@ -1330,7 +1312,7 @@ class LFGCommands(commands.Cog):
     ):
         """Display LFG profile."""
         target_user = user or interaction.user
-        profile = get_lfg_profile(target_user.id)
+        profile = await lfg_db.get_lfg_profile(target_user.id)
         
         if not profile:
             if target_user == interaction.user:
@@ -1398,7 +1380,7 @@ class LFGCommands(commands.Cog):
     @app_commands.command(name="lfgedit", description="Edit your LFG profile")
     async def lfgedit(self, interaction: discord.Interaction):
         """Edit LFG profile."""
-        profile = get_lfg_profile(interaction.user.id)
+        profile = await lfg_db.get_lfg_profile(interaction.user.id)
         
         if not profile:
             await interaction.response.send_message(
@@ -1420,7 +1402,7 @@ class LFGCommands(commands.Cog):
     @app_commands.command(name="lfg", description="Find teammates - create your listing!")
     async def lfg(self, interaction: discord.Interaction):
         """Create LFG listing."""
-        profile = get_lfg_profile(interaction.user.id)
+        profile = await lfg_db.get_lfg_profile(interaction.user.id)
         
         if not profile:
             await interaction.response.send_message(
@@ -1463,7 +1445,7 @@ class LFGCommands(commands.Cog):
         region: Optional[str] = None
     ):
         """Browse active LFG listings."""
-        listings = get_active_listings(region=region, queue_type=queue_type, limit=10)
+        listings = await lfg_db.get_active_listings(region=region, queue_type=queue_type, limit=10)
         
         if not listings:
             filters_text = []
@@ -1580,9 +1562,10 @@ class ProfileListView(View):
         # Update button states
         self.update_buttons()
     
-    def update_buttons(self):
-        """Update button states based on current page."""
-        total_profiles = get_lfg_profiles_count()
+    def update_buttons(self, total_profiles: Optional[int] = None):
+        """Update button states based on current page (pass the count when it was already awaited)."""
+        if total_profiles is None:
+            total_profiles = get_lfg_profiles_count()
         total_pages = (total_profiles + self.profiles_per_page - 1) // self.profiles_per_page
         
         # Disable/enable buttons
@@ -1597,7 +1580,7 @@ class ProfileListView(View):
         """Go to previous page."""
         if self.page > 0:
             self.page -= 1
-            self.update_buttons()
+            self.update_buttons(await lfg_db.get_lfg_profiles_count())
             embed = await self.create_profile_list_embed()
             await interaction.response.edit_message(embed=embed, view=self)
         else:
@@ -1611,12 +1594,12 @@ class ProfileListView(View):
     @discord.ui.button(label="Next ▶️", style=discord.ButtonStyle.secondary, custom_id="profile_list_next")
     async def next_button(self, interaction: discord.Interaction, button: Button):
         """Go to next page."""
-        total_profiles = get_lfg_profiles_count()
+        total_profiles = await lfg_db.get_lfg_profiles_count()
         total_pages = (total_profiles + self.profiles_per_page - 1) // self.profiles_per_page
         
         if self.page < total_pages - 1:
             self.page += 1
-            self.update_buttons()
+            self.update_buttons(total_profiles)
             embed = await self.create_profile_list_embed()
             await interaction.response.edit_message(embed=embed, view=self)
         else:
@@ -1625,15 +1608,15 @@ class ProfileListView(View):
     @discord.ui.button(label="🔄 Refresh", style=discord.ButtonStyle.success, custom_id="profile_list_refresh", row=1)
     async def refresh_button(self, interaction: discord.Interaction, button: Button):
         """Refresh the profile list."""
-        self.update_buttons()
+        self.update_buttons(await lfg_db.get_lfg_profiles_count())
         embed = await self.create_profile_list_embed()
         await interaction.response.edit_message(embed=embed, view=self)
     
     async def create_profile_list_embed(self) -> discord.Embed:
         """Create embed with profile list for current page."""
         offset = self.page * self.profiles_per_page
-        profiles = get_all_lfg_profiles(limit=self.profiles_per_page, offset=offset)
-        total_profiles = get_lfg_profiles_count()
+        profiles = await lfg_db.get_all_lfg_profiles(limit=self.profiles_per_page, offset=offset)
+        total_profiles = await lfg_db.get_lfg_profiles_count()
         
         embed = discord.Embed(
             title="🎮 LFG Profile List",
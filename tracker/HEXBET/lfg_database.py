@@ -5,26 +5,37 @@ Handles all database operations for the LFG (Looking For Group) system.
 """
 
 import os
-import psycopg2
+import sys
 from psycopg2.extras import RealDictCursor
 import json
 import logging
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 
+# Shared helpers live in <repo>/apis (async facade for the database)
+apis_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'apis'))
+if apis_dir not in sys.path:
+    sys.path.insert(0, apis_dir)
+
+from async_db import AsyncDatabase
+from db_pool import get_shared_pool
+
 logger = logging.getLogger(__name__)
 
 DATABASE_URL = os.getenv('DATABASE_URL')
 
 def get_db_connection():
-    """Create and return a database connection."""
+    """Borrow a connection from the shared pool (give it back with release_db_connection)."""
     try:
-        conn = psycopg2.connect(DATABASE_URL)
-        return conn
+        return get_shared_pool(DATABASE_URL, name='tracker-shared').getconn()
     except Exception as e:
         logger.error(f"❌ Database connection failed: {e}")
         raise
 
+def release_db_connection(conn):
+    """Return a connection borrowed with get_db_connection."""
+    get_shared_pool(DATABASE_URL, name='tracker-shared').putconn(conn)
+
 def initialize_lfg_database():
     """Initialize LFG tables if they don't exist."""
     conn = get_db_connection()
@@ -60,7 +71,7 @@ def initialize_lfg_database():
         raise
     finally:
         cur.close()
-        conn.close()
+        release_db_connection(conn)
 
 
 # ================================
@@ -94,7 +105,7 @@ def get_lfg_profile(user_id: int) -> Optional[Dict[str, Any]]:
         return None
     finally:
         cur.close()
-        conn.close()
+        release_db_connection(conn)
 
 
 def create_lfg_profile(
@@ -136,7 +147,7 @@ def create_lfg_profile(
         return False
     finally:
         cur.close()
-        conn.close()
+        release_db_connection(conn)
 
 
 def update_lfg_profile(user_id: int, **kwargs) -> bool:
@@ -181,7 +192,7 @@ def update_lfg_profile(user_id: int, **kwargs) -> bool:
         return False
     finally:
         cur.close()
-        conn.close()
+        release_db_connection(conn)
 
 
 def update_saved_description(user_id: int, description: str) -> bool:
@@ -209,7 +220,7 @@ def update_saved_description(user_id: int, description: str) -> bool:
         return False
     finally:
         cur.close()
-        conn.close()
+        release_db_connection(conn)
 
 
 # ================================
@@ -265,7 +276,7 @@ def create_lfg_listing(
         return None
     finally:
         cur.close()
-        conn.close()
+        release_db_connection(conn)
 
 
 def get_active_listings(
@@ -314,7 +325,7 @@ def get_active_listings(
         return []
     finally:
         cur.close()
-        conn.close()
+        release_db_connection(conn)
 
 
 def get_user_active_listings(user_id: int) -> List[Dict[str, Any]]:
@@ -348,7 +359,7 @@ def get_user_active_listings(user_id: int) -> List[Dict[str, Any]]:
         return []
     finally:
         cur.close()
-        conn.close()
+        release_db_connection(conn)
 
 
 def update_listing_status(listing_id: int, status: str, message_id: Optional[int] = None) -> bool:
@@ -379,7 +390,26 @@ def update_listing_status(listing_id: int, status: str, message_id: Optional[int
         return False
     finally:
         cur.close()
-        conn.close()
+        release_db_connection(conn)
+
+
+def delete_lfg_profile(user_id: int) -> bool:
+    """Delete a user's LFG profile."""
+    conn = get_db_connection()
+    cur = conn.cursor()
+    
+    try:
+        cur.execute("DELETE FROM lfg_profiles WHERE user_id = %s", (user_id,))
+        conn.commit()
+        return True
+        
+    except Exception as e:
+        logger.error(f"❌ Failed to delete profile: {e}")
+        conn.rollback()
+        return False
+    finally:
+        cur.close()
+        release_db_connection(conn)
 
 
 def cleanup_expired_listings() -> int:
@@ -409,7 +439,7 @@ def cleanup_expired_listings() -> int:
         return 0
     finally:
         cur.close()
-        conn.close()
+        release_db_connection(conn)
 
 
 def get_all_lfg_profiles(limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
@@ -448,7 +478,7 @@ def get_all_lfg_profiles(limit: Optional[int] = None, offset: int = 0) -> List[D
         return []
     finally:
         cur.close()
-        conn.close()
+        release_db_connection(conn)
 
 
 def get_lfg_profiles_count() -> int:
@@ -466,4 +496,8 @@ def get_lfg_profiles_count() -> int:
         return 0
     finally:
         cur.close()
-        conn.close()
+        release_db_connection(conn)
+
+
+# Same functions as coroutines (`await aio.get_lfg_profile(user_id)`) for Discord handlers
+aio = AsyncDatabase(sys.modules[__name__], name='lfg')
@@ -119,26 +119,15 @@ async def check_and_verify_player(riot_id: str, db) -> Optional[str]:
     Check player on lolpros.gg and add to database if verified
     Args:
         riot_id: RiotID to check
-        db: TrackerDatabase instance
+        db: async TrackerDatabase facade (get_async_tracker_db)
     Returns:
         Badge emoji string or None
     """
     # First check database cache
-    cached = db.get_verified_player(riot_id)
+    cached = await db.get_verified_player(riot_id)
     if cached:
         # Update last_seen
-        try:
-            conn = db.get_connection()
-            with conn.cursor() as cur:
-                cur.execute("""
-                    UPDATE hexbet_verified_players 
-                    SET last_seen = NOW() 
-                    WHERE LOWER(riot_id) = LOWER(%s)
-                """, (riot_id,))
-                conn.commit()
-            db.return_connection(conn)
-        except:
-            pass
+        await db.update_player_last_seen(riot_id)
         
         # Return appropriate badge
         if cached['player_type'] == 'pro':
@@ -157,7 +146,7 @@ async def check_and_verify_player(riot_id: str, db) -> Optional[str]:
     
     if player_data and player_data['player_type']:
         # Add to database
-        db.add_verified_player(
+        await db.add_verified_player(
             riot_id=player_data['riot_id'],
             player_name=player_data['player_name'],
             player_type=player_data['player_type'],
@@ -175,6 +164,6 @@ async def check_and_verify_player(riot_id: str, db) -> Optional[str]:
     
     # Mark as checked (even if not found)
     if cached:
-        db.update_player_last_checked(riot_id)
+        await db.update_player_last_checked(riot_id)
     
     return None
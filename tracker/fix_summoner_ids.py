@@ -88,6 +88,7 @@ async def fix_summoner_ids():
         
     finally:
         db.return_connection(conn)
+        await riot_api.close()
 
 if __name__ == "__main__":
     asyncio.run(fix_summoner_ids())
@@ -16,7 +16,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from tracker_database import get_tracker_db
-from riot_api import RiotAPI
+from riot_api import RiotAPI, set_request_lane, set_request_caller, start_metrics_server, INTERACTIVE
 from tracker_commands_v3 import TrackerCommandsV3
 from HEXBET.hexbet_commands import setup as setup_hexbet
 from HEXBET.hexbet_config_commands import setup as setup_hexbet_config
@@ -75,12 +75,17 @@ class TrackerBot(commands.Bot):
         # Initialize Riot API
         self.riot_api = RiotAPI(RIOT_API_KEY)
         self.db = get_tracker_db()
+        self.riot_api.use_account_store(self.db)
+        self.riot_metrics_runner = await start_metrics_server(self.riot_api)
         
         # Tracker V3 disabled - bot is now used for HEXBET only
         # tracking_channel_id = 1440713433887805470
         # await self.add_cog(TrackerCommandsV3(self, self.riot_api, GUILD_ID, tracking_channel_id))
         # logger.info("✅ Tracker V3 commands loaded")
         
+        # Slash commands get the interactive Riot API lane (runs in the command's own task)
+        self.tree.interaction_check = self._interactive_lane_check
+        
         # Add config commands
         await config_commands.setup(self)
         logger.info("✅ ConfigCommands loaded")
@@ -108,6 +113,20 @@ class TrackerBot(commands.Bot):
         
         # Don't copy to guild - we want global sync for all servers
         logger.info("📋 Commands will be synced globally on_ready")
+
+    async def _interactive_lane_check(self, interaction: discord.Interaction) -> bool:
+        set_request_lane(INTERACTIVE)
+        set_request_caller(f"/{interaction.command.qualified_name}" if interaction.command else "interaction")
+        return True
+
+    async def close(self):
+        """Close pooled Riot API connections before shutting the bot down"""
+        if self.riot_api:
+            try:
+                await self.riot_api.close()
+            except Exception as e:
+                logger.warning(f"⚠️ Error closing Riot API sessions: {e}")
+        await super().close()
     
     @tasks.loop(minutes=5)
     async def change_status(self):
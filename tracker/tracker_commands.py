@@ -23,6 +23,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from tracker_database import get_tracker_db
 from permissions import has_admin_permissions
+from riot_api import get_ddragon
 
 logger = logging.getLogger('tracker_commands')
 
@@ -499,6 +500,15 @@ class TrackerCommands(commands.Cog):
         team_players = [p for p in participants if p.get('teamId') == team_id]
         total_mmr = 0
         player_details = []
+
+        # One batched by-PUUID lookup for the team (no summoner-v4 round trip per player)
+        try:
+            ranks_by_puuid = await self.riot_api.get_ranked_stats_many(
+                [(p.get('puuid'), region) for p in team_players if p.get('puuid')]
+            )
+        except Exception as e:
+            logger.debug(f"Could not fetch team ranks: {e}")
+            ranks_by_puuid = {}
         
         for player in team_players:
             puuid = player.get('puuid')
@@ -510,12 +520,8 @@ class TrackerCommands(commands.Cog):
             mmr = 1200  # Default MMR for unranked
             
             try:
-                # Get summoner by PUUID
-                summoner = await self.riot_api.get_summoner_by_puuid(puuid, region)
-                if summoner:
-                    summoner_id = summoner.get('id')
-                    ranked_data = await self.riot_api.get_ranked_stats(summoner_id, region)
-                    
+                ranked_data = ranks_by_puuid.get((puuid, region))
+                if ranked_data:
                     # Find Solo/Duo queue
                     for queue in ranked_data:
                         if queue.get('queueType') == 'RANKED_SOLO_5x5':
@@ -2459,34 +2465,12 @@ class TrackerCommands(commands.Cog):
         return msg
     
     async def _ensure_champion_data(self):
-        """Ensure Data Dragon version and champion mappings are loaded"""
-        if self.dd_version and self.champions_by_key:
-            return
-        # Fetch latest version
-        try:
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get("https://ddragon.leagueoflegends.com/api/versions.json") as resp:
-                    versions = await resp.json()
-                    self.dd_version = versions[0]
-                # Fetch champion data
-                champs_url = f"https://ddragon.leagueoflegends.com/cdn/{self.dd_version}/data/en_US/champion.json"
-                async with session.get(champs_url) as resp:
-                    data = await resp.json()
-                    mapping: Dict[int, Dict] = {}
-                    for champ_key, champ in data.get('data', {}).items():
-                        key_int = int(champ.get('key'))
-                        mapping[key_int] = {
-                            'id': champ.get('id'),   # e.g., Aatrox
-                            'name': champ.get('name')  # e.g., Aatrox
-                        }
-                    self.champions_by_key = mapping
-        except Exception as e:
-            logger.error(f"Failed to load Data Dragon champion data: {e}")
-            # Fallback minimal
-            self.dd_version = self.dd_version or "13.1.1"
-            if not self.champions_by_key:
-                self.champions_by_key = {}
+        """Ensure Data Dragon version and champion mappings are loaded (shared, disk cached)"""
+        ddragon = get_ddragon()
+        await ddragon.ensure_loaded()
+        # Re-read every time - the service switches to new patches in the background
+        self.dd_version = ddragon.version
+        self.champions_by_key = ddragon.champions
 
     async def _get_champion_name(self, champion_id: int) -> str:
         """Get champion name from numeric ID"""
@@ -2507,6 +2491,7 @@ class TrackerCommands(commands.Cog):
         """Build a 2x5 grid image of champion icons and return (discord.File, attachment_url)"""
         try:
             await self._ensure_champion_data()
+            ddragon = get_ddragon()
             size = 80
             padding = 4
             cols = 5
@@ -2514,35 +2499,37 @@ class TrackerCommands(commands.Cog):
             width = cols * size + (cols + 1) * padding
             height = rows * size + (rows + 1) * padding
             canvas = Image.new('RGBA', (width, height), (24, 24, 24, 255))
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                # helper to fetch and paste
-                async def fetch_icon(cid: Optional[int]):
-                    url = await self._get_champion_icon_url(cid or 0)
-                    if not url:
-                        return None
-                    try:
-                        async with session.get(url) as resp:
-                            if resp.status == 200:
-                                data = await resp.read()
-                                img = Image.open(BytesIO(data)).convert('RGBA')
-                                return img.resize((size, size), Image.LANCZOS)
-                    except Exception:
-                        return None
+
+            # helper to load (disk cache first) and resize
+            async def fetch_icon(cid: Optional[int]):
+                info = self.champions_by_key.get(int(cid)) if cid else None
+                if not info:
                     return None
-                # Blue row
-                for i, cid in enumerate(blue_ids[:5]):
-                    img = await fetch_icon(cid)
-                    x = padding + i * (size + padding)
-                    y = padding
-                    if img:
-                        canvas.paste(img, (x, y), img)
-                # Red row
-                for i, cid in enumerate(red_ids[:5]):
-                    img = await fetch_icon(cid)
-                    x = padding + i * (size + padding)
-                    y = padding * 2 + size
-                    if img:
-                        canvas.paste(img, (x, y), img)
+                try:
+                    data = await ddragon.get_file(f"img/champion/{info['id']}.png")
+                    if data:
+                        img = Image.open(BytesIO(data)).convert('RGBA')
+                        return img.resize((size, size), Image.LANCZOS)
+                except Exception:
+                    return None
+                return None
+
+            blue_icons, red_icons = await asyncio.gather(
+                asyncio.gather(*(fetch_icon(cid) for cid in blue_ids[:5])),
+                asyncio.gather(*(fetch_icon(cid) for cid in red_ids[:5])),
+            )
+            # Blue row
+            for i, img in enumerate(blue_icons):
+                x = padding + i * (size + padding)
+                y = padding
+                if img:
+                    canvas.paste(img, (x, y), img)
+            # Red row
+            for i, img in enumerate(red_icons):
+                x = padding + i * (size + padding)
+                y = padding * 2 + size
+                if img:
+                    canvas.paste(img, (x, y), img)
             bio = BytesIO()
             canvas.save(bio, format='PNG')
             bio.seek(0)
@@ -5,19 +5,42 @@ Separate database connection for tracker bot
 
 import psycopg2
 from psycopg2 import pool
+from psycopg2.extras import execute_values
 import os
+import sys
 import json
-from typing import Optional, List, Dict, Tuple
+import time
+from typing import Callable, Optional, List, Dict, Tuple
 from dotenv import load_dotenv
 import logging
 
+# Shared helpers live in <repo>/apis (async facade for the database)
+apis_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'apis'))
+if apis_dir not in sys.path:
+    sys.path.insert(0, apis_dir)
+
+from async_db import AsyncDatabase
+
 load_dotenv()
 
 logger = logging.getLogger('tracker_database')
 
+# First leaderboard page per sort is kept in memory until a balance changes (or this many seconds pass)
+LEADERBOARD_CACHE_TTL = 120
+
+# Keyset columns per HEXBET leaderboard sort - rank follows balance (200 tokens = 100 LP)
+LEADERBOARD_KEYS = {
+    'rank': ('balance', 'discord_id'),
+    'balance': ('balance', 'discord_id'),
+    'total_won': ('total_won', 'balance', 'discord_id'),
+}
+
 class TrackerDatabase:
     def __init__(self):
         self.connection_pool = None
+        self._leaderboard_cache: Dict[Tuple[str, int], Tuple[float, List[Dict]]] = {}
+        self._leaderboard_count: Optional[Tuple[float, int]] = None
+        self._leaderboard_version = 0
         self._initialize_pool()
     
     def _initialize_pool(self):
@@ -27,7 +50,8 @@ class TrackerDatabase:
             if not database_url:
                 raise ValueError("DATABASE_URL not found in environment variables")
             
-            self.connection_pool = psycopg2.pool.SimpleConnectionPool(
+            # Threaded pool: queries also run on the AsyncDatabase worker threads
+            self.connection_pool = psycopg2.pool.ThreadedConnectionPool(
                 1,  # minconn
                 10,  # maxconn
                 database_url
@@ -242,6 +266,49 @@ class TrackerDatabase:
                         recorded_at TIMESTAMP DEFAULT NOW()
                     );
                 """)
+                # Leaderboard ordering: keyset pages walk these indexes from the top
+                cur.execute("UPDATE user_balances SET balance = 0 WHERE balance IS NULL")
+                cur.execute("UPDATE user_balances SET total_won = 0 WHERE total_won IS NULL")
+                cur.execute("CREATE INDEX IF NOT EXISTS idx_user_balances_balance ON user_balances(balance DESC, discord_id DESC)")
+                cur.execute("CREATE INDEX IF NOT EXISTS idx_user_balances_total_won ON user_balances(total_won DESC, balance DESC, discord_id DESC)")
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS user_achievements (
+                        id SERIAL PRIMARY KEY,
+                        user_id BIGINT NOT NULL,
+                        achievement_id VARCHAR(50) NOT NULL,
+                        earned_at TIMESTAMP DEFAULT NOW(),
+                        UNIQUE(user_id, achievement_id)
+                    );
+                """)
+                # Running per-user bet totals for achievements, bumped by each settlement
+                # instead of re-aggregating hexbet_bets (refunded bets are not counted)
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS hexbet_bet_counters (
+                        user_id BIGINT PRIMARY KEY,
+                        total_bets INTEGER NOT NULL DEFAULT 0,
+                        wins INTEGER NOT NULL DEFAULT 0,
+                        total_wagered BIGINT NOT NULL DEFAULT 0,
+                        total_payout BIGINT NOT NULL DEFAULT 0,
+                        win_streak INTEGER NOT NULL DEFAULT 0,
+                        updated_at TIMESTAMP DEFAULT NOW()
+                    );
+                """)
+                # One-time backfill from bet history (only while the table is still empty)
+                cur.execute("""
+                    INSERT INTO hexbet_bet_counters (user_id, total_bets, wins, total_wagered, total_payout, win_streak)
+                    SELECT b.user_id,
+                           COUNT(*),
+                           COUNT(*) FILTER (WHERE b.won),
+                           COALESCE(SUM(b.amount), 0),
+                           COALESCE(SUM(b.payout) FILTER (WHERE b.won), 0),
+                           COALESCE(MAX(ub.current_streak), 0)
+                    FROM hexbet_bets b
+                    LEFT JOIN user_balances ub ON ub.discord_id = b.user_id
+                    WHERE b.settled AND b.won IS NOT NULL
+                      AND NOT EXISTS (SELECT 1 FROM hexbet_bet_counters)
+                    GROUP BY b.user_id
+                    ON CONFLICT (user_id) DO NOTHING
+                """)
                 cur.execute("""
                     CREATE TABLE IF NOT EXISTS hexbet_high_elo_pool (
                         puuid TEXT PRIMARY KEY,
@@ -253,6 +320,8 @@ class TrackerDatabase:
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                     );
                 """)
+                cur.execute("ALTER TABLE hexbet_high_elo_pool ADD COLUMN IF NOT EXISTS priority_boost FLOAT DEFAULT 1.0")
+                cur.execute("CREATE INDEX IF NOT EXISTS idx_high_elo_pool_region ON hexbet_high_elo_pool(region)")
                 cur.execute("""
                     CREATE TABLE IF NOT EXISTS hexbet_verified_players (
                         id SERIAL PRIMARY KEY,
@@ -411,6 +480,7 @@ class TrackerDatabase:
                 # create default balance
                 cur.execute("INSERT INTO user_balances (discord_id, balance) VALUES (%s, 1000) RETURNING balance", (discord_id,))
                 conn.commit()
+                self.invalidate_leaderboard()
                 return 1000
         finally:
             self.return_connection(conn)
@@ -426,10 +496,120 @@ class TrackerDatabase:
                 """, (discord_id, delta))
                 new_balance = cur.fetchone()[0]
                 conn.commit()
+                self.invalidate_leaderboard()
                 return new_balance
         finally:
             self.return_connection(conn)
 
+    def try_spend_balance(self, discord_id: int, amount: int) -> Optional[int]:
+        """Deduct amount only if the balance covers it, in one statement.
+
+        Returns the new balance, or None when the balance is too low (or the user has no row yet).
+        """
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    UPDATE user_balances SET balance = balance - %s
+                    WHERE discord_id = %s AND balance >= %s
+                    RETURNING balance
+                """, (amount, discord_id, amount))
+                row = cur.fetchone()
+                conn.commit()
+                if row is None:
+                    return None
+                self.invalidate_leaderboard()
+                return row[0]
+        finally:
+            self.return_connection(conn)
+
+    def invalidate_leaderboard(self):
+        """Drop cached leaderboard pages - called by every write to balances or bet stats"""
+        self._leaderboard_version += 1
+        self._leaderboard_cache = {}
+        self._leaderboard_count = None
+
+    @staticmethod
+    def leaderboard_key(row: Dict, sort_by: str = 'rank') -> Tuple:
+        """Keyset position of a leaderboard row for get_hexbet_leaderboard_page()"""
+        return tuple(row[col] for col in LEADERBOARD_KEYS.get(sort_by, LEADERBOARD_KEYS['rank']))
+
+    def get_hexbet_leaderboard_page(self, sort_by: str = 'rank', after: Optional[Tuple] = None,
+                                    before: Optional[Tuple] = None, start: Optional[Tuple] = None,
+                                    limit: int = 10) -> List[Dict]:
+        """One HEXBET leaderboard page, ranked and cut in SQL.
+
+        Paged by key instead of OFFSET: `after` = rows ranked below that key (next page),
+        `before` = rows ranked above it (previous page), `start` = that key and below
+        (refresh in place). No key = top of the board, served from cache.
+        """
+        columns = LEADERBOARD_KEYS.get(sort_by, LEADERBOARD_KEYS['rank'])
+        top_page = after is None and before is None and start is None
+        if top_page:
+            cached = self._leaderboard_cache.get((sort_by, limit))
+            if cached and time.monotonic() - cached[0] < LEADERBOARD_CACHE_TTL:
+                return cached[1]
+
+        key_sql = ', '.join(columns)
+        placeholders = ', '.join(['%s'] * len(columns))
+        where, params, direction = '', [], 'DESC'
+        if after is not None:
+            where, params = f"WHERE ({key_sql}) < ({placeholders})", list(after)
+        elif start is not None:
+            where, params = f"WHERE ({key_sql}) <= ({placeholders})", list(start)
+        elif before is not None:
+            where, params, direction = f"WHERE ({key_sql}) > ({placeholders})", list(before), 'ASC'
+        order_sql = ', '.join(f"{col} {direction}" for col in columns)
+
+        version = self._leaderboard_version
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(f"""
+                    SELECT discord_id, balance, total_won, bets_won, bets_placed,
+                           CASE WHEN bets_placed>0 THEN ROUND((bets_won::decimal/bets_placed)*100,2) ELSE 0 END as win_rate
+                    FROM user_balances
+                    {where}
+                    ORDER BY {order_sql}
+                    LIMIT %s
+                """, params + [limit])
+                rows = [
+                    {
+                        'discord_id': r[0],
+                        'balance': r[1] or 0,
+                        'total_won': r[2] or 0,
+                        'bets_won': r[3] or 0,
+                        'bets_placed': r[4] or 0,
+                        'win_rate': float(r[5] or 0),
+                    }
+                    for r in cur.fetchall()
+                ]
+        finally:
+            self.return_connection(conn)
+
+        if before is not None:
+            rows.reverse()
+        if top_page and version == self._leaderboard_version:
+            self._leaderboard_cache[(sort_by, limit)] = (time.monotonic(), rows)
+        return rows
+
+    def get_hexbet_leaderboard_count(self) -> int:
+        """Players on the HEXBET leaderboard (cached with the top page)"""
+        cached = self._leaderboard_count
+        if cached and time.monotonic() - cached[0] < LEADERBOARD_CACHE_TTL:
+            return cached[1]
+        version = self._leaderboard_version
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT COUNT(*) FROM user_balances")
+                count = cur.fetchone()[0]
+        finally:
+            self.return_connection(conn)
+        if version == self._leaderboard_version:
+            self._leaderboard_count = (time.monotonic(), count)
+        return count
+
     def record_wager(self, discord_id: int, amount: int):
         """Increment wager counters when a bet is placed."""
         conn = self.get_connection()
@@ -447,6 +627,7 @@ class TrackerDatabase:
                     (discord_id, amount)
                 )
                 conn.commit()
+                self.invalidate_leaderboard()
         finally:
             self.return_connection(conn)
 
@@ -469,6 +650,7 @@ class TrackerDatabase:
                     (payout if won else 0, amount if not won else 0, won, won, discord_id)
                 )
                 conn.commit()
+                self.invalidate_leaderboard()
         finally:
             self.return_connection(conn)
 
@@ -510,6 +692,7 @@ class TrackerDatabase:
                 """, (discord_id, amount, now))
                 new_balance = cur.fetchone()[0]
                 conn.commit()
+                self.invalidate_leaderboard()
                 return (True, f"✅ Daily reward claimed! +{amount} tokens (New balance: {new_balance})")
         finally:
             self.return_connection(conn)
@@ -811,11 +994,192 @@ class TrackerDatabase:
                     payouts.append((user_id, amount, payout, won))
                 # Mark settled with bonus multiplier
                 cur.execute("UPDATE hexbet_bets SET settled=TRUE, won=(side=%s), payout = CASE WHEN side=%s THEN ((amount * odds)::int * %s)::int ELSE 0 END, updated_at=NOW() WHERE match_id=%s", (winner, winner, bonus_multiplier, match_id))
+                self._apply_bet_counters(cur, payouts)
                 conn.commit()
                 return payouts
         finally:
             self.return_connection(conn)
     
+    def settle_and_pay_match(self, match_id: int, winner: str,
+                             evaluate_achievements: Optional[Callable] = None) -> Optional[Tuple[list, Dict[int, List[str]]]]:
+        """Settle an open match and pay it out in one transaction.
+
+        Marks the match settled, computes each bet's payout (odds, then the 1.5x
+        special-bet bonus), credits balances, updates win/loss stats and streaks and
+        bumps each bettor's hexbet_bet_counters. With evaluate_achievements
+        (counters, earned, won) -> [achievement_id] the unlocked achievements are
+        stored in the same transaction.
+        Returns ([(user_id, amount, payout, won)], {user_id: [new achievement ids]}),
+        or None when the match was no longer open (already settled or refunded by
+        another run) - nobody is paid twice.
+        """
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    UPDATE hexbet_matches SET status='settled', winner=%s, updated_at=NOW()
+                    WHERE id=%s AND status='open'
+                    RETURNING special_bet
+                """, (winner, match_id))
+                row = cur.fetchone()
+                if not row:
+                    conn.rollback()
+                    return None
+                bonus_multiplier = 1.5 if row[0] else 1.0
+
+                cur.execute("""
+                    WITH settled AS (
+                        UPDATE hexbet_bets
+                        SET settled = TRUE,
+                            won = (side = %(winner)s),
+                            payout = CASE WHEN side = %(winner)s
+                                THEN trunc(trunc(amount * odds) * %(bonus)s)::int ELSE 0 END,
+                            updated_at = NOW()
+                        WHERE match_id = %(match_id)s AND NOT settled
+                        RETURNING user_id, amount, payout, won
+                    ),
+                    credited AS (
+                        INSERT INTO user_balances (discord_id, balance, total_won, total_lost, bets_won, current_streak)
+                        SELECT user_id, payout,
+                               CASE WHEN won THEN payout ELSE 0 END,
+                               CASE WHEN won THEN 0 ELSE amount END,
+                               CASE WHEN won THEN 1 ELSE 0 END,
+                               CASE WHEN won THEN 1 ELSE 0 END
+                        FROM settled
+                        ON CONFLICT (discord_id) DO UPDATE SET
+                            balance = user_balances.balance + EXCLUDED.balance,
+                            total_won = user_balances.total_won + EXCLUDED.total_won,
+                            total_lost = user_balances.total_lost + EXCLUDED.total_lost,
+                            bets_won = user_balances.bets_won + EXCLUDED.bets_won,
+                            current_streak = CASE WHEN EXCLUDED.bets_won > 0
+                                THEN COALESCE(user_balances.current_streak, 0) + 1 ELSE 0 END,
+                            updated_at = NOW()
+                    )
+                    SELECT user_id, amount, payout, won FROM settled
+                """, {'winner': winner, 'bonus': bonus_multiplier, 'match_id': match_id})
+                payouts = [(r[0], r[1], r[2], bool(r[3])) for r in cur.fetchall()]
+                counters = self._apply_bet_counters(cur, payouts)
+                earned = {}
+                if evaluate_achievements and counters:
+                    earned = self._award_bet_achievements(cur, payouts, counters, evaluate_achievements)
+                conn.commit()
+                self.invalidate_leaderboard()
+                return payouts, earned
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.return_connection(conn)
+
+    def _apply_bet_counters(self, cur, payouts: list) -> Dict[int, Dict]:
+        """Add settled bets [(user_id, amount, payout, won)] to hexbet_bet_counters.
+
+        A user has at most one bet per match, so every row is a one-bet delta.
+        Runs on the caller's cursor (inside its transaction); returns
+        {user_id: counters after the update}.
+        """
+        if not payouts:
+            return {}
+        rows = [(user_id, amount, payout if won else 0, bool(won)) for user_id, amount, payout, won in payouts]
+        returned = execute_values(cur, """
+            INSERT INTO hexbet_bet_counters AS c (user_id, total_bets, wins, total_wagered, total_payout, win_streak)
+            SELECT user_id, 1, won::int, amount, payout, won::int
+            FROM (VALUES %s) AS d (user_id, amount, payout, won)
+            ON CONFLICT (user_id) DO UPDATE SET
+                total_bets = c.total_bets + 1,
+                wins = c.wins + EXCLUDED.wins,
+                total_wagered = c.total_wagered + EXCLUDED.total_wagered,
+                total_payout = c.total_payout + EXCLUDED.total_payout,
+                win_streak = CASE WHEN EXCLUDED.wins > 0 THEN c.win_streak + 1 ELSE 0 END,
+                updated_at = NOW()
+            RETURNING user_id, total_bets, wins, total_wagered, total_payout, win_streak
+        """, rows, template="(%s::bigint, %s::int, %s::int, %s::boolean)", page_size=len(rows), fetch=True)
+        cols = ('user_id', 'total_bets', 'wins', 'total_wagered', 'total_payout', 'win_streak')
+        return {row[0]: dict(zip(cols, row)) for row in returned}
+
+    def _award_bet_achievements(self, cur, payouts: list, counters: Dict[int, Dict],
+                                evaluate: Callable) -> Dict[int, List[str]]:
+        """Store the achievements unlocked by one settlement; returns {user_id: [new ids]}.
+
+        Runs under a savepoint so a failed award never rolls back the payout.
+        """
+        cur.execute("SAVEPOINT bet_achievements")
+        try:
+            cur.execute(
+                "SELECT user_id, achievement_id FROM user_achievements WHERE user_id = ANY(%s)",
+                (list(counters),)
+            )
+            earned: Dict[int, set] = {}
+            for user_id, achievement_id in cur.fetchall():
+                earned.setdefault(user_id, set()).add(achievement_id)
+            unlocked = []
+            for user_id, _amount, _payout, won in payouts:
+                user_counters = counters.get(user_id)
+                if user_counters:
+                    for achievement_id in evaluate(user_counters, earned.get(user_id, set()), won):
+                        unlocked.append((user_id, achievement_id))
+            awarded: Dict[int, List[str]] = {}
+            if unlocked:
+                returned = execute_values(cur, """
+                    INSERT INTO user_achievements (user_id, achievement_id) VALUES %s
+                    ON CONFLICT (user_id, achievement_id) DO NOTHING
+                    RETURNING user_id, achievement_id
+                """, unlocked, page_size=len(unlocked), fetch=True)
+                for user_id, achievement_id in returned:
+                    awarded.setdefault(user_id, []).append(achievement_id)
+            cur.execute("RELEASE SAVEPOINT bet_achievements")
+            return awarded
+        except Exception as e:
+            cur.execute("ROLLBACK TO SAVEPOINT bet_achievements")
+            logger.warning(f"⚠️ Failed to award achievements: {e}")
+            return {}
+
+    def get_bet_counters(self, user_id: int) -> Dict:
+        """Running bet totals for one user (zeros when they never had a bet settled)"""
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT total_bets, wins, total_wagered, total_payout, win_streak
+                    FROM hexbet_bet_counters WHERE user_id = %s
+                """, (user_id,))
+                row = cur.fetchone() or (0, 0, 0, 0, 0)
+                return {
+                    'user_id': user_id,
+                    'total_bets': row[0],
+                    'wins': row[1],
+                    'total_wagered': row[2],
+                    'total_payout': row[3],
+                    'win_streak': row[4],
+                }
+        finally:
+            self.return_connection(conn)
+
+    def get_user_achievements(self, user_id: int) -> List[Dict]:
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT achievement_id, earned_at FROM user_achievements WHERE user_id = %s", (user_id,))
+                return [{'achievement_id': r[0], 'earned_at': r[1]} for r in cur.fetchall()]
+        finally:
+            self.return_connection(conn)
+
+    def add_user_achievement(self, user_id: int, achievement_id: str) -> bool:
+        """Returns False when the user already had it"""
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    INSERT INTO user_achievements (user_id, achievement_id) VALUES (%s, %s)
+                    ON CONFLICT (user_id, achievement_id) DO NOTHING
+                    RETURNING id
+                """, (user_id, achievement_id))
+                row = cur.fetchone()
+                conn.commit()
+                return row is not None
+        finally:
+            self.return_connection(conn)
+
     def refund_match(self, match_id: int) -> list:
         """Refund all bets on a match (remake/afk detected). Returns list of (user_id, amount) refunded."""
         conn = self.get_connection()
@@ -835,6 +1199,7 @@ class TrackerDatabase:
                 # Mark bets as settled with refund (won=NULL, payout=amount)
                 cur.execute("UPDATE hexbet_bets SET settled=TRUE, payout=amount, updated_at=NOW() WHERE match_id=%s", (match_id,))
                 conn.commit()
+                self.invalidate_leaderboard()
                 return refunds
         finally:
             self.return_connection(conn)
@@ -1004,31 +1369,17 @@ class TrackerDatabase:
         conn = self.get_connection()
         try:
             with conn.cursor() as cur:
-                # Get all players with priority_boost column if it exists
+                # Weighted sampling without replacement done in SQL (Efraimidis-Spirakis):
+                # each row gets key -ln(U)/w and the `limit` smallest keys win, so only the
+                # sample leaves the database. Weights are floored at 0.01.
                 cur.execute("""
                     SELECT puuid, tier, lp, COALESCE(priority_boost, 1.0) as boost
                     FROM hexbet_high_elo_pool 
                     WHERE region = %s 
-                """, (region,))
-                
-                all_players = cur.fetchall()
-                
-                if not all_players:
-                    return []
-
-                # Weighted random selection WITHOUT replacement to avoid duplicate scans.
-                import random
-                target_count = min(limit, len(all_players))
-                remaining = list(all_players)
-                selected = []
-
-                while remaining and len(selected) < target_count:
-                    weights = [max(float(p[3] or 0), 0.01) for p in remaining]
-                    pick = random.choices(remaining, weights=weights, k=1)[0]
-                    selected.append(pick)
-                    remaining.remove(pick)
-
-                return selected
+                    ORDER BY -ln(1.0 - random()) / GREATEST(COALESCE(priority_boost, 1.0), 0.01)
+                    LIMIT %s
+                """, (region, limit))
+                return cur.fetchall()
         finally:
             self.return_connection(conn)
     
@@ -1375,6 +1726,53 @@ class TrackerDatabase:
         finally:
             self.return_connection(conn)
     
+    def update_player_last_seen(self, riot_id: str):
+        """Update last_seen timestamp for a player spotted in a game"""
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    UPDATE hexbet_verified_players
+                    SET last_seen = NOW()
+                    WHERE LOWER(riot_id) = LOWER(%s)
+                """, (riot_id,))
+                conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error updating last_seen: {e}")
+        finally:
+            self.return_connection(conn)
+
+    def get_verified_players_by_riot_ids(self, riot_ids: List[str]) -> Dict[str, Tuple[str, str]]:
+        """{riot_id: (player_name, player_type)} for the verified players among riot_ids (one query per lobby)"""
+        if not riot_ids:
+            return {}
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT riot_id, player_name, player_type FROM hexbet_verified_players WHERE riot_id = ANY(%s)",
+                    (list(riot_ids),)
+                )
+                return {row[0]: (row[1], row[2]) for row in cur.fetchall()}
+        finally:
+            self.return_connection(conn)
+
+    def get_verified_riot_id_by_name(self, player_name: str) -> Optional[str]:
+        """Riot ID of a verified player by display name (case-insensitive)"""
+        conn = self.get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT riot_id FROM hexbet_verified_players
+                    WHERE LOWER(player_name) = LOWER(%s)
+                    LIMIT 1
+                """, (player_name,))
+                row = cur.fetchone()
+                return row[0] if row else None
+        finally:
+            self.return_connection(conn)
+
     def get_all_verified_players(self, player_type: Optional[str] = None) -> List[Dict]:
         """Get all verified players, optionally filtered by type"""
         conn = self.get_connection()
@@ -1487,6 +1885,7 @@ class TrackerDatabase:
                     (discord_id, amount, now)
                 )
                 conn.commit()
+                self.invalidate_leaderboard()
                 return True, f"✅ Claimed {amount} tokens for daily free bet!"
         finally:
             self.return_connection(conn)
@@ -1573,3 +1972,13 @@ def get_tracker_db():
         _tracker_db = TrackerDatabase()
         _tracker_db.initialize_schema()
     return _tracker_db
+
+
+def get_async_tracker_db(db: Optional[TrackerDatabase] = None) -> AsyncDatabase:
+    """Async facade over a TrackerDatabase (the global one by default) - use from coroutines"""
+    db = db or get_tracker_db()
+    adb = getattr(db, '_async_db', None)
+    if adb is None:
+        adb = AsyncDatabase(db, name='tracker')
+        db._async_db = adb
+    return adb